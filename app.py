@@ -1,63 +1,419 @@
-from flask import Flask, jsonify, render_template, request
+import atexit
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import (
+    Blueprint,
+    Flask,
+    Response,
+    current_app,
+    render_template,
+    request,
+    stream_with_context,
+)
+from werkzeug.local import LocalProxy
 
 from controllers.add_supplier_controller import AddSupplierController
 from controllers.delete_supplier_controller import DeleteSupplierController
+from controllers.detail_controller import DetailController
 from controllers.edit_supplier_controller import EditSupplierController
+from controllers.export_controller import ExportController
+from controllers.report_controller import ReportController
 from controllers.supplier_controller import SupplierController
-from modules.observer import Observer
-from modules.repositories import Supplier_rep_DB, SupplierRepObservable
-
-
-class ViewObserver(Observer):
+from modules.aggregates import SpendAggregates
+from modules.article_index import ArticleSupplierIndex, CatalogPrices
+from modules.coalescing import EventCoalescer
+from modules.compression import (
+    StaticAssets,
+    choose_encoding,
+    compress,
+    compress_stream,
+    compressible,
+)
+from modules.conditional import (
+    content_etag,
+    encoded_etag,
+    new_boot_id,
+    not_modified,
+    strip_encodings,
+    validator_headers,
+    version_etag,
+)
+from modules.DBconnection import params as db_params
+from modules.DBconnection import statement_timeout
+from modules.dispatch import DROP_OLDEST, QueueDispatcher
+from modules.invalidation_bus import (
+    InvalidationPublisher,
+    MiniCacheInvalidator,
+    PgNotifyBus,
+)
+from modules.logging_observer import READ_EVENTS, LoggingObserver
+from modules.page_cache import DataVersion, PageCache
+from modules.prices import PriceCache
+from modules.purchase_views import rebuild_views
+from modules.repositories import (
+    Detail_rep_DB,
+    DetailRepObservable,
+    Purchase_rep_DB,
+    PurchaseRepObservable,
+    Supplier_rep_DB,
+    SupplierRepCached,
+    SupplierRepObservable,
+)
+from modules.rollups import PurchaseRollups
+from modules.serialization import dumps
+from modules.single_flight import SingleFlight
+from modules.sse import SSEBroker
+from modules.stale import StaleWhileRevalidate, degraded_reason, reset_degraded
+
+# Маршруты и обработчики приложения; само приложение создаёт create_app
+bp = Blueprint("main", __name__)
+
+# Контроллеры и сжатая статика текущего приложения (app.extensions)
+controllers = LocalProxy(lambda: current_app.extensions["controllers"])
+static_assets = LocalProxy(lambda: current_app.extensions["static_assets"])
+
+MUTATION_EVENTS = ("item_added", "item_updated", "item_deleted")
+PURCHASE_EVENTS = ("item_added", "items_added", "item_deleted")
+
+DEFAULT_CONFIG = {
+    # Создавать ресурсы (БД, потоки, шину) при первом запросе процесса;
+    # False — контроллеры заполняются вручную (тесты)
+    "INIT_RESOURCES": True,
+    # Параметры соединения с БД (None — modules.DBconnection.params)
+    "DATABASE": None,
+    # Ожидание чужого одинакового запроса к БД, секунды
+    "FLIGHT_TIMEOUT": 10.0,
+    # Лимиты времени запросов к БД по маршрутам, мс
+    "LIST_STATEMENT_TIMEOUT_MS": 2000,
+    "DETAIL_STATEMENT_TIMEOUT_MS": 1000,
+    # Устаревшие данные при медленной БД: сколько ждать свежие (с) и
+    # насколько старые записи ещё можно отдать (с)
+    "STALE_SOFT_TIMEOUT": 0.3,
+    "STALE_MAX_AGE": 300.0,
+    # Предел одновременных фоновых обновлений кэшей
+    "STALE_MAX_PENDING": 16,
+    # Предельный возраст страницы списка в кэше, секунды (страховка на
+    # случай потерянного сообщения шины инвалидации)
+    "PAGE_MAX_AGE": 60.0,
+    # Тела меньше порога не сжимаются, байты
+    "COMPRESS_MIN_SIZE": 1024,
+    # Файл состояния рядов закупок (None — пересборка при каждом старте).
+    # Загружается при старте и сохраняется при остановке процесса;
+    # закупки должны удаляться только через приложение
+    "ROLLUPS_STATE": None,
+}
+
+_init_lock = threading.Lock()
+
+# Ключ advisory-блокировки создания схемы: воркеры стартуют одновременно,
+# а параллельные CREATE ... IF NOT EXISTS могут столкнуться в каталоге
+SCHEMA_LOCK_ID = 0x5E7A11
+
+
+def json_response(payload, status: int = 200) -> Response:
+    """JSON-ответ через пакетный сериализатор (Decimal, date, модели)"""
+    return Response(dumps(payload), status=status, mimetype="application/json")
+
+
+def stream_response(mimetype: str, filename: str, chunks) -> Response:
+    """Потоковый ответ-вложение: куски отправляются по мере генерации"""
+    return Response(
+        stream_with_context(chunks),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+def not_modified_response(etag: str, last_modified: float | None = None):
+    """Ответ 304, если у клиента актуальная копия (иначе None)"""
+    if not_modified(
+        etag,
+        request.headers.get("If-None-Match"),
+        last_modified,
+        request.headers.get("If-Modified-Since"),
+    ):
+        return Response(status=304, headers=validator_headers(etag, last_modified))
+    return None
+
+
+@bp.before_app_request
+def ensure_resources():
+    """Ресурсы процесса создаются при первом запросе, если сервер не сделал этого"""
+    app = current_app._get_current_object()  # type: ignore
+    if app.config["INIT_RESOURCES"] and app.extensions["pid"] != os.getpid():
+        init_resources(app)
+
+
+@bp.before_app_request
+def reset_degraded_mark():
+    reset_degraded()
+
+
+@bp.before_app_request
+def normalize_if_none_match():
     """
-    Наблюдатель для View.
+    Клиент возвращает ETag сжатого представления ("abc-gzip"):
+    сравниваем его с ETag тела
     """
-
-    def update(self, event_type: str, data=None):
-        print(f"[Observer] Событие: {event_type} | Данные: {data}")
+    if_none_match = request.environ.get("HTTP_IF_NONE_MATCH")
+    if if_none_match:
+        request.environ["HTTP_IF_NONE_MATCH"] = strip_encodings(if_none_match)
 
 
-# Настройка Flask
-app = Flask(__name__, template_folder="views", static_folder="views/static")
-
-# Глобальные переменные для контроллеров
-controllers = {}
+@bp.after_app_request
+def compress_response(response: Response) -> Response:
+    """
+    Сжатие ответа по Accept-Encoding: JSON и выгрузки — на лету (тела от
+    COMPRESS_MIN_SIZE байт), статика — из заранее сжатых копий.
+    Регистрируется раньше остальных after_request, поэтому выполняется
+    последним и сжимает уже окончательный ответ.
+    """
+    if (
+        response.status_code != 200
+        or not compressible(response.mimetype)
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+    response.vary.add("Accept-Encoding")
+    encoding = choose_encoding(request.headers.get("Accept-Encoding"))
+    if encoding is None:
+        return response
+
+    if request.endpoint == "static":
+        body = static_assets.get(request.view_args["filename"], encoding)  # type: ignore
+        if body is None:
+            return response
+        response.direct_passthrough = False
+        response.set_data(body)
+    elif response.is_streamed:
+        # выгрузки: сжимаются по кускам, длина заранее неизвестна
+        response.response = compress_stream(response.response, encoding)
+        response.headers.pop("Content-Length", None)
+    else:
+        body = response.get_data()
+        if len(body) < current_app.config["COMPRESS_MIN_SIZE"]:
+            return response
+        response.set_data(compress(body, encoding))
+
+    response.headers["Content-Encoding"] = encoding
+    etag = response.headers.get("ETag")
+    if etag:
+        response.headers["ETag"] = encoded_etag(etag, encoding)
+    return response
+
+
+@bp.after_app_request
+def mark_degraded_response(response: Response) -> Response:
+    """Ответ из устаревших данных: заголовок X-Degraded, без валидаторов"""
+    reason = degraded_reason()
+    if reason is not None:
+        response.headers["X-Degraded"] = reason
+        response.headers["Cache-Control"] = "no-store"
+        response.headers.pop("ETag", None)
+        response.headers.pop("Last-Modified", None)
+    return response
+
+
+def create_schema(detail_repo: Detail_rep_DB, purchase_repo: Purchase_rep_DB):
+    """Таблицы и индексы деталей и закупок (если их ещё нет)"""
+    db = detail_repo.db
+    db._execute_query("SELECT pg_advisory_lock(%s);", (SCHEMA_LOCK_ID,))
+    try:
+        detail_repo.create_table()
+        purchase_repo.create_table()
+    finally:
+        db._execute_query("SELECT pg_advisory_unlock(%s);", (SCHEMA_LOCK_ID,))
 
 
-def initialize_app():
+def initialize_app(app: Flask):
     """Инициализация архитектуры MVC + Observer"""
     print("=" * 60)
-    print("Инициализация приложения (Flask)...")
+    print(f"Инициализация приложения (Flask, pid {os.getpid()})...")
+
+    config = app.config
+    controllers = app.extensions["controllers"]
+    app.extensions["static_assets"].load()
 
     # 1. Model (Repository + Observer)
     base_repository = Supplier_rep_DB()
-    observable_repo = SupplierRepObservable(base_repository)
-
-    view_observer = ViewObserver()
-    observable_repo.attach(view_observer)
+    # События поставщиков доставляются фоновым потоком: наблюдатели
+    # не добавляют задержку запросам; при переполнении теряются старые
+    event_dispatcher = QueueDispatcher(maxsize=10_000, policy=DROP_OLDEST)
+    atexit.register(event_dispatcher.close)
+    # Фоновые обновления кэшей: если БД не ответила за STALE_SOFT_TIMEOUT,
+    # клиент получает устаревшую запись, а запрос завершается в фоне
+    refresh_executor = ThreadPoolExecutor(4, thread_name_prefix="cache-refresh")
+    atexit.register(refresh_executor.shutdown, wait=False)
+    stale = StaleWhileRevalidate(
+        refresh_executor,
+        config["STALE_SOFT_TIMEOUT"],
+        config["STALE_MAX_AGE"],
+        config["STALE_MAX_PENDING"],
+    )
+    # get_by_id читается из LRU/TTL-кэша; записи сбрасываются при изменениях.
+    # Одновременные одинаковые промахи (кэшей поставщиков и страниц) идут
+    # в БД одним запросом; ожидающие ждут его не дольше FLIGHT_TIMEOUT
+    cached_repository = SupplierRepCached(
+        base_repository,
+        maxsize=4096,
+        ttl=60.0,
+        flight=SingleFlight(timeout=config["FLIGHT_TIMEOUT"]),
+        stale=stale,
+    )
+    observable_repo = SupplierRepObservable(cached_repository, event_dispatcher)
+    # Версия данных меняется синхронно при каждом изменении (до ответа),
+    # кэш страниц списка привязан к ней
+    data_version = DataVersion()
+    observable_repo.attach(
+        data_version, events=DataVersion.CHANGE_EVENTS, immediate=True
+    )
+    page_cache = PageCache(
+        data_version,
+        flight=SingleFlight(timeout=config["FLIGHT_TIMEOUT"]),
+        stale=stale,
+        max_age=config["PAGE_MAX_AGE"],
+    )
+    controllers["stale"] = stale
+    controllers["version"] = data_version
+
+    # Изменения сливаются по ID за окно 50 мс и уходят наблюдателям пакетом
+    coalescer = EventCoalescer(window=0.05)
+    observable_repo.attach(coalescer, events=MUTATION_EVENTS)
+    # Журнал событий: изменения — INFO, чтения — DEBUG с выборкой 10%.
+    # На чтения подписываемся, только если DEBUG включён: иначе
+    # данные этих событий даже не строятся
+    event_log = LoggingObserver(logging.getLogger("suppliers.events"), sample_rate=0.1)
+    coalescer.attach(event_log)
+    read_events = event_log.enabled_events(READ_EVENTS)
+    if read_events:
+        observable_repo.attach(event_log, events=read_events)
+
+    # Шина инвалидации: изменения уходят другим процессам через
+    # LISTEN/NOTIFY, чужие изменения сбрасывают локальные кэши
+    invalidation_bus = PgNotifyBus(db_params)
+    invalidation_bus.attach(MiniCacheInvalidator())
+    invalidation_bus.attach(cached_repository)
+    invalidation_bus.attach(data_version)
+    invalidation_bus.start()
+    atexit.register(invalidation_bus.close)
+    coalescer.attach(InvalidationPublisher(invalidation_bus))
+
+    # Живые обновления списка в браузере (SSE): свои изменения — из
+    # коалесцера, изменения других процессов — из шины инвалидации
+    sse_broker = SSEBroker()
+    coalescer.attach(sse_broker)
+    invalidation_bus.attach(sse_broker)
+    controllers["sse"] = sse_broker
 
     # 2. Controllers
-    controllers["main"] = SupplierController(observable_repo)
+    controllers["main"] = SupplierController(observable_repo, page_cache)
     controllers["add"] = AddSupplierController(observable_repo)
     controllers["edit"] = EditSupplierController(observable_repo)
     controllers["delete"] = DeleteSupplierController(observable_repo)
+    detail_db = Detail_rep_DB()
+    # Изменения каталога переносят цены в индекс поставщиков артикулов
+    detail_repo = DetailRepObservable(detail_db)
+
+    # Закупки: агрегаты затрат и индекс поставщиков артикулов
+    # обновляются при каждом добавлении/удалении закупки в процессе,
+    # а закупки других процессов дочитывают при чтении по отметке purchase_id
+    purchase_db = Purchase_rep_DB()
+    create_schema(detail_db, purchase_db)
+    purchase_repo = PurchaseRepObservable(purchase_db)
+    # Цены деталей общие для всех представлений; история закупок
+    # читается при старте один раз для всех трёх
+    prices = PriceCache(detail_repo)
+    spend_aggregates = SpendAggregates(detail_repo, prices)
+    article_index = ArticleSupplierIndex(detail_repo, prices)
+    # Ряды по корзинам затем обновляются пакетно по отметке purchase_id;
+    # сохранённые ряды только дочитывают закупки после отметки
+    rollups = PurchaseRollups(detail_repo, prices=prices)
+    views = [spend_aggregates, article_index]
+    state_path = config["ROLLUPS_STATE"]
+    if state_path and os.path.exists(state_path):
+        rollups.load(state_path)
+    else:
+        views.append(rollups)
+    rebuild_views(purchase_repo.repository, *views)
+    if state_path:
+        rollups.refresh(purchase_repo.repository)
+        atexit.register(rollups.save, state_path)
+    purchase_repo.attach(spend_aggregates, events=PURCHASE_EVENTS)
+    purchase_repo.attach(article_index, events=PURCHASE_EVENTS)
+    purchase_repo.attach(rollups, events=("item_deleted",))
+    detail_repo.attach(CatalogPrices(article_index))
+
+    controllers["details"] = DetailController(
+        detail_repo, article_index, cached_repository, purchase_repo.repository
+    )
+    controllers["export"] = ExportController(base_repository, purchase_repo)
+    controllers["reports"] = ReportController(
+        spend_aggregates, rollups, purchase_repo.repository, cached_repository
+    )
 
     print("[OK] Архитектура загружена")
     print("=" * 60)
 
 
+def init_resources(app: Flask):
+    """
+    Создать ресурсы приложения в текущем процессе (один раз на процесс).
+
+    Соединение с БД, фоновые потоки и шина инвалидации не переживают
+    fork, поэтому при многопроцессном сервере каждый воркер создаёт их
+    сам — после fork (см. gunicorn.conf.py).
+    """
+    with _init_lock:
+        if app.extensions["pid"] == os.getpid():
+            return
+        app.extensions["controllers"].clear()
+        # своя метка ETag списка: DataVersion у каждого воркера своя, а
+        # метка, созданная в мастере до fork, была бы у всех общей
+        app.extensions["boot_id"] = new_boot_id()
+        initialize_app(app)
+        app.extensions["pid"] = os.getpid()
+
+
+def create_app(config: dict | None = None) -> Flask:
+    """
+    Фабрика приложения.
+
+    Настройки: DEFAULT_CONFIG, затем переменные окружения FLASK_*
+    (например, FLASK_STALE_MAX_AGE=60), затем config.
+    Ресурсы (БД, потоки) здесь не создаются — см. init_resources.
+    """
+    app = Flask(__name__, template_folder="views", static_folder="views/static")
+    app.config.from_mapping(DEFAULT_CONFIG)
+    app.config.from_prefixed_env()
+    if config:
+        app.config.update(config)
+    if app.config["DATABASE"]:
+        db_params.update(app.config["DATABASE"])
+
+    app.extensions["controllers"] = {}
+    # Статика сжимается один раз (gzip и br, если установлен brotli)
+    app.extensions["static_assets"] = StaticAssets(app.static_folder)  # type: ignore
+    app.extensions["pid"] = None
+    app.extensions["boot_id"] = new_boot_id()
+    app.register_blueprint(bp)
+    return app
+
+
 # ==========================================
 # Маршруты (Routes) - Это View Layer
 # ==========================================
 
 
-@app.route("/")
+@bp.route("/")
 def index():
     """Главная страница"""
     return render_template("index.html")
 
 
-@app.route("/supplier_form")
+@bp.route("/supplier_form")
 def supplier_form():
     """Форма поставщика"""
     return render_template("supplier_form.html")
@@ -68,9 +424,17 @@ def supplier_form():
 # ==========================================
 
 
-@app.route("/api/suppliers", methods=["GET"])
+@bp.route("/api/suppliers", methods=["GET"])
 def get_suppliers_list():
     """Получить список поставщиков"""
+    # Валидаторы берутся до чтения данных: изменение во время запроса
+    # даст клиенту старый ETag, и следующий запрос получит новые данные
+    version = controllers["version"]
+    boot_id = current_app.extensions["boot_id"]
+    etag, last_modified = version_etag(boot_id, version.value), version.changed_at
+    cached = not_modified_response(etag, last_modified)
+    if cached is not None:
+        return cached
     try:
         # Получение параметров из query string
         page = request.args.get("page", 1, type=int)
@@ -79,47 +443,70 @@ def get_suppliers_list():
         filter_value = request.args.get("filter_value")
         sort_field = request.args.get("sort_field", "supplier_id")
 
-        result = controllers["main"].get_suppliers_page(
-            page=page,
-            page_size=page_size,
-            filter_field=filter_field,
-            filter_value=filter_value,
-            sort_field=sort_field,
-        )
-        return jsonify(result)
+        with statement_timeout(current_app.config["LIST_STATEMENT_TIMEOUT_MS"]):
+            result = controllers["main"].get_suppliers_page(
+                page=page,
+                page_size=page_size,
+                filter_field=filter_field,
+                filter_value=filter_value,
+                sort_field=sort_field,
+            )
+        response = json_response(result)
+        if result["success"]:
+            response.headers.update(validator_headers(etag, last_modified))
+        return response
     except ValueError as e:
-        return jsonify({"success": False, "error": str(e)}), 400
+        return json_response({"success": False, "error": str(e)}, 400)
+    except TimeoutError:
+        # одинаковый запрос к БД не завершился за FLIGHT_TIMEOUT
+        return json_response({"success": False, "error": "Database timeout"}, 503)
     except Exception as e:
-        return jsonify({"success": False, "error": f"Internal Error: {str(e)}"}), 500
+        return json_response(
+            {"success": False, "error": f"Internal Error: {str(e)}"}, 500
+        )
 
 
-@app.route("/api/suppliers/<int:supplier_id>", methods=["GET"])
+@bp.route("/api/suppliers/<int:supplier_id>", methods=["GET"])
 def get_supplier_details(supplier_id):
     """Получить одного поставщика"""
     try:
-        result = controllers["main"].get_supplier_details(supplier_id)
-        return jsonify(result)
+        with statement_timeout(current_app.config["DETAIL_STATEMENT_TIMEOUT_MS"]):
+            result = controllers["main"].get_supplier_details(supplier_id)
+        if not result["success"]:
+            return json_response(result)
+        # ETag — хэш самой записи: не зависит от изменений других строк
+        body = dumps(result)
+        etag = content_etag(body)
+        cached = not_modified_response(etag)
+        if cached is not None:
+            return cached
+        return Response(
+            body, mimetype="application/json", headers=validator_headers(etag)
+        )
+    except TimeoutError:
+        # одинаковый запрос к БД не завершился за FLIGHT_TIMEOUT
+        return json_response({"success": False, "error": "Database timeout"}, 503)
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+        return json_response({"success": False, "error": str(e)}, 500)
 
 
-@app.route("/api/suppliers/add", methods=["POST"])
+@bp.route("/api/suppliers/add", methods=["POST"])
 def add_supplier():
     """Добавление поставщика"""
     try:
         data = request.json  # Автоматический парсинг JSON
         if not data:
-            return jsonify({"success": False, "error": "No JSON data"}), 400
+            return json_response({"success": False, "error": "No JSON data"}, 400)
 
         result = controllers["add"].validate_and_add_supplier(
             data.get("name", ""), data.get("phone", ""), data.get("address")
         )
-        return jsonify(result)
+        return json_response(result)
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+        return json_response({"success": False, "error": str(e)}, 500)
 
 
-@app.route(
+@bp.route(
     "/api/suppliers/edit", methods=["PUT"]
 )  # Можно также использовать POST или PATCH
 def edit_supplier():
@@ -127,11 +514,13 @@ def edit_supplier():
     try:
         data = request.json
         if not data:
-            return jsonify({"success": False, "error": "No JSON data"}), 400
+            return json_response({"success": False, "error": "No JSON data"}, 400)
 
         supplier_id = data.get("supplier_id")
         if not supplier_id:
-            return jsonify({"success": False, "error": "Missing supplier_id"}), 400
+            return json_response(
+                {"success": False, "error": "Missing supplier_id"}, 400
+            )
 
         result = controllers["edit"].validate_and_update_supplier(
             supplier_id,
@@ -139,24 +528,175 @@ def edit_supplier():
             data.get("phone", ""),
             data.get("address"),
         )
-        return jsonify(result)
+        return json_response(result)
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+        return json_response({"success": False, "error": str(e)}, 500)
 
 
-@app.route("/api/suppliers/<int:supplier_id>", methods=["DELETE"])
+@bp.route("/api/suppliers/<int:supplier_id>", methods=["DELETE"])
 def delete_supplier(supplier_id):
     """Удаление поставщика"""
     try:
         result = controllers["delete"].validate_and_delete_supplier(supplier_id)
-        return jsonify(result)
+        return json_response(result)
+    except Exception as e:
+        return json_response({"success": False, "error": str(e)}, 500)
+
+
+@bp.route("/api/details", methods=["GET"])
+def get_details_list():
+    """Получить страницу каталога деталей или детали по списку артикулов"""
+    try:
+        articles = request.args.get("articles")
+        if articles:
+            result = controllers["details"].get_details(
+                [a.strip() for a in articles.split(",") if a.strip()]
+            )
+            return json_response(result)
+
+        result = controllers["details"].get_details_page(
+            page=request.args.get("page", 1, type=int),
+            page_size=request.args.get("page_size", 10, type=int),
+            sort_field=request.args.get("sort_field", "article"),
+        )
+        return json_response(result)
+    except ValueError as e:
+        return json_response({"success": False, "error": str(e)}, 400)
+    except Exception as e:
+        return json_response({"success": False, "error": str(e)}, 500)
+
+
+@bp.route("/api/details/<article>", methods=["GET"])
+def get_detail(article):
+    """Получить деталь по артикулу"""
+    try:
+        result = controllers["details"].get_detail(article)
+        return json_response(result, 200 if result["success"] else 404)
+    except Exception as e:
+        return json_response({"success": False, "error": str(e)}, 500)
+
+
+@bp.route("/api/details/<article>/suppliers", methods=["GET"])
+def get_article_suppliers(article):
+    """Поставщики артикула, начиная с самого выгодного"""
+    try:
+        result = controllers["details"].get_article_suppliers(
+            article, limit=request.args.get("limit", type=int)
+        )
+        return json_response(result)
+    except ValueError as e:
+        return json_response({"success": False, "error": str(e)}, 400)
+    except Exception as e:
+        return json_response({"success": False, "error": str(e)}, 500)
+
+
+@bp.route("/api/reports/spend", methods=["GET"])
+def get_monthly_spend():
+    """Затраты по месяцам в разрезе поставщиков или артикулов"""
+    try:
+        result = controllers["reports"].get_monthly_spend(
+            by=request.args.get("by", "supplier"),
+            key=request.args.get("key"),
+            month_from=request.args.get("month_from"),
+            month_to=request.args.get("month_to"),
+        )
+        status = 200 if result["success"] else 400
+        return json_response(result, status)
+    except Exception as e:
+        return json_response({"success": False, "error": str(e)}, 500)
+
+
+@bp.route("/api/reports/series/<int:supplier_id>", methods=["GET"])
+def get_purchase_series(supplier_id):
+    """Ряд закупок поставщика по дням, неделям или месяцам"""
+    try:
+        result = controllers["reports"].get_series(
+            supplier_id,
+            granularity=request.args.get("granularity", "month"),
+            date_from=request.args.get("date_from"),
+            date_to=request.args.get("date_to"),
+            include_recent=request.args.get("include_recent") == "1",
+        )
+        status = 200 if result["success"] else 400
+        return json_response(result, status)
+    except Exception as e:
+        return json_response({"success": False, "error": str(e)}, 500)
+
+
+@bp.route("/api/metrics/events", methods=["GET"])
+def get_event_metrics():
+    """Метрики очереди событий поставщиков (глубина, потери, ошибки)"""
+    dispatcher = controllers["main"].repository.dispatcher
+    metrics = getattr(dispatcher, "snapshot", dict)()
+    return json_response({"success": True, "metrics": metrics})
+
+
+@bp.route("/api/metrics/cache", methods=["GET"])
+def get_cache_metrics():
+    """Метрики кэша поставщиков (попадания, промахи, вытеснения)"""
+    metrics = {
+        "suppliers": controllers["main"].repository.repository.stats(),
+        "pages": controllers["main"].page_cache.stats(),
+        "stale": controllers["stale"].stats(),
+    }
+    return json_response({"success": True, "metrics": metrics})
+
+
+@bp.route("/api/suppliers/top", methods=["GET"])
+def get_top_suppliers():
+    """Топ поставщиков по затратам за период (?n=20&date_from&date_to)"""
+    try:
+        result = controllers["reports"].get_top_suppliers(
+            n=request.args.get("n", 20, type=int),
+            date_from=request.args.get("date_from"),
+            date_to=request.args.get("date_to"),
+        )
+        status = 200 if result["success"] else 400
+        return json_response(result, status)
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+        return json_response({"success": False, "error": str(e)}, 500)
+
+
+@bp.route("/api/suppliers/stream", methods=["GET"])
+def stream_supplier_events():
+    """Поток изменений поставщиков (Server-Sent Events)"""
+    return Response(
+        stream_with_context(controllers["sse"].stream()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@bp.route("/api/suppliers/export", methods=["GET"])
+def export_suppliers():
+    """Выгрузка поставщиков потоком (?format=csv|ndjson)"""
+    try:
+        return stream_response(
+            *controllers["export"].export_suppliers(request.args.get("format", "csv"))
+        )
+    except ValueError as e:
+        return json_response({"success": False, "error": str(e)}, 400)
+
+
+@bp.route("/api/purchases/export", methods=["GET"])
+def export_purchases():
+    """Выгрузка закупок потоком (?format=csv|ndjson)"""
+    try:
+        return stream_response(
+            *controllers["export"].export_purchases(request.args.get("format", "csv"))
+        )
+    except ValueError as e:
+        return json_response({"success": False, "error": str(e)}, 400)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="[%(levelname)s] %(name)s: %(message)s"
+    )
+    app = create_app()
     # Инициализация перед запуском
-    initialize_app()
+    init_resources(app)
     print(">>> Сервер запущен на http://localhost:8000")
-    # debug=True позволяет серверу перезагружаться при изменении кода
-    app.run(host="localhost", port=8000, debug=True)
+    # Сервер разработки (один процесс, без перезагрузчика: он запускал
+    # приложение дважды). Production — gunicorn, см. wsgi.py
+    app.run(host="localhost", port=8000, debug=app.debug, use_reloader=False)
@@ -0,0 +1,11 @@
+"""
+ASGI-точка входа асинхронного API поставщиков
+
+    uvicorn asgi:app --workers 4
+
+Каждый воркер — один цикл событий со своим пулом соединений asyncpg.
+"""
+
+from async_app import create_async_app
+
+app = create_async_app()
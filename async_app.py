@@ -0,0 +1,332 @@
+"""
+Асинхронный (ASGI) вариант API поставщиков
+
+Запросы обслуживаются циклом событий: ожидание БД (asyncpg) или файла
+не занимает поток ОС, поэтому процесс держит тысячи одновременных
+подключений на нескольких потоках. Маршруты и ответы — как у
+/api/suppliers в app.py.
+
+    uvicorn asgi:app --workers 4
+"""
+
+import json
+import os
+import re
+from urllib.parse import parse_qs
+
+from controllers.async_supplier_controller import AsyncSupplierController
+from modules.compression import choose_encoding, compress
+from modules.conditional import (
+    content_etag,
+    encoded_etag,
+    not_modified,
+    strip_encodings,
+    validator_headers,
+)
+from modules.DBconnection import params as db_params
+from modules.DBconnection import statement_timeout
+from modules.invalidation_bus import InvalidationBus, PgNotifyBus
+from modules.repositories.supplier_rep_async import (
+    AsyncSupplierRepository,
+    SupplierRepAsyncDB,
+)
+from modules.serialization import dumps
+
+ASYNC_DEFAULT_CONFIG = {
+    # Параметры соединения с БД (None — modules.DBconnection.params)
+    "DATABASE": None,
+    # Размер пула соединений asyncpg на процесс
+    "POOL_MIN_SIZE": 2,
+    "POOL_MAX_SIZE": 20,
+    # Лимиты времени запросов к БД по маршрутам, мс
+    "LIST_STATEMENT_TIMEOUT_MS": 2000,
+    "DETAIL_STATEMENT_TIMEOUT_MS": 1000,
+    # Тела меньше порога не сжимаются, байты
+    "COMPRESS_MIN_SIZE": 1024,
+    # Наибольший размер тела запроса, байты (больше — 413)
+    "MAX_BODY_SIZE": 64 * 1024,
+}
+
+SUPPLIER_PATH = re.compile(r"^/api/suppliers/(\d+)$")
+
+
+class Request:
+    """Разобранный ASGI-запрос: метод, путь, query string, заголовки, тело"""
+
+    def __init__(self, scope: dict, body: bytes):
+        self.method = scope["method"]
+        self.path = scope["path"]
+        self.args = {
+            key: values[-1]
+            for key, values in parse_qs(scope.get("query_string", b"").decode()).items()
+        }
+        self.headers = {
+            name.decode("latin-1").lower(): value.decode("latin-1")
+            for name, value in scope.get("headers", [])
+        }
+        self.body = body
+
+    def int_arg(self, name: str, default: int) -> int:
+        """Целый параметр query string (некорректное значение — default)"""
+        try:
+            return int(self.args[name])
+        except (KeyError, ValueError):
+            return default
+
+    def json(self) -> dict | None:
+        try:
+            return json.loads(self.body) if self.body else None
+        except ValueError:
+            return None
+
+
+class Response:
+    """Ответ ASGI-приложения"""
+
+    def __init__(
+        self,
+        body: bytes = b"",
+        status: int = 200,
+        headers: dict | None = None,
+        mimetype: str = "application/json",
+    ):
+        self.body = body
+        self.status = status
+        self.headers = {"Content-Type": mimetype, **(headers or {})}
+
+    async def send(self, send):
+        headers = {**self.headers, "Content-Length": str(len(self.body))}
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status,
+                "headers": [
+                    (name.lower().encode("latin-1"), value.encode("latin-1"))
+                    for name, value in headers.items()
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": self.body})
+
+
+def json_response(payload, status: int = 200, headers: dict | None = None):
+    """JSON-ответ через пакетный сериализатор (как в app.py)"""
+    return Response(dumps(payload), status=status, headers=headers)
+
+
+def env_config(prefix: str = "ASYNC_") -> dict:
+    """Настройки из переменных окружения ASYNC_* (значения — JSON или строки)"""
+    config = {}
+    for name, value in os.environ.items():
+        if not name.startswith(prefix):
+            continue
+        try:
+            config[name.removeprefix(prefix)] = json.loads(value)
+        except ValueError:
+            config[name.removeprefix(prefix)] = value
+    return config
+
+
+class AsyncSupplierApp:
+    """
+    ASGI-приложение: маршруты API поставщиков, условные запросы (ETag),
+    сжатие ответов, закрытие пула соединений при остановке (lifespan).
+    Изменения публикуются в шину инвалидации (если задана), чтобы
+    синхронные процессы сбросили кэши.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncSupplierRepository,
+        config: dict,
+        bus: InvalidationBus | None = None,
+    ):
+        self.repository = repository
+        self.config = config
+        self.bus = bus
+        self.controller = AsyncSupplierController(repository, bus)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        body = await self._read_body(scope, receive)
+        if body is None:
+            response = json_response(
+                {"success": False, "error": "Request Entity Too Large"}, 413
+            )
+            await response.send(send)
+            return
+
+        request = Request(scope, body)
+        try:
+            response = await self.dispatch(request)
+        except TimeoutError:
+            # лимит времени запроса к БД (asyncio.TimeoutError — тот же класс)
+            response = json_response(
+                {"success": False, "error": "Database timeout"}, 503
+            )
+        except Exception as e:
+            response = json_response({"success": False, "error": str(e)}, 500)
+        await self._compress(request, response).send(send)
+
+    async def _read_body(self, scope, receive) -> bytes | None:
+        """Тело запроса; None — больше MAX_BODY_SIZE (чтение прерывается)"""
+        limit = self.config["MAX_BODY_SIZE"]
+        for name, value in scope.get("headers", []):
+            if name.lower() == b"content-length":
+                try:
+                    if int(value) > limit:
+                        return None
+                except ValueError:
+                    pass
+        chunks = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > limit:
+                return None
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+        return b"".join(chunks)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.repository.close()
+                if self.bus is not None:
+                    self.bus.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def dispatch(self, request: Request) -> Response:
+        """Маршрутизация запроса к обработчику"""
+        path, method = request.path, request.method
+        if path == "/api/suppliers":
+            if method == "GET":
+                return await self.get_suppliers_list(request)
+        elif path == "/api/suppliers/add":
+            if method == "POST":
+                return await self.add_supplier(request)
+        elif path == "/api/suppliers/edit":
+            if method == "PUT":
+                return await self.edit_supplier(request)
+        elif match := SUPPLIER_PATH.match(path):
+            supplier_id = int(match.group(1))
+            if method == "GET":
+                return await self.get_supplier_details(request, supplier_id)
+            if method == "DELETE":
+                return await self.delete_supplier(supplier_id)
+        else:
+            return json_response({"success": False, "error": "Not Found"}, 404)
+        return json_response({"success": False, "error": "Method Not Allowed"}, 405)
+
+    def _compress(self, request: Request, response: Response) -> Response:
+        """Сжатие JSON-ответа по Accept-Encoding (как compress_response)"""
+        if response.status != 200:
+            return response
+        response.headers["Vary"] = "Accept-Encoding"
+        encoding = choose_encoding(request.headers.get("accept-encoding"))
+        if encoding is None or len(response.body) < self.config["COMPRESS_MIN_SIZE"]:
+            return response
+        response.body = compress(response.body, encoding)
+        response.headers["Content-Encoding"] = encoding
+        if "ETag" in response.headers:
+            response.headers["ETag"] = encoded_etag(response.headers["ETag"], encoding)
+        return response
+
+    async def get_suppliers_list(self, request: Request) -> Response:
+        """Получить список поставщиков"""
+        with statement_timeout(self.config["LIST_STATEMENT_TIMEOUT_MS"]):
+            result = await self.controller.get_suppliers_page(
+                page=request.int_arg("page", 1),
+                page_size=request.int_arg("page_size", 10),
+                filter_field=request.args.get("filter_field"),
+                filter_value=request.args.get("filter_value"),
+                sort_field=request.args.get("sort_field", "supplier_id"),
+            )
+        return json_response(result)
+
+    async def get_supplier_details(
+        self, request: Request, supplier_id: int
+    ) -> Response:
+        """Получить одного поставщика (ETag — хэш записи)"""
+        with statement_timeout(self.config["DETAIL_STATEMENT_TIMEOUT_MS"]):
+            result = await self.controller.get_supplier_details(supplier_id)
+        if not result["success"]:
+            return json_response(result)
+        body = dumps(result)
+        etag = content_etag(body)
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and not_modified(etag, strip_encodings(if_none_match)):
+            return Response(status=304, headers=validator_headers(etag))
+        return Response(body, headers=validator_headers(etag))
+
+    async def add_supplier(self, request: Request) -> Response:
+        """Добавление поставщика"""
+        data = request.json()
+        if not data:
+            return json_response({"success": False, "error": "No JSON data"}, 400)
+        result = await self.controller.validate_and_add_supplier(
+            data.get("name", ""), data.get("phone", ""), data.get("address")
+        )
+        return json_response(result)
+
+    async def edit_supplier(self, request: Request) -> Response:
+        """Редактирование поставщика"""
+        data = request.json()
+        if not data:
+            return json_response({"success": False, "error": "No JSON data"}, 400)
+        supplier_id = data.get("supplier_id")
+        if not supplier_id:
+            return json_response(
+                {"success": False, "error": "Missing supplier_id"}, 400
+            )
+        result = await self.controller.validate_and_update_supplier(
+            supplier_id,
+            data.get("name", ""),
+            data.get("phone", ""),
+            data.get("address"),
+        )
+        return json_response(result)
+
+    async def delete_supplier(self, supplier_id: int) -> Response:
+        """Удаление поставщика"""
+        result = await self.controller.validate_and_delete_supplier(supplier_id)
+        return json_response(result)
+
+
+def create_async_app(
+    repository: AsyncSupplierRepository | None = None, config: dict | None = None
+) -> AsyncSupplierApp:
+    """
+    Фабрика ASGI-приложения.
+
+    Настройки: ASYNC_DEFAULT_CONFIG, затем переменные окружения ASYNC_*
+    (например, ASYNC_POOL_MAX_SIZE=50), затем config.
+    Без repository используется PostgreSQL (SupplierRepAsyncDB); пул
+    соединений создаётся при первом запросе в цикле событий воркера.
+    Изменения публикуются через LISTEN/NOTIFY (PgNotifyBus) — как в app.py.
+    """
+    settings = {**ASYNC_DEFAULT_CONFIG, **env_config(), **(config or {})}
+    bus = None
+    if repository is None:
+        if settings["DATABASE"]:
+            db_params.update(settings["DATABASE"])
+        repository = SupplierRepAsyncDB(
+            db_params,
+            min_size=settings["POOL_MIN_SIZE"],
+            max_size=settings["POOL_MAX_SIZE"],
+        )
+        # Процесс только публикует: слушатель не запускается
+        bus = PgNotifyBus(db_params)
+    return AsyncSupplierApp(repository, settings, bus)
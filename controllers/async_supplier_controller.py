@@ -0,0 +1,218 @@
+"""
+Асинхронный контроллер поставщиков для ASGI-приложения
+Та же бизнес-логика и те же ответы, что у синхронных контроллеров,
+но ожидание репозитория не занимает поток
+"""
+
+import asyncio
+import logging
+
+from controllers.supplier_form import build_supplier
+from modules.invalidation_bus import InvalidationBus
+from modules.repositories.supplier_rep_async import AsyncSupplierRepository
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSupplierController:
+    """
+    Контроллер списка, карточки, добавления, редактирования и удаления
+    поставщиков поверх асинхронного репозитория
+    """
+
+    def __init__(
+        self, repository: AsyncSupplierRepository, bus: InvalidationBus | None = None
+    ):
+        """
+        Args:
+            repository: асинхронный репозиторий поставщиков
+            bus: шина инвалидации для публикации изменений (опционально)
+        """
+        self.repository = repository
+        self.bus = bus
+
+    async def get_suppliers_page(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        filter_field: str | None = None,
+        filter_value: str | None = None,
+        sort_field: str = "supplier_id",
+    ) -> dict:
+        """
+        Страница списка поставщиков (краткая информация).
+        Элементы и количество запрашиваются одновременно.
+
+        Returns:
+            Словарь с данными: items, total_count, page, page_size, total_pages
+        """
+        try:
+            suppliers_mini, total_count = await asyncio.gather(
+                self.repository.get_page(
+                    page, page_size, filter_field, filter_value, sort_field
+                ),
+                self.repository.get_count(filter_field, filter_value),
+            )
+        except TimeoutError:
+            # БД не ответила за лимит времени — код ответа выбирает маршрут
+            raise
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+        if total_count > 0:
+            total_pages = (total_count + page_size - 1) // page_size
+        else:
+            total_pages = 1
+
+        return {
+            "success": True,
+            "items": suppliers_mini,
+            "total_count": total_count,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": total_pages,
+        }
+
+    async def get_supplier_details(self, supplier_id: int) -> dict:
+        """Полная информация о поставщике по ID"""
+        try:
+            supplier = await self.repository.get_by_id(supplier_id)
+            if supplier is None:
+                return {
+                    "success": False,
+                    "error": f"Поставщик с ID {supplier_id} не найден",
+                }
+            return {
+                "success": True,
+                "supplier": {
+                    "supplier_id": supplier.supplier_id,
+                    "name": supplier.name,
+                    "phone": supplier.phone,
+                    "address": supplier.address,
+                },
+            }
+        except TimeoutError:
+            raise
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    async def _publish(self, event_type: str, supplier_id: int):
+        """
+        Сообщить об изменении другим процессам (кэши, версия списка, SSE
+        синхронного приложения). Запись уже выполнена: ошибка шины
+        только логируется.
+        """
+        if self.bus is None:
+            return
+        try:
+            await asyncio.to_thread(
+                self.bus.publish, "supplier", [(event_type, supplier_id)]
+            )
+        except Exception:
+            logger.exception("Не удалось опубликовать изменение поставщика")
+
+    async def validate_and_add_supplier(
+        self, name: str, phone: str, address: str | None = None
+    ) -> dict:
+        """Валидация и добавление нового поставщика"""
+        supplier, validation_errors = build_supplier(name, phone, address)
+        if supplier is None:
+            return {
+                "success": False,
+                "error": "Ошибка валидации данных",
+                "validation_errors": validation_errors,
+            }
+
+        try:
+            await self.repository.add(supplier)
+            await self._publish("item_added", supplier.supplier_id)
+            return {
+                "success": True,
+                "message": "Поставщик успешно добавлен",
+                "supplier_id": supplier.supplier_id,
+            }
+        except ValueError as e:
+            # Ошибка уникальности
+            return {
+                "success": False,
+                "error": str(e),
+                "validation_errors": {"general": str(e)},
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Ошибка при добавлении поставщика: {str(e)}",
+                "validation_errors": {"general": str(e)},
+            }
+
+    async def validate_and_update_supplier(
+        self, supplier_id: int, name: str, phone: str, address: str | None = None
+    ) -> dict:
+        """Валидация и обновление данных поставщика"""
+        if await self.repository.get_by_id(supplier_id) is None:
+            return {
+                "success": False,
+                "error": f"Поставщик с ID {supplier_id} не найден",
+                "validation_errors": {"general": "Поставщик не существует"},
+            }
+
+        supplier, validation_errors = build_supplier(name, phone, address)
+        if supplier is None:
+            return {
+                "success": False,
+                "error": "Ошибка валидации данных",
+                "validation_errors": validation_errors,
+            }
+        supplier.supplier_id = supplier_id
+
+        try:
+            await self.repository.replace_by_id(supplier_id, supplier)
+            await self._publish("item_updated", supplier_id)
+            return {
+                "success": True,
+                "message": "Поставщик успешно обновлен",
+                "supplier_id": supplier_id,
+            }
+        except ValueError as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "validation_errors": {"general": str(e)},
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Ошибка при обновлении поставщика: {str(e)}",
+                "validation_errors": {"general": str(e)},
+            }
+
+    async def validate_and_delete_supplier(self, supplier_id: int) -> dict:
+        """Валидация и удаление поставщика"""
+        if not isinstance(supplier_id, int) or supplier_id <= 0:
+            return {"success": False, "error": "Некорректный ID поставщика"}
+
+        try:
+            existing_supplier = await self.repository.get_by_id(supplier_id)
+        except Exception:
+            existing_supplier = None
+        if existing_supplier is None:
+            return {
+                "success": False,
+                "error": f"Поставщик с ID {supplier_id} не найден",
+            }
+
+        try:
+            await self.repository.remove_by_id(supplier_id)
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Ошибка при удалении поставщика: {str(e)}",
+            }
+        await self._publish("item_deleted", supplier_id)
+        return {
+            "success": True,
+            "message": f"Поставщик '{existing_supplier.name}' успешно удален",
+            "supplier_id": supplier_id,
+        }
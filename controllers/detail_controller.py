@@ -0,0 +1,141 @@
+"""
+Контроллер каталога деталей
+Паттерн MVC - Controller
+"""
+
+from modules.article_index import ArticleSupplierIndex
+from modules.models.mini_cache import mini_cache
+from modules.models.money import from_kopecks
+from modules.repositories import detail_rep_base, supplier_rep_base
+
+
+class DetailController:
+    """
+    Контроллер для списка деталей
+    Отвечает за постраничный вывод, поиск деталей по артикулу
+    и поиск поставщиков артикула.
+    Ошибки (ValueError — некорректный запрос) не перехватываются:
+    код ответа выбирает маршрут
+    """
+
+    def __init__(
+        self,
+        repository: detail_rep_base,
+        supplier_index: ArticleSupplierIndex | None = None,
+        supplier_repository: supplier_rep_base | None = None,
+        purchase_repository=None,
+    ):
+        self.repository = repository
+        self.supplier_index = supplier_index
+        self.supplier_repository = supplier_repository
+        # источник закупок других процессов для индекса (опционально)
+        self.purchase_repository = purchase_repository
+
+    def get_details_page(
+        self, page: int = 1, page_size: int = 10, sort_field: str = "article"
+    ) -> dict:
+        """
+        Получить страницу каталога деталей (краткая информация)
+
+        Args:
+            page: номер страницы (начиная с 1)
+            page_size: количество элементов на странице
+            sort_field: поле для сортировки (article, name, price)
+
+        Returns:
+            Словарь с данными: items, total_count, page, page_size, total_pages
+        """
+        items = self.repository.get_k_n_short_list(page, page_size, sort_field)
+        total_count = self.repository.get_count()
+
+        if total_count > 0:
+            total_pages = (total_count + page_size - 1) // page_size
+        else:
+            total_pages = 1
+
+        return {
+            "success": True,
+            "items": items,
+            "total_count": total_count,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": total_pages,
+        }
+
+    def get_detail(self, article: str) -> dict:
+        """
+        Получить деталь по артикулу
+
+        Args:
+            article: артикул детали
+
+        Returns:
+            Словарь с полными данными детали
+        """
+        detail = self.repository.get_by_article(article)
+        if detail is None:
+            return {
+                "success": False,
+                "error": f"Деталь с артикулом {article} не найдена",
+            }
+        return {"success": True, "detail": detail}
+
+    def get_details(self, articles: list[str]) -> dict:
+        """
+        Получить несколько деталей по списку артикулов (одним запросом)
+
+        Args:
+            articles: список артикулов
+
+        Returns:
+            Словарь с найденными деталями и списком ненайденных артикулов
+        """
+        details = self.repository.get_many(articles)
+        found = {d.article for d in details}
+        return {
+            "success": True,
+            "items": details,
+            "missing": [a for a in articles if a not in found],
+        }
+
+    def get_article_suppliers(self, article: str, limit: int | None = None) -> dict:
+        """
+        Получить поставщиков артикула, начиная с лучшего предложения
+
+        Args:
+            article: артикул детали
+            limit: максимальное число поставщиков (опционально)
+
+        Returns:
+            Словарь со списком предложений (поставщик, цена, статистика закупок)
+        """
+        if self.supplier_index is None or self.supplier_repository is None:
+            raise RuntimeError("Индекс поставщиков не настроен")
+
+        if self.purchase_repository is not None:
+            self.supplier_index.refresh_if_stale(self.purchase_repository)
+        offers = self.supplier_index.get_suppliers(article, limit)
+        # поставщики всех предложений — одним запросом
+        suppliers = {
+            s.supplier_id: s
+            for s in self.supplier_repository.get_many(
+                [offer.supplier_id for offer in offers]
+            )
+        }
+        items = []
+        for offer in offers:
+            supplier = suppliers.get(offer.supplier_id)
+            if supplier is None:
+                continue
+            items.append(
+                {
+                    "supplier": mini_cache.supplier(
+                        supplier.supplier_id, supplier.name
+                    ),
+                    "price": from_kopecks(offer.price_kop),
+                    "purchases": offer.purchases,
+                    "units": offer.units,
+                    "last_purchase_date": offer.last_purchase_date,
+                }
+            )
+        return {"success": True, "article": article, "items": items}
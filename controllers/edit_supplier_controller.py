@@ -3,7 +3,7 @@
 Отдельный контроллер согласно паттерну MVC для окна редактирования
 """
 
-from modules.models.supplier import Supplier
+from controllers.supplier_form import build_supplier
 from modules.repositories import SupplierRepObservable
 
 
@@ -75,49 +75,15 @@ class EditSupplierController:
                 "validation_errors": {"general": "Поставщик не существует"},
             }
 
-        # Словарь для сбора ошибок валидации
-        validation_errors = {}
-
-        # Проверка обязательных полей
-        if not name or not name.strip():
-            validation_errors["name"] = "Поле 'Наименование' обязательно для заполнения"
-
-        if not phone or not phone.strip():
-            validation_errors["phone"] = "Поле 'Телефон' обязательно для заполнения"
-
-        # Если есть ошибки в обязательных полях, возвращаем их
-        if validation_errors:
-            return {
-                "success": False,
-                "error": "Ошибка валидации данных",
-                "validation_errors": validation_errors,
-            }
-
-        # Попытка создания объекта поставщика (здесь произойдет валидация формата)
-        try:
-            supplier = Supplier(
-                name=name.strip(),
-                phone=phone.strip(),
-                address=address.strip() if address else None,
-            )
-            supplier.supplier_id = supplier_id  # Устанавливаем ID редактируемого п-ка
-        except ValueError as e:
-            # Парсим ошибку и определяем поле
-            error_msg = str(e)
-            if "телефон" in error_msg.lower() or "phone" in error_msg.lower():
-                validation_errors["phone"] = error_msg
-            elif "имя" in error_msg.lower() or "name" in error_msg.lower():
-                validation_errors["name"] = error_msg
-            elif "адрес" in error_msg.lower() or "address" in error_msg.lower():
-                validation_errors["address"] = error_msg
-            else:
-                validation_errors["general"] = error_msg
-
+        # Обязательные поля и формат (валидация в модели)
+        supplier, validation_errors = build_supplier(name, phone, address)
+        if supplier is None:
             return {
                 "success": False,
                 "error": "Ошибка валидации данных",
                 "validation_errors": validation_errors,
             }
+        supplier.supplier_id = supplier_id  # Устанавливаем ID редактируемого п-ка
 
         # Попытка обновления в репозитории
         try:
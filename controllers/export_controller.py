@@ -0,0 +1,49 @@
+"""
+Контроллер потокового экспорта
+Паттерн MVC - Controller
+"""
+
+from modules.export import export_rows
+from modules.repositories.purchase_rep_base import PURCHASE_COLUMNS
+from modules.repositories.supplier_rep_base import SUPPLIER_COLUMNS
+
+
+class ExportController:
+    """
+    Контроллер для выгрузки поставщиков и закупок (CSV, NDJSON)
+    Строки читаются из репозитория по мере отправки ответа
+    """
+
+    def __init__(self, supplier_repository, purchase_repository):
+        self.supplier_repository = supplier_repository
+        self.purchase_repository = purchase_repository
+
+    def export_suppliers(self, fmt: str = "csv"):
+        """
+        Выгрузка всех поставщиков
+
+        Args:
+            fmt: формат (csv или ndjson)
+
+        Returns:
+            (MIME-тип, имя файла, генератор кусков ответа)
+        """
+        mimetype, extension, chunks = export_rows(
+            SUPPLIER_COLUMNS, self.supplier_repository.iter_rows(), fmt
+        )
+        return mimetype, f"suppliers.{extension}", chunks
+
+    def export_purchases(self, fmt: str = "csv"):
+        """
+        Выгрузка всех закупок (по возрастанию purchase_id)
+
+        Args:
+            fmt: формат (csv или ndjson)
+
+        Returns:
+            (MIME-тип, имя файла, генератор кусков ответа)
+        """
+        mimetype, extension, chunks = export_rows(
+            PURCHASE_COLUMNS, self.purchase_repository.iter_rows(), fmt
+        )
+        return mimetype, f"purchases.{extension}", chunks
@@ -0,0 +1,169 @@
+"""
+Контроллер отчётов о затратах
+Паттерн MVC - Controller
+"""
+
+from modules.aggregates import SpendAggregates
+from modules.models.mini_cache import mini_cache
+from modules.models.money import format_kopecks
+from modules.ranking import top_suppliers
+from modules.rollups import PurchaseRollups
+
+# Как часто ряды подтягивают новые закупки при чтении (секунды)
+ROLLUP_MAX_AGE = 60.0
+
+
+class ReportController:
+    """
+    Контроллер для отчётов по закупкам
+    Читает готовые агрегаты, не обращаясь к истории закупок
+    """
+
+    def __init__(
+        self,
+        aggregates: SpendAggregates,
+        rollups: PurchaseRollups | None = None,
+        purchase_repository=None,
+        supplier_repository=None,
+    ):
+        self.aggregates = aggregates
+        self.rollups = rollups
+        self.purchase_repository = purchase_repository
+        self.supplier_repository = supplier_repository
+
+    def get_monthly_spend(
+        self,
+        by: str = "supplier",
+        key: str | None = None,
+        month_from: str | None = None,
+        month_to: str | None = None,
+    ) -> dict:
+        """
+        Получить затраты по месяцам
+
+        Args:
+            by: разрез отчёта (supplier или article)
+            key: ID поставщика или артикул (опционально)
+            month_from: начальный месяц 'YYYY-MM' (опционально)
+            month_to: конечный месяц 'YYYY-MM' (опционально)
+
+        Returns:
+            Словарь со строками отчёта
+        """
+        try:
+            if self.purchase_repository is not None:
+                self.aggregates.refresh_if_stale(self.purchase_repository)
+            if by == "supplier":
+                supplier_id = int(key) if key else None
+                items = self.aggregates.supplier_months(
+                    supplier_id, month_from, month_to
+                )
+            elif by == "article":
+                items = self.aggregates.article_months(key, month_from, month_to)
+            else:
+                return {
+                    "success": False,
+                    "error": f"Разрез {by} не поддерживается (supplier, article)",
+                }
+            return {"success": True, "by": by, "items": items}
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+
+    def get_series(
+        self,
+        supplier_id: int,
+        granularity: str = "month",
+        date_from: str | None = None,
+        date_to: str | None = None,
+        include_recent: bool = False,
+    ) -> dict:
+        """
+        Получить ряд закупок поставщика по временным корзинам
+
+        Args:
+            supplier_id: ID поставщика
+            granularity: day, week или month
+            date_from: начальная дата 'YYYY-MM-DD' (опционально)
+            date_to: конечная дата 'YYYY-MM-DD' (опционально)
+            include_recent: подмешать закупки, ещё не попавшие в корзины
+
+        Returns:
+            Словарь с корзинами ряда
+        """
+        try:
+            if self.rollups is None or self.purchase_repository is None:
+                return {"success": False, "error": "Ряды закупок не настроены"}
+            self.rollups.refresh_if_stale(self.purchase_repository, ROLLUP_MAX_AGE)
+            items = self.rollups.series(
+                supplier_id,
+                granularity,
+                date_from,
+                date_to,
+                self.purchase_repository if include_recent else None,
+            )
+            return {
+                "success": True,
+                "supplier_id": supplier_id,
+                "granularity": granularity,
+                "items": items,
+            }
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+
+    def get_top_suppliers(
+        self,
+        n: int = 20,
+        date_from: str | None = None,
+        date_to: str | None = None,
+    ) -> dict:
+        """
+        Получить топ-n поставщиков по затратам за период
+
+        Args:
+            n: размер рейтинга
+            date_from: начальная дата 'YYYY-MM-DD' (опционально)
+            date_to: конечная дата 'YYYY-MM-DD' (опционально)
+
+        Returns:
+            Словарь с рейтингом: поставщик (SupplierMini) и итоги
+        """
+        try:
+            if self.purchase_repository is None or self.supplier_repository is None:
+                return {"success": False, "error": "Рейтинг поставщиков не настроен"}
+            if self.rollups is not None:
+                self.rollups.refresh_if_stale(self.purchase_repository, ROLLUP_MAX_AGE)
+            totals = top_suppliers(
+                n,
+                self.purchase_repository,
+                self.aggregates.prices,
+                self.rollups,
+                date_from,
+                date_to,
+            )
+            # имена поставщиков рейтинга — одним запросом
+            suppliers = {
+                s.supplier_id: s
+                for s in self.supplier_repository.get_many(
+                    [total.supplier_id for total in totals]
+                )
+            }
+            items = []
+            for total in totals:
+                supplier = suppliers.get(total.supplier_id)
+                if supplier is None:
+                    continue
+                items.append(
+                    {
+                        # места без пропусков, даже если поставщик удалён
+                        "rank": len(items) + 1,
+                        "supplier": mini_cache.supplier(
+                            supplier.supplier_id, supplier.name
+                        ),
+                        "count": total.count,
+                        "units": total.units,
+                        "total": format_kopecks(total.spend_kop),
+                    }
+                )
+            return {"success": True, "items": items}
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
@@ -4,6 +4,7 @@
 """
 
 from modules.models.supplier import Supplier
+from modules.page_cache import PageCache
 from modules.repositories import SupplierRepObservable
 
 
@@ -13,8 +14,11 @@ class SupplierController:
     Отвечает за обработку запросов и взаимодействие с моделью
     """
 
-    def __init__(self, repository: SupplierRepObservable):
+    def __init__(
+        self, repository: SupplierRepObservable, page_cache: PageCache | None = None
+    ):
         self.repository = repository
+        self.page_cache = page_cache
 
     def get_suppliers_page(
         self,
@@ -38,13 +42,36 @@ class SupplierController:
         Returns:
             Словарь с данными: items, total_count, page, page_size, total_pages
         """
+        if self.page_cache is None:
+            return self._load_page(
+                page, page_size, filter_field, filter_value, sort_field
+            )
+        # Ключ — полная спецификация запроса; кэш сбрасывается сменой версии данных
+        key = (page, page_size, filter_field or None, filter_value or None, sort_field)
+        return self.page_cache.get_or_compute(
+            key,
+            lambda: self._load_page(*key),
+            cacheable=lambda result: result["success"],
+        )
+
+    def _load_page(
+        self,
+        page: int,
+        page_size: int,
+        filter_field: str | None,
+        filter_value: str | None,
+        sort_field: str,
+    ) -> dict:
+        """Страница списка из репозитория (два запроса: элементы и количество)"""
         try:
             # Используем Decorator Pattern для фильтрации и сортировки
             from modules.Decorators import SupplierDB_Decorator
             from modules.repositories import Supplier_rep_DB
 
-            # Получаем базовый репозиторий из Observable
+            # Получаем базовый репозиторий из Observable (и обёрток-кэшей)
             base_repo = self.repository.repository
+            while hasattr(base_repo, "repository"):
+                base_repo = base_repo.repository
 
             # Если это DB репозиторий, используем декоратор
             if isinstance(base_repo, Supplier_rep_DB):
@@ -87,12 +114,10 @@ class SupplierController:
             else:
                 total_pages = 1
 
+            # SupplierMini сериализуются пакетно (modules.serialization)
             return {
                 "success": True,
-                "items": [
-                    {"supplier_id": s.supplier_id, "name": s.name}
-                    for s in suppliers_mini
-                ],
+                "items": suppliers_mini,
                 "total_count": total_count,
                 "page": page,
                 "page_size": page_size,
@@ -129,6 +154,9 @@ class SupplierController:
                     "address": supplier.address,
                 },
             }
+        except TimeoutError:
+            # БД не ответила за FLIGHT_TIMEOUT — код ответа выбирает маршрут
+            raise
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -0,0 +1,52 @@
+"""
+Валидация полей формы поставщика
+Общая для контроллеров добавления и редактирования (синхронных и ASGI)
+"""
+
+from modules.models.supplier import Supplier
+
+# Ключевые слова сообщения об ошибке модели -> поле формы
+FIELD_KEYWORDS = (
+    ("phone", ("телефон", "phone")),
+    ("name", ("имя", "name")),
+    ("address", ("адрес", "address")),
+)
+
+
+def field_of_error(error_msg: str) -> str:
+    """Поле формы, к которому относится ошибка модели (иначе general)"""
+    lowered = error_msg.lower()
+    for field, keywords in FIELD_KEYWORDS:
+        if any(keyword in lowered for keyword in keywords):
+            return field
+    return "general"
+
+
+def build_supplier(
+    name: str, phone: str, address: str | None = None
+) -> tuple[Supplier | None, dict]:
+    """
+    Проверка обязательных полей и создание поставщика
+    (здесь же происходит валидация формата в модели)
+
+    Returns:
+        (поставщик, {}) или (None, ошибки валидации по полям)
+    """
+    validation_errors = {}
+    if not name or not name.strip():
+        validation_errors["name"] = "Поле 'Наименование' обязательно для заполнения"
+    if not phone or not phone.strip():
+        validation_errors["phone"] = "Поле 'Телефон' обязательно для заполнения"
+    if validation_errors:
+        return None, validation_errors
+
+    try:
+        supplier = Supplier(
+            name=name.strip(),
+            phone=phone.strip(),
+            address=address.strip() if address else None,
+        )
+    except ValueError as e:
+        error_msg = str(e)
+        return None, {field_of_error(error_msg): error_msg}
+    return supplier, {}
@@ -0,0 +1,43 @@
+"""
+Конфигурация gunicorn для production
+
+Запуск:
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Параметры переопределяются переменными окружения:
+    WEB_BIND      адрес (по умолчанию 0.0.0.0:8000)
+    WEB_WORKERS   число процессов (по умолчанию 2 * CPU + 1)
+    WEB_THREADS   потоков в процессе (по умолчанию 8)
+    WEB_TIMEOUT   таймаут зависшего воркера, секунды (по умолчанию 30)
+"""
+
+import logging
+import multiprocessing
+import os
+
+bind = os.environ.get("WEB_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+# Потоковые воркеры: SSE-подключение занимает поток на всё время жизни,
+# поэтому потоков больше, чем ядер
+worker_class = "gthread"
+threads = int(os.environ.get("WEB_THREADS", 8))
+timeout = int(os.environ.get("WEB_TIMEOUT", 30))
+graceful_timeout = 30
+keepalive = 5
+
+# Код загружается один раз в мастере (быстрый старт воркеров, общая
+# память); соединение с БД и потоки создаются уже в воркерах
+preload_app = True
+
+
+def on_starting(server):
+    logging.basicConfig(
+        level=logging.INFO, format="[%(levelname)s] %(name)s: %(message)s"
+    )
+
+
+def post_worker_init(worker):
+    """Ресурсы воркера создаются сразу после fork, а не при первом запросе"""
+    from app import init_resources
+
+    init_resources(worker.wsgi)
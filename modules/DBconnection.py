@@ -1,3 +1,9 @@
+import itertools
+import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 import psycopg2
 
 params = {
@@ -8,14 +14,55 @@ params = {
     "port": 5432,
 }
 
+# Ограничение времени запросов текущего контекста, мс (0 — без ограничения)
+_statement_timeout: ContextVar[int] = ContextVar("statement_timeout", default=0)
+
+
+def current_statement_timeout() -> int:
+    """Лимит времени запросов текущего контекста, мс (0 — без ограничения)"""
+    return _statement_timeout.get()
+
+
+@contextmanager
+def statement_timeout(ms: int):
+    """
+    Ограничить время каждого запроса к БД внутри блока.
+    Зависший запрос отменяется сервером (psycopg2.errors.QueryCanceled).
+    """
+    token = _statement_timeout.set(ms)
+    try:
+        yield
+    finally:
+        _statement_timeout.reset(token)
+
+
+# Переоткрытие соединения после fork (блокировка пересоздаётся в потомке:
+# в момент fork её мог держать другой поток родителя)
+_fork_lock = threading.Lock()
+
+
+def _reset_fork_lock():
+    global _fork_lock
+    _fork_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_fork_lock)
+
 
 class SupplierDBConnection:
     """
-    Singleton
+    Singleton (один на процесс)
+
+    Соединение, унаследованное через fork, потомок не использует:
+    при первом запросе в новом процессе открывается своё соединение.
     """
 
     _instance = None
     _initialized = False
+    _cursor_ids = itertools.count(1)
+    # Соединения родительских процессов: закрывать их из потомка нельзя
+    # (close завершит сеанс родителя), поэтому они просто удерживаются
+    _inherited: list = []
 
     def __new__(cls):
         if cls._instance is None:
@@ -25,20 +72,77 @@ class SupplierDBConnection:
     def __init__(self):
         if not self._initialized:
             self.conn_params = params
-            self.conn = psycopg2.connect(**self.conn_params)
-            self.conn.autocommit = True
+            self._connect()
             self._initialized = True
-            print("[INFO] Start connection")
+
+    def _connect(self):
+        self.conn = psycopg2.connect(**self.conn_params)
+        self.conn.autocommit = True
+        self._pid = os.getpid()
+        # Соединение общее для потоков: SET statement_timeout и запрос
+        # выполняются под одной блокировкой
+        self._lock = threading.Lock()
+        self._session_timeout: int | None = None
+        print(f"[INFO] Start connection (pid {self._pid})")
+
+    def _connection(self):
+        """Соединение текущего процесса (после fork открывается новое)"""
+        if self._pid != os.getpid():
+            with _fork_lock:
+                if self._pid != os.getpid():
+                    self._inherited.append(self.conn)
+                    self._connect()
+        return self.conn
+
+    def _apply_timeout(self, cur):
+        """Выставить statement_timeout сеанса, если он отличается (под _lock)"""
+        timeout = _statement_timeout.get()
+        if timeout != self._session_timeout:
+            self._session_timeout = None
+            cur.execute("SET statement_timeout = %s;", (timeout,))
+            self._session_timeout = timeout
+
+    @contextmanager
+    def _cursor(self):
+        """Курсор соединения процесса с лимитом времени контекста"""
+        conn = self._connection()
+        with self._lock, conn.cursor() as cur:
+            self._apply_timeout(cur)
+            yield cur
 
     def _execute_query(self, query: str, params: tuple = ()) -> list[tuple]:
-        with self.conn.cursor() as cur:
+        with self._cursor() as cur:
             cur.execute(query, params)
             return cur.fetchall()
 
     def _execute_update(self, query: str, params: tuple = ()):
-        with self.conn.cursor() as cur:
+        with self._cursor() as cur:
             cur.execute(query, params)
 
+    def _iter_query(self, query: str, params: tuple = (), itersize: int = 10_000):
+        """
+        Построчное чтение через серверный (именованный) курсор.
+        Строки приходят пачками по itersize, поэтому память не зависит
+        от размера выборки. Курсор живёт в транзакции отдельного
+        соединения: сервер отдаёт строки по мере чтения (курсор WITH HOLD
+        в autocommit сначала строит всю выборку), а общее соединение
+        процесса не занято на время обхода.
+        """
+        conn = psycopg2.connect(**self.conn_params)
+        try:
+            conn.set_session(readonly=True)
+            with conn.cursor() as setup:
+                setup.execute(
+                    "SET LOCAL statement_timeout = %s;", (_statement_timeout.get(),)
+                )
+            with conn.cursor(name=f"stream_{next(self._cursor_ids)}") as cur:
+                cur.itersize = itersize
+                cur.execute(query, params)
+                yield from cur
+        finally:
+            # транзакция только читала: закрытие откатывает её
+            conn.close()
+
     def _close(self):
         if self.conn and not self.conn.closed:
             self.conn.close()
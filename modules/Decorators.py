@@ -1,3 +1,4 @@
+from modules.models.mini_cache import mini_cache
 from modules.models.supplier_mini import SupplierMini
 from modules.repositories import Supplier_rep_DB
 
@@ -45,7 +46,7 @@ class SupplierDB_Decorator:
         params.extend([n, offset])
 
         result = self.repo.db._execute_query(query, tuple(params))
-        return [SupplierMini(supplier_id=row[0], name=row[1]) for row in result]
+        return [mini_cache.supplier(row[0], row[1]) for row in result]
 
     def get_count(
         self, filter_field: str | None = None, filter_value: str | None = None
@@ -107,7 +108,7 @@ class SupplierFiles_Decorator:
         end = start + n
         items = sorted_items[start:end]
 
-        return [SupplierMini(item.supplier_id, item.name) for item in items]
+        return [mini_cache.supplier(item.supplier_id, item.name) for item in items]
 
     def get_count(
         self, filter_field: str | None = None, filter_value: str | None = None
@@ -0,0 +1,170 @@
+"""
+Инкрементально обновляемые агрегаты затрат
+
+SpendAggregates — наблюдатель PurchaseRepObservable: при добавлении или
+удалении закупки обновляет суммы «поставщик × месяц» и «артикул × месяц»;
+закупки других процессов подтягивает refresh() по отметке purchase_id.
+Отчёты читают готовые суммы за O(число групп), а не пересчитывают историю.
+
+Полная пересборка (после импорта/бэкфилла):
+    python -m modules.aggregates --purchases purchases.jsonl --details details.json
+    python -m modules.aggregates --db
+"""
+
+import argparse
+from datetime import date
+
+from modules.models.money import format_kopecks, spend_kopecks
+from modules.models.purchase import Purchase
+from modules.prices import PriceCache
+from modules.purchase_views import PurchaseView
+
+# Индексы значений в ячейке агрегата
+COUNT, UNITS, SPEND = 0, 1, 2
+
+
+def month_key(value: date) -> str:
+    """Ключ месяца: date(2025, 1, 15) -> '2025-01'"""
+    return f"{value.year:04d}-{value.month:02d}"
+
+
+class SpendAggregates(PurchaseView):
+    """
+    Суммы затрат по месяцам в памяти.
+
+    Ячейка агрегата — [число закупок, количество единиц, затраты в копейках].
+    Затраты каждой учтённой закупки запоминаются: удаление вычитает ровно
+    то, что было прибавлено, даже если цена с тех пор изменилась.
+    """
+
+    def __init__(self, detail_repository, prices: PriceCache | None = None):
+        """
+        Args:
+            detail_repository: репозиторий деталей (источник цен по артикулу)
+            prices: общий кэш цен (по умолчанию — свой)
+        """
+        super().__init__()
+        self.prices = prices or PriceCache(detail_repository)
+        self.by_supplier_month: dict[tuple[int, str], list[int]] = {}
+        self.by_article_month: dict[tuple[str, str], list[int]] = {}
+        # purchase_id -> затраты, учтённые в ячейках
+        self._spend: dict[int, int] = {}
+
+    # ==================== ОБНОВЛЕНИЕ ====================
+
+    def _add(self, purchase: Purchase):
+        spend = spend_kopecks(self.prices.get(purchase.article), purchase.quantity)
+        self._spend[purchase.purchase_id] = spend
+        self._change(purchase, +1, spend)
+
+    def _remove(self, purchase: Purchase):
+        spend = self._spend.pop(purchase.purchase_id, None)
+        if spend is None:
+            return
+        self._change(purchase, -1, spend)
+
+    def _change(self, purchase: Purchase, sign: int, spend: int):
+        month = month_key(purchase.purchase_date)
+        for table, key in (
+            (self.by_supplier_month, (purchase.supplier_id, month)),
+            (self.by_article_month, (purchase.article, month)),
+        ):
+            cell = table.setdefault(key, [0, 0, 0])
+            cell[COUNT] += sign
+            cell[UNITS] += sign * purchase.quantity
+            cell[SPEND] += sign * spend
+            if cell[COUNT] == 0:
+                del table[key]
+
+    def clear(self):
+        with self._lock:
+            super().clear()
+            self.by_supplier_month.clear()
+            self.by_article_month.clear()
+            self._spend.clear()
+        self.prices.clear()
+
+    # ==================== ЧТЕНИЕ ====================
+
+    @staticmethod
+    def _rows(table, key_name, key, month_from, month_to) -> list[dict]:
+        rows = []
+        for (group, month), cell in table.items():
+            if key is not None and group != key:
+                continue
+            if month_from is not None and month < month_from:
+                continue
+            if month_to is not None and month > month_to:
+                continue
+            rows.append(
+                {
+                    key_name: group,
+                    "month": month,
+                    "count": cell[COUNT],
+                    "units": cell[UNITS],
+                    "total": format_kopecks(cell[SPEND]),
+                }
+            )
+        rows.sort(key=lambda r: (r[key_name], r["month"]))
+        return rows
+
+    def supplier_months(
+        self,
+        supplier_id: int | None = None,
+        month_from: str | None = None,
+        month_to: str | None = None,
+    ) -> list[dict]:
+        """Затраты по поставщикам и месяцам ('YYYY-MM')"""
+        with self._lock:
+            return self._rows(
+                self.by_supplier_month, "supplier_id", supplier_id, month_from, month_to
+            )
+
+    def article_months(
+        self,
+        article: str | None = None,
+        month_from: str | None = None,
+        month_to: str | None = None,
+    ) -> list[dict]:
+        """Затраты по артикулам и месяцам ('YYYY-MM')"""
+        with self._lock:
+            return self._rows(
+                self.by_article_month, "article", article, month_from, month_to
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Пересборка агрегатов затрат")
+    parser.add_argument("--db", action="store_true", help="источник — PostgreSQL")
+    parser.add_argument("--purchases", help="файл закупок (.json или .jsonl)")
+    parser.add_argument("--details", help="файл деталей (.json или .yaml)")
+    args = parser.parse_args()
+
+    from modules import repositories
+
+    if args.db:
+        purchases = repositories.Purchase_rep_DB()
+        details = repositories.Detail_rep_DB()
+    elif args.purchases and args.details:
+        if args.purchases.endswith(".jsonl"):
+            purchases = repositories.Purchase_rep_jsonl(args.purchases)
+        else:
+            purchases = repositories.Purchase_rep_json(args.purchases)
+        if args.details.endswith((".yaml", ".yml")):
+            details = repositories.Detail_rep_yaml(args.details)
+        else:
+            details = repositories.Detail_rep_json(args.details)
+    else:
+        parser.error("укажите --db или --purchases и --details")
+
+    aggregates = SpendAggregates(details)
+    count = aggregates.rebuild(purchases)
+    print(
+        f"[OK] Учтено закупок: {count}; "
+        f"групп поставщик×месяц: {len(aggregates.by_supplier_month)}, "
+        f"артикул×месяц: {len(aggregates.by_article_month)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""
+Векторизованная аналитика закупок
+
+Закупки и каталог цен загружаются в колонки NumPy, а агрегаты
+(сумма затрат, количество единиц, средняя цена за единицу) считаются
+группировкой по поставщику, артикулу, дню, месяцу или их комбинации.
+Суммы считаются в копейках (int64), поэтому результат точный.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+
+from modules.models.detail import Detail
+from modules.models.money import format_kopecks
+from modules.models.purchase import Purchase
+
+# Поля, по которым возможна группировка
+GROUP_FIELDS = ("supplier", "article", "day", "month")
+
+
+@dataclass
+class PurchaseColumns:
+    """
+    Закупки в колоночном виде.
+
+    Attributes:
+        supplier_id (np.ndarray): ID поставщика (int32)
+        article_code (np.ndarray): код артикула — индекс в articles (int32)
+        quantity (np.ndarray): количество единиц (int32)
+        day (np.ndarray): дата закупки (datetime64[D])
+        articles (list[str]): артикулы по кодам
+    """
+
+    supplier_id: np.ndarray
+    article_code: np.ndarray
+    quantity: np.ndarray
+    day: np.ndarray
+    articles: list[str]
+
+    def __len__(self) -> int:
+        return len(self.quantity)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple]) -> "PurchaseColumns":
+        """
+        Построить колонки из строк (supplier_id, article, quantity, purchase_date).
+
+        Args:
+            rows: итерируемое кортежей (например, строки курсора БД)
+        """
+        codes: dict[str, int] = {}
+        supplier_ids, article_codes, quantities, days = [], [], [], []
+        for supplier_id, article, quantity, purchase_date in rows:
+            code = codes.get(article)
+            if code is None:
+                code = codes[article] = len(codes)
+            supplier_ids.append(supplier_id)
+            article_codes.append(code)
+            quantities.append(quantity)
+            days.append(purchase_date)
+
+        return cls(
+            supplier_id=np.array(supplier_ids, dtype=np.int32),
+            article_code=np.array(article_codes, dtype=np.int32),
+            quantity=np.array(quantities, dtype=np.int32),
+            day=np.array(days, dtype="datetime64[D]"),
+            articles=list(codes),
+        )
+
+    @classmethod
+    def from_purchases(cls, purchases: Iterable[Purchase]) -> "PurchaseColumns":
+        """Построить колонки из объектов Purchase"""
+        return cls.from_rows(
+            (p.supplier_id, p.article, p.quantity, p.purchase_date) for p in purchases
+        )
+
+    def price_column(self, details: Iterable[Detail]) -> np.ndarray:
+        """
+        Цены в копейках, выровненные по кодам артикулов.
+        Артикулы без цены в каталоге получают цену 0.
+
+        Args:
+            details: каталог деталей (например, Detail_rep.get_many(articles))
+
+        Returns:
+            np.ndarray: int64-массив длины len(articles)
+        """
+        prices = np.zeros(len(self.articles), dtype=np.int64)
+        position = {article: i for i, article in enumerate(self.articles)}
+        for detail in details:
+            i = position.get(detail.article)
+            if i is not None:
+                prices[i] = detail.price_kop
+        return prices
+
+
+@dataclass
+class SpendReport:
+    """
+    Результат группировки.
+
+    Attributes:
+        by (tuple[str, ...]): поля группировки
+        keys (dict[str, np.ndarray]): значения ключей групп по полям
+        total_kop (np.ndarray): сумма затрат в копейках (int64)
+        units (np.ndarray): количество единиц (int64)
+        count (np.ndarray): число закупок (int64)
+        articles (list[str]): артикулы по кодам (для расшифровки ключа article)
+    """
+
+    by: tuple[str, ...]
+    keys: dict[str, np.ndarray]
+    total_kop: np.ndarray
+    units: np.ndarray
+    count: np.ndarray
+    articles: list[str]
+
+    def __len__(self) -> int:
+        return len(self.total_kop)
+
+    @property
+    def avg_price_kop(self) -> np.ndarray:
+        """Средняя цена за единицу в копейках (float64)"""
+        return self.total_kop / np.maximum(self.units, 1)
+
+    def to_rows(self) -> list[dict]:
+        """Группы в виде списка словарей (для JSON-ответа)"""
+        columns = {}
+        for field in self.by:
+            values = self.keys[field]
+            if field == "supplier":
+                columns["supplier_id"] = values.tolist()
+            elif field == "article":
+                columns["article"] = [self.articles[c] for c in values]
+            elif field == "day":
+                columns["day"] = [d.isoformat() for d in values.tolist()]
+            elif field == "month":
+                columns["month"] = [str(m) for m in values]
+
+        avg = self.avg_price_kop
+        rows = []
+        for i in range(len(self)):
+            row = {name: values[i] for name, values in columns.items()}
+            row["total"] = format_kopecks(int(self.total_kop[i]))
+            row["units"] = int(self.units[i])
+            row["count"] = int(self.count[i])
+            row["avg_unit_price"] = format_kopecks(int(round(avg[i])))
+            rows.append(row)
+        return rows
+
+
+def _key_column(columns: PurchaseColumns, field: str) -> np.ndarray:
+    if field == "supplier":
+        return columns.supplier_id
+    if field == "article":
+        return columns.article_code
+    if field == "day":
+        return columns.day
+    if field == "month":
+        return columns.day.astype("datetime64[M]")
+    raise ValueError(f"Поле {field} не поддерживается для группировки")
+
+
+# Максимальное число ячеек для плотной группировки (bincount)
+DENSE_GROUPS_LIMIT = 4_000_000
+
+# Сумма затрат делится на старшую и младшую части, чтобы bincount
+# (float64) суммировал каждую из них точно
+_SPLIT_BITS = 24
+
+
+def _group_sorted(key_columns, spend, quantity):
+    """Группировка сортировкой: для ключей с большим диапазоном значений"""
+    # lexsort сортирует по последнему ключу в первую очередь
+    order = np.lexsort(key_columns[::-1])
+    sorted_keys = [k[order] for k in key_columns]
+
+    boundary = np.zeros(len(order), dtype=bool)
+    boundary[0] = True
+    for k in sorted_keys:
+        boundary[1:] |= k[1:] != k[:-1]
+    starts = np.flatnonzero(boundary)
+
+    return (
+        [k[starts] for k in sorted_keys],
+        np.add.reduceat(spend[order], starts),
+        np.add.reduceat(quantity[order], starts),
+        np.diff(np.append(starts, len(order))),
+    )
+
+
+def _group(key_columns, spend, quantity):
+    """
+    Группировка за O(n): ключи кодируются в смешанной системе счисления,
+    суммы считаются через bincount. Если ячеек слишком много — сортировка.
+    """
+    ints = [k.astype(np.int64) for k in key_columns]
+    lows = [int(k.min()) for k in ints]
+    spans = [int(k.max()) - low + 1 for k, low in zip(ints, lows)]
+    size = int(np.prod(spans, dtype=np.float64))
+    if size > DENSE_GROUPS_LIMIT:
+        return _group_sorted(key_columns, spend, quantity)
+
+    codes = np.zeros(len(spend), dtype=np.int64)
+    for k, low, span in zip(ints, lows, spans):
+        codes *= span
+        codes += k - low
+
+    count = np.bincount(codes, minlength=size)
+    groups = np.flatnonzero(count)
+    mask = (1 << _SPLIT_BITS) - 1
+    high = np.bincount(codes, weights=spend >> _SPLIT_BITS, minlength=size)
+    low_part = np.bincount(codes, weights=spend & mask, minlength=size)
+    total_kop = (high[groups].astype(np.int64) << _SPLIT_BITS) + low_part[
+        groups
+    ].astype(np.int64)
+    units = np.bincount(codes, weights=quantity, minlength=size)[groups]
+
+    # Расшифровка кодов групп обратно в значения ключей
+    keys = []
+    rest = groups.copy()
+    for k, low, span in reversed(list(zip(key_columns, lows, spans))):
+        keys.append((rest % span + low).astype(k.dtype))
+        rest //= span
+    keys.reverse()
+
+    return keys, total_kop, units.astype(np.int64), count[groups]
+
+
+def spend_by(
+    columns: PurchaseColumns,
+    prices: np.ndarray,
+    by: tuple[str, ...] = ("supplier",),
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> SpendReport:
+    """
+    Сгруппировать закупки и посчитать затраты.
+
+    Args:
+        columns: закупки в колоночном виде
+        prices: цены в копейках по кодам артикулов (PurchaseColumns.price_column)
+        by: поля группировки из GROUP_FIELDS, например ("supplier", "month")
+        date_from: начало периода (включительно)
+        date_to: конец периода (включительно)
+
+    Returns:
+        SpendReport: группы, отсортированные по ключам
+    """
+    if not by:
+        raise ValueError("Не заданы поля группировки")
+    key_columns = [_key_column(columns, field) for field in by]
+
+    quantity = columns.quantity.astype(np.int64)
+    spend = prices[columns.article_code] * quantity
+
+    mask = None
+    if date_from is not None:
+        mask = columns.day >= np.datetime64(date_from, "D")
+    if date_to is not None:
+        upper = columns.day <= np.datetime64(date_to, "D")
+        mask = upper if mask is None else mask & upper
+    if mask is not None:
+        key_columns = [k[mask] for k in key_columns]
+        quantity = quantity[mask]
+        spend = spend[mask]
+
+    if len(spend) == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return SpendReport(
+            by=tuple(by),
+            keys={field: k[:0] for field, k in zip(by, key_columns)},
+            total_kop=empty,
+            units=empty,
+            count=empty,
+            articles=columns.articles,
+        )
+
+    keys, total_kop, units, count = _group(key_columns, spend, quantity)
+    return SpendReport(
+        by=tuple(by),
+        keys=dict(zip(by, keys)),
+        total_kop=total_kop,
+        units=units,
+        count=count,
+        articles=columns.articles,
+    )
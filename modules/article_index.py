@@ -0,0 +1,164 @@
+"""
+Индекс «артикул -> поставщики»
+
+Показывает, кто поставляет артикул и по какой цене, без просмотра закупок.
+Поставщик считается поставщиком артикула, если у него есть закупки этого
+артикула. Цена берётся из каталога деталей (по условию предметной области
+цена детали постоянна). Предложения по артикулу хранятся отсортированными
+по (цена, самая свежая закупка, supplier_id), поэтому лучшее предложение
+доступно за O(1). Индекс обновляется инкрементально через события
+PurchaseRepObservable и refresh() по отметке purchase_id (закупки других
+процессов), цены — через события DetailRepObservable (CatalogPrices).
+"""
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any
+
+from modules.models.purchase import Purchase
+from modules.observer import Observer
+from modules.prices import PriceCache
+from modules.purchase_views import PurchaseView
+
+# Ключ сортировки предложений: (цена в копейках, -дата последней закупки, id)
+OfferKey = tuple[int, int, int]
+
+
+@dataclass
+class Offer:
+    """
+    Предложение поставщика по артикулу.
+
+    Attributes:
+        supplier_id (int): ID поставщика
+        price_kop (int): цена за единицу в копейках
+        purchases (int): число закупок артикула у поставщика
+        units (int): сколько единиц закуплено
+        last_purchase_date (date): дата последней закупки
+    """
+
+    supplier_id: int
+    price_kop: int
+    purchases: int = 0
+    units: int = 0
+    dates: dict[int, int] = field(default_factory=dict, repr=False)
+
+    @property
+    def last_purchase_date(self) -> date:
+        return date.fromordinal(max(self.dates))
+
+    @property
+    def key(self) -> OfferKey:
+        return (self.price_kop, -max(self.dates), self.supplier_id)
+
+
+class ArticleSupplierIndex(PurchaseView):
+    """Индекс поставщиков по артикулу с упорядоченными предложениями"""
+
+    def __init__(self, detail_repository, prices: PriceCache | None = None):
+        """
+        Args:
+            detail_repository: репозиторий деталей (источник цен по артикулу)
+            prices: общий кэш цен (по умолчанию — свой)
+        """
+        super().__init__()
+        self.prices = prices or PriceCache(detail_repository)
+        self._offers: dict[str, dict[int, Offer]] = {}
+        self._sorted: dict[str, list[OfferKey]] = {}
+
+    # ==================== ОБНОВЛЕНИЕ ====================
+
+    def _add(self, purchase: Purchase):
+        self._change(purchase, +1)
+
+    def _remove(self, purchase: Purchase):
+        self._change(purchase, -1)
+
+    def _change(self, purchase: Purchase, sign: int):
+        """Учесть закупку (sign=+1) или откатить её (sign=-1)"""
+        article = purchase.article
+        day = purchase.purchase_date.toordinal()
+        offers = self._offers.setdefault(article, {})
+        keys = self._sorted.setdefault(article, [])
+        offer = offers.get(purchase.supplier_id)
+        if offer is None:
+            if sign < 0:
+                return
+            offer = offers[purchase.supplier_id] = Offer(
+                purchase.supplier_id, self.prices.get(article)
+            )
+        else:
+            del keys[bisect_left(keys, offer.key)]
+
+        offer.purchases += sign
+        offer.units += sign * purchase.quantity
+        offer.dates[day] = offer.dates.get(day, 0) + sign
+        if offer.dates[day] <= 0:
+            del offer.dates[day]
+
+        if offer.purchases > 0:
+            insort(keys, offer.key)
+        else:
+            del offers[purchase.supplier_id]
+            if not offers:
+                del self._offers[article]
+                del self._sorted[article]
+
+    def set_price(self, article: str, price_kop: int):
+        """Обновить цену артикула (после изменения детали в каталоге)"""
+        self.prices.set(article, price_kop)
+        with self._lock:
+            offers = self._offers.get(article)
+            if not offers:
+                return
+            for offer in offers.values():
+                offer.price_kop = price_kop
+            self._sorted[article] = sorted(o.key for o in offers.values())
+
+    def clear(self):
+        with self._lock:
+            super().clear()
+            self._offers.clear()
+            self._sorted.clear()
+        self.prices.clear()
+
+    # ==================== ЧТЕНИЕ ====================
+
+    def cheapest(self, article: str) -> Offer | None:
+        """Лучшее предложение по артикулу — O(1)"""
+        with self._lock:
+            keys = self._sorted.get(article)
+            if not keys:
+                return None
+            return self._offers[article][keys[0][2]]
+
+    def get_suppliers(self, article: str, limit: int | None = None) -> list[Offer]:
+        """Предложения по артикулу, от лучшего к худшему"""
+        with self._lock:
+            keys = self._sorted.get(article, [])
+            if limit is not None:
+                keys = keys[:limit]
+            offers = self._offers.get(article, {})
+            return [offers[key[2]] for key in keys]
+
+
+class CatalogPrices(Observer):
+    """Переносит цены из событий DetailRepObservable в индекс поставщиков"""
+
+    def __init__(self, index: ArticleSupplierIndex):
+        self.index = index
+
+    def update(self, event_type: str, data: Any = None):
+        if event_type in ("item_added", "item_updated"):
+            details = [data]
+        elif event_type == "items_added":
+            details = data
+        elif event_type == "item_deleted":
+            # детали больше нет в каталоге — цена как у отсутствующей
+            self.index.set_price(data, 0)
+            return
+        else:
+            return
+        for detail in details:
+            self.index.set_price(detail.article, detail.price_kop)
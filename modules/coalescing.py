@@ -0,0 +1,165 @@
+"""
+Пакетирование и слияние событий Observer
+
+EventCoalescer подписывается на Subject, копит события в течение короткого
+окна (или до явного flush) и сливает события одного ID:
+    added + updated  -> added (с новыми данными)
+    added + deleted  -> событие исчезает
+    updated + deleted -> deleted
+Наблюдатели BatchObserver получают результат одним вызовом update_batch,
+поэтому массовая операция над N строками даёт им одну задачу, а не N.
+"""
+
+import itertools
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from modules.observer import Observer, Subject
+
+logger = logging.getLogger(__name__)
+
+ADDED, UPDATED, DELETED = "item_added", "item_updated", "item_deleted"
+
+# (предыдущее событие, новое событие) -> итоговое событие (None — удалить)
+_MERGE = {
+    (ADDED, UPDATED): ADDED,
+    (ADDED, DELETED): None,
+    (UPDATED, UPDATED): UPDATED,
+    (UPDATED, DELETED): DELETED,
+    (DELETED, ADDED): UPDATED,
+    (DELETED, UPDATED): UPDATED,
+}
+
+Event = tuple[str, Any]
+
+# Метка ключа событий без ID (не совпадает ни с одним ID объекта)
+_OTHER = object()
+
+
+def default_event_id(data: Any):
+    """ID объекта события: сам ID (item_deleted) или supplier_id модели"""
+    return getattr(data, "supplier_id", data)
+
+
+class BatchObserver(Observer):
+    """Наблюдатель, принимающий события пакетами"""
+
+    def update_batch(self, events: list[Event]):
+        """
+        Обработать пакет событий (по умолчанию — по одному через update).
+
+        Args:
+            events: список (тип события, данные) после слияния
+        """
+        for event_type, data in events:
+            self.update(event_type, data)
+
+    def update(self, event_type: str, data: Any = None):
+        pass
+
+
+class EventCoalescer(Observer, Subject):
+    """
+    Копит события Subject и доставляет их пакетами.
+
+    События item_added / item_updated / item_deleted сливаются по ID,
+    items_added разворачивается в item_added по каждому объекту,
+    прочие события передаются в пакете как есть. Пакет сохраняет порядок
+    поступления: слитое событие стоит на месте первого события своего ID.
+    Подписка — как у Subject (attach с фильтром типов событий).
+    """
+
+    def __init__(
+        self,
+        window: float | None = 0.05,
+        event_id: Callable[[Any], Any] = default_event_id,
+    ):
+        """
+        Args:
+            window: окно накопления в секундах (None — только явный flush)
+            event_id: функция получения ID объекта из данных события
+        """
+        Subject.__init__(self)
+        self.window = window
+        self.event_id = event_id
+        self.received = 0
+        self.delivered = 0
+        self.errors = 0
+        # ключ (ID объекта или порядковый номер прочего события) -> событие
+        self._pending: dict[Any, Event] = {}
+        self._seq = itertools.count()
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+
+    # ==================== НАКОПЛЕНИЕ ====================
+
+    def update(self, event_type: str, data: Any = None):
+        if event_type == "items_added":
+            for item in data:
+                self.update(ADDED, item)
+            return
+
+        with self._lock:
+            self.received += 1
+            if event_type in (ADDED, UPDATED, DELETED):
+                self._merge(event_type, data)
+            else:
+                self._pending[(_OTHER, next(self._seq))] = (event_type, data)
+            if self.window is not None and self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _merge(self, event_type: str, data: Any):
+        key = self.event_id(data)
+        previous = self._pending.get(key)
+        if previous is None:
+            self._pending[key] = (event_type, data)
+            return
+        merged = _MERGE.get((previous[0], event_type), event_type)
+        if merged is None:
+            del self._pending[key]
+        else:
+            self._pending[key] = (merged, data)
+
+    # ==================== ДОСТАВКА ====================
+
+    def flush(self) -> int:
+        """
+        Доставить накопленный пакет наблюдателям.
+        Ошибка наблюдателя записывается в журнал и не мешает остальным.
+
+        Returns:
+            int: число событий в пакете
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            events = list(self._pending.values())
+            self._pending = {}
+            self.delivered += len(events)
+            observers = list(self._observers)
+        if not events:
+            return 0
+
+        for observer in observers:
+            subscribed = self._subscriptions.get(observer)
+            batch = [e for e in events if subscribed is None or e[0] in subscribed]
+            if not batch:
+                continue
+            try:
+                if isinstance(observer, BatchObserver):
+                    observer.update_batch(batch)
+                else:
+                    for event_type, data in batch:
+                        observer.update(event_type, data)
+            except Exception:
+                with self._lock:
+                    self.errors += 1
+                logger.exception(
+                    "Ошибка наблюдателя %s на пакете событий", type(observer).__name__
+                )
+        return len(events)
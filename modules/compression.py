@@ -0,0 +1,164 @@
+"""
+Сжатие ответов (gzip, brotli)
+
+Кодировка выбирается по заголовку Accept-Encoding: brotli, если модуль
+brotli установлен и клиент его принимает, иначе gzip. Сжимаются только
+текстовые типы и тела не меньше порога; потоковые выгрузки сжимаются
+по кускам. Статические файлы сжимаются один раз (при старте и после
+изменения файла) и дальше отдаются из памяти.
+"""
+
+import gzip
+import os
+import threading
+import zlib
+from collections.abc import Iterable, Iterator
+
+try:
+    import brotli
+except ImportError:  # brotli необязателен: без него только gzip
+    brotli = None
+
+# Тела меньше порога не сжимаются: выигрыш меньше накладных расходов
+MIN_SIZE = 1024
+
+# Уровни: динамические ответы — быстро, статика — один раз и максимально
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+STATIC_GZIP_LEVEL = 9
+STATIC_BROTLI_QUALITY = 11
+
+COMPRESSIBLE_TYPES = {
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "text/javascript",
+    "text/css",
+    "text/csv",
+    "text/html",
+    "text/plain",
+    "image/svg+xml",
+}
+
+STATIC_EXTENSIONS = (".js", ".css", ".html", ".svg", ".json", ".txt")
+
+
+def supported_encodings() -> tuple[str, ...]:
+    """Доступные кодировки в порядке предпочтения"""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def compressible(mimetype: str | None) -> bool:
+    return mimetype in COMPRESSIBLE_TYPES
+
+
+def choose_encoding(accept_encoding: str | None) -> str | None:
+    """
+    Лучшая кодировка, принимаемая клиентом.
+
+    Args:
+        accept_encoding: заголовок Accept-Encoding (например, "gzip, br;q=0.9")
+
+    Returns:
+        "br", "gzip" или None (сжимать нельзя)
+    """
+    if not accept_encoding:
+        return None
+    qualities = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[name.strip().lower()] = quality
+    best, best_quality = None, 0.0
+    for encoding in supported_encodings():
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str, static: bool = False) -> bytes:
+    """Сжать тело ответа целиком"""
+    if encoding == "br":
+        quality = STATIC_BROTLI_QUALITY if static else BROTLI_QUALITY
+        return brotli.compress(body, quality=quality)
+    level = STATIC_GZIP_LEVEL if static else GZIP_LEVEL
+    # mtime=0: одинаковое тело — одинаковые байты (для ETag и кэшей)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def compress_stream(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    """Сжать поток кусков, не собирая его в памяти"""
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        for chunk in chunks:
+            data = compressor.process(chunk)
+            if data:
+                yield data
+        yield compressor.finish()
+        return
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)  # 31 — формат gzip
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+class StaticAssets:
+    """Заранее сжатые статические файлы (в памяти)"""
+
+    def __init__(self, folder: str, min_size: int = MIN_SIZE):
+        """
+        Args:
+            folder: каталог статических файлов
+            min_size: файлы меньше порога не сжимаются
+        """
+        self.folder = folder
+        self.min_size = min_size
+        # имя файла -> (mtime, {кодировка: сжатое тело})
+        self._items: dict[str, tuple[float, dict[str, bytes]]] = {}
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Сжать все подходящие файлы каталога (при старте приложения)"""
+        for root, _, files in os.walk(self.folder):
+            for name in files:
+                path = os.path.join(root, name)
+                self.get(os.path.relpath(path, self.folder), supported_encodings()[0])
+
+    def get(self, filename: str, encoding: str) -> bytes | None:
+        """
+        Сжатое содержимое файла или None (не сжимается или не найден).
+        Файл, изменённый после сжатия, сжимается заново.
+        """
+        filename = os.path.normpath(filename)
+        if os.path.isabs(filename) or filename.startswith(".."):
+            return None
+        if not filename.endswith(STATIC_EXTENSIONS):
+            return None
+        path = os.path.join(self.folder, filename)
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._items.get(filename)
+        if entry is None or entry[0] != mtime:
+            with open(path, "rb") as f:
+                body = f.read()
+            variants = {}
+            if len(body) >= self.min_size:
+                variants = {
+                    e: compress(body, e, static=True) for e in supported_encodings()
+                }
+            entry = (mtime, variants)
+            with self._lock:
+                self._items[filename] = entry
+        return entry[1].get(encoding)
@@ -0,0 +1,101 @@
+"""
+Условные GET-запросы (ETag / Last-Modified / 304)
+
+Валидаторы ответа строятся без обращения к БД: ETag списка — версия
+данных процесса (DataVersion), ETag одной записи — хэш тела ответа.
+Если клиент прислал совпадающий If-None-Match (или, без него,
+If-Modified-Since не раньше последнего изменения), сервер отвечает 304
+без тела — и для списка даже не выполняет запросы страницы и количества.
+"""
+
+import hashlib
+import uuid
+from email.utils import formatdate, parsedate_to_datetime
+
+# Ответ можно хранить, но перед использованием — перепроверить
+CACHE_CONTROL = "no-cache"
+
+
+def new_boot_id() -> str:
+    """
+    Метка запуска процесса: версии данных разных процессов (и одного
+    процесса после перезапуска) не должны давать одинаковый ETag.
+    Создаётся в каждом воркере после fork (app.init_resources).
+    """
+    return uuid.uuid4().hex[:12]
+
+
+def version_etag(boot_id: str, version: int) -> str:
+    """Сильный ETag по версии данных процесса"""
+    return f'"{boot_id}-{version}"'
+
+
+def content_etag(body: bytes) -> str:
+    """Сильный ETag по содержимому ответа"""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """
+    ETag сжатого представления: сильный ETag обязан различаться для
+    разных Content-Encoding ("abc" -> "abc-gzip")
+    """
+    return f'{etag[:-1]}-{encoding}"' if etag.endswith('"') else etag
+
+
+def strip_encodings(if_none_match: str) -> str:
+    """Убрать суффиксы кодировок из If-None-Match (обратно к ETag тела)"""
+    for encoding in ("gzip", "br"):
+        if_none_match = if_none_match.replace(f'-{encoding}"', '"')
+    return if_none_match
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Совпадает ли ETag с заголовком If-None-Match.
+    Сравнение слабое (RFC 9110): префикс W/ не учитывается.
+    """
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def not_modified(
+    etag: str,
+    if_none_match: str | None,
+    last_modified: float | None = None,
+    if_modified_since: str | None = None,
+) -> bool:
+    """
+    Можно ли ответить 304.
+    If-Modified-Since проверяется, только если If-None-Match не прислан.
+
+    Args:
+        etag: текущий ETag ресурса
+        if_none_match: заголовок If-None-Match запроса
+        last_modified: время последнего изменения (unix-время)
+        if_modified_since: заголовок If-Modified-Since запроса
+    """
+    if if_none_match:
+        return etag_matches(if_none_match, etag)
+    if last_modified is None or not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    # HTTP-дата с точностью до секунды
+    return int(last_modified) <= since
+
+
+def validator_headers(etag: str, last_modified: float | None = None) -> dict:
+    """Заголовки ETag, Last-Modified и Cache-Control для ответа"""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = formatdate(last_modified, usegmt=True)
+    return headers
@@ -0,0 +1,213 @@
+"""
+Стратегии доставки событий Observer
+
+SyncDispatcher — прежнее поведение: update() вызывается сразу внутри notify.
+QueueDispatcher — события кладутся в ограниченную очередь и доставляются
+фоновым потоком, поэтому медленные наблюдатели не добавляют задержку
+чтению и записи. Ошибка одного наблюдателя не мешает остальным.
+"""
+
+import logging
+import queue
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Политики переполнения очереди
+BLOCK = "block"  # ждать места (обратное давление на notify)
+DROP_NEW = "drop_new"  # отбросить новое событие
+DROP_OLDEST = "drop_oldest"  # вытеснить самое старое событие
+POLICIES = (BLOCK, DROP_NEW, DROP_OLDEST)
+
+
+class SyncDispatcher:
+    """Синхронная доставка: исключения наблюдателей доходят до notify"""
+
+    def dispatch(self, observers, event_type: str, data: Any = None):
+        for observer in observers:
+            observer.update(event_type, data)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        return True
+
+    def close(self):
+        pass
+
+
+@dataclass
+class DispatchMetrics:
+    """
+    Счётчики очереди событий.
+
+    Attributes:
+        enqueued (int): принято событий
+        delivered (int): доставлено вызовов update()
+        dropped (int): отброшено событий (переполнение)
+        errors (int): исключений в наблюдателях
+        max_depth (int): максимальная глубина очереди
+    """
+
+    enqueued: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    errors: int = 0
+    max_depth: int = 0
+
+
+class QueueDispatcher:
+    """Асинхронная доставка через ограниченную очередь и поток-обработчик"""
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        policy: str = BLOCK,
+        block_timeout: float | None = None,
+    ):
+        """
+        Args:
+            maxsize: ёмкость очереди
+            policy: block, drop_new или drop_oldest
+            block_timeout: для block — сколько ждать места (None — без лимита);
+                по истечении событие отбрасывается
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Политика {policy} не поддерживается")
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.metrics = DispatchMetrics()
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._worker = threading.Thread(
+            target=self._run, name="observer-dispatch", daemon=True
+        )
+        self._worker.start()
+
+    @property
+    def depth(self) -> int:
+        """Текущая глубина очереди"""
+        return self._queue.qsize()
+
+    def snapshot(self) -> dict:
+        """Метрики очереди одним словарём"""
+        with self._lock:
+            return {**asdict(self.metrics), "depth": self.depth, "policy": self.policy}
+
+    def _count(self, name: str, value: int = 1):
+        with self._lock:
+            setattr(self.metrics, name, getattr(self.metrics, name) + value)
+
+    # ==================== ПОСТАНОВКА В ОЧЕРЕДЬ ====================
+
+    def dispatch(self, observers, event_type: str, data: Any = None):
+        if self._closed:
+            raise RuntimeError("Очередь событий закрыта")
+        item = (tuple(observers), event_type, data)
+        if not item[0]:
+            return
+
+        if self.policy == BLOCK:
+            try:
+                self._queue.put(item, timeout=self.block_timeout)
+            except queue.Full:
+                self._count("dropped")
+                return
+        elif self.policy == DROP_NEW:
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                self._count("dropped")
+                return
+        else:
+            while True:
+                try:
+                    self._queue.put_nowait(item)
+                    break
+                except queue.Full:
+                    try:
+                        self._queue.get_nowait()
+                        self._queue.task_done()
+                        self._count("dropped")
+                    except queue.Empty:
+                        pass
+
+        with self._lock:
+            self.metrics.enqueued += 1
+            self.metrics.max_depth = max(self.metrics.max_depth, self.depth)
+
+    # ==================== ДОСТАВКА ====================
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                observers, event_type, data = item
+                for observer in observers:
+                    try:
+                        observer.update(event_type, data)
+                        self._count("delivered")
+                    except Exception:
+                        self._count("errors")
+                        logger.exception(
+                            "Ошибка наблюдателя %s на событии %s",
+                            type(observer).__name__,
+                            event_type,
+                        )
+            finally:
+                self._queue.task_done()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Дождаться доставки всех принятых событий.
+
+        Returns:
+            bool: True, если очередь опустела до истечения timeout
+        """
+        if timeout is None:
+            self._queue.join()
+            return True
+        done = threading.Event()
+
+        def wait():
+            self._queue.join()
+            done.set()
+
+        threading.Thread(target=wait, daemon=True).start()
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = 5.0):
+        """
+        Доставить оставшиеся события и остановить поток.
+        Если очередь не освободилась за timeout (наблюдатель завис),
+        самые старые события отбрасываются, чтобы поместилась метка
+        остановки и close не блокировался.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            dropped = 0
+            while True:
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                    dropped += 1
+                except queue.Empty:
+                    pass
+                # производитель мог заполнить очередь заново после
+                # очистки: вытесняем самые старые события, пока метка
+                # остановки не поместится (как DROP_OLDEST)
+                try:
+                    self._queue.put_nowait(None)
+                    break
+                except queue.Full:
+                    continue
+            self._count("dropped", dropped)
+            logger.warning("Очередь событий закрыта, отброшено событий: %d", dropped)
+        self._worker.join(timeout)
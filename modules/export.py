@@ -0,0 +1,75 @@
+"""
+Потоковый экспорт строк в CSV и NDJSON
+
+Строки (кортежи из iter_rows репозиториев) кодируются по мере чтения
+и отдаются пачками, поэтому память не зависит от объёма выгрузки.
+"""
+
+import csv
+import io
+from collections.abc import Iterable, Iterator
+
+from modules.serialization import dumps
+
+# Сколько строк собирать в один кусок ответа
+CHUNK_ROWS = 1000
+
+
+def iter_csv(
+    columns: tuple[str, ...], rows: Iterable[tuple], chunk_rows: int = CHUNK_ROWS
+) -> Iterator[bytes]:
+    """CSV с заголовком; каждые chunk_rows строк — отдельный кусок"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(columns)
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue().encode("utf-8")
+
+
+def iter_ndjson(
+    columns: tuple[str, ...], rows: Iterable[tuple], chunk_rows: int = CHUNK_ROWS
+) -> Iterator[bytes]:
+    """NDJSON: один JSON-объект на строку"""
+    chunk: list[bytes] = []
+    for row in rows:
+        chunk.append(dumps(dict(zip(columns, row))))
+        if len(chunk) >= chunk_rows:
+            chunk.append(b"")
+            yield b"\n".join(chunk)
+            chunk = []
+    if chunk:
+        chunk.append(b"")
+        yield b"\n".join(chunk)
+
+
+# Формат -> (MIME-тип, расширение файла, кодировщик)
+FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv", iter_csv),
+    "ndjson": ("application/x-ndjson", "ndjson", iter_ndjson),
+}
+
+
+def export_rows(
+    columns: tuple[str, ...], rows: Iterable[tuple], fmt: str
+) -> tuple[str, str, Iterator[bytes]]:
+    """
+    Подготовить потоковую выгрузку.
+
+    Returns:
+        (MIME-тип, расширение файла, генератор кусков ответа)
+
+    Raises:
+        ValueError: неизвестный формат
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Формат {fmt} не поддерживается ({', '.join(FORMATS)})")
+    mimetype, extension, encoder = FORMATS[fmt]
+    return mimetype, extension, encoder(columns, rows)
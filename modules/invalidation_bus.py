@@ -0,0 +1,317 @@
+"""
+Межпроцессная шина инвалидации кэшей
+
+Изменение данных в одном процессе (item_added / item_updated / item_deleted)
+публикуется в шину, остальные процессы получают его за миллисекунды и
+сбрасывают свои кэши. Шина — Subject: локальные кэши подписываются на неё
+как обычные наблюдатели и получают событие с данными Invalidation.
+
+Реализации:
+- PgNotifyBus — PostgreSQL LISTEN/NOTIFY (для репозиториев БД)
+- UnixSocketBus — датаграммные Unix-сокеты в общем каталоге
+  (для файловых репозиториев на одной машине)
+
+Собственные сообщения процесса отбрасываются по метке origin.
+Если слушатель потерял соединение, сообщения за время разрыва потеряны:
+после переподключения подписчики получают событие RESYNC_EVENT и
+сбрасывают кэши целиком.
+"""
+
+import json
+import logging
+import os
+import select
+import socket
+import threading
+import uuid
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+from modules.coalescing import BatchObserver
+from modules.models.mini_cache import mini_cache
+from modules.observer import Observer, Subject
+
+logger = logging.getLogger(__name__)
+
+# Канал LISTEN/NOTIFY по умолчанию
+CHANNEL = "repo_invalidation"
+# Событие «сообщения могли потеряться — сбросить кэши целиком»
+RESYNC_EVENT = "cache_resync"
+# Пауза перед переподключением слушателя: от минимума, удваивается, секунды
+RECONNECT_MIN_DELAY = 0.5
+RECONNECT_MAX_DELAY = 30.0
+# Изменений в одном сообщении (NOTIFY ограничивает payload 8000 байтами)
+MAX_CHANGES_PER_MESSAGE = 200
+
+
+@dataclass(frozen=True)
+class Invalidation:
+    """
+    Изменение, пришедшее из другого процесса.
+
+    Attributes:
+        entity (str): тип сущности (supplier, detail, ...)
+        key: ID изменённого объекта
+    """
+
+    entity: str
+    key: Any
+
+
+class InvalidationBus(Subject):
+    """Базовая шина: сериализация сообщений и поток-слушатель"""
+
+    def __init__(self):
+        super().__init__()
+        # Метка процесса: pid + случайный суффикс (pid переиспользуется)
+        self.origin = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.published = 0
+        self.received = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def publish(self, entity: str, changes: list[tuple[str, Any]]):
+        """
+        Опубликовать изменения другим процессам.
+
+        Args:
+            entity: тип сущности
+            changes: список (тип события, ID объекта)
+        """
+        for start in range(0, len(changes), MAX_CHANGES_PER_MESSAGE):
+            chunk = changes[start : start + MAX_CHANGES_PER_MESSAGE]
+            payload = json.dumps(
+                {"o": self.origin, "e": entity, "c": chunk}, ensure_ascii=False
+            )
+            self._send(payload)
+            self.published += 1
+
+    def _receive(self, payload: str | bytes):
+        """Разобрать сообщение и уведомить локальных подписчиков"""
+        try:
+            message = json.loads(payload)
+            if message["o"] == self.origin:
+                return
+            self.received += 1
+            for event_type, key in message["c"]:
+                self.notify(event_type, Invalidation(message["e"], key))
+        except Exception:
+            # ошибка одного сообщения или наблюдателя не останавливает слушатель
+            logger.exception("Ошибка обработки сообщения шины инвалидации")
+
+    def start(self):
+        """Запустить поток-слушатель"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._listen, name=type(self).__name__, daemon=True
+            )
+            self._thread.start()
+
+    def close(self, timeout: float = 2.0):
+        """Остановить слушатель и освободить ресурсы"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @abstractmethod
+    def _send(self, payload: str):
+        """Отправить сообщение остальным процессам"""
+
+    @abstractmethod
+    def _listen(self):
+        """Цикл приёма сообщений (до self._stop)"""
+
+
+class PgNotifyBus(InvalidationBus):
+    """
+    ADAPTER
+    Шина на PostgreSQL LISTEN/NOTIFY.
+    Слушатель держит отдельное соединение (LISTEN занимает сессию).
+    """
+
+    def __init__(self, conn_params: dict, channel: str = CHANNEL, db=None):
+        """
+        Args:
+            conn_params: параметры соединения для слушателя
+            channel: имя канала
+            db: соединение для публикации (по умолчанию SupplierDBConnection)
+        """
+        super().__init__()
+        self.conn_params = conn_params
+        self.channel = channel
+        self._db = db
+        self.connection_errors = 0
+
+    @property
+    def db(self):
+        if self._db is None:
+            from modules.DBconnection import SupplierDBConnection
+
+            self._db = SupplierDBConnection()
+        return self._db
+
+    def _send(self, payload: str):
+        self.db._execute_update("SELECT pg_notify(%s, %s);", (self.channel, payload))
+
+    def _listen(self):
+        """
+        Слушать канал; при ошибке соединения переподключаться с растущей
+        паузой. После восстановления подписчики получают RESYNC_EVENT.
+        """
+        import psycopg2
+
+        delay = RECONNECT_MIN_DELAY
+        lost = False
+        while not self._stop.is_set():
+            try:
+                self._listen_once(lost)
+                return
+            except (psycopg2.Error, OSError):
+                lost = True
+                self.connection_errors += 1
+                logger.warning(
+                    "Слушатель %s потерял соединение, повтор через %.1f с",
+                    self.channel,
+                    delay,
+                    exc_info=True,
+                )
+            self._stop.wait(delay)
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    def _listen_once(self, resync: bool):
+        """Одно соединение слушателя: LISTEN и приём до close() или ошибки"""
+        import psycopg2
+        from psycopg2 import sql
+
+        conn = psycopg2.connect(**self.conn_params)
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cur:
+                cur.execute(sql.SQL("LISTEN {};").format(sql.Identifier(self.channel)))
+            if resync:
+                # LISTEN уже действует: изменения после сброса не потеряются
+                logger.info("Слушатель %s переподключился", self.channel)
+                self.notify(RESYNC_EVENT)
+            while not self._stop.is_set():
+                # select с таймаутом, чтобы вовремя заметить close()
+                if select.select([conn], [], [], 0.5) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    self._receive(conn.notifies.pop(0).payload)
+        finally:
+            conn.close()
+
+
+class UnixSocketBus(InvalidationBus):
+    """
+    Шина на датаграммных Unix-сокетах.
+    Каждый процесс слушает свой сокет в общем каталоге и рассылает
+    сообщения во все остальные; сокеты завершившихся процессов удаляются.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: общий каталог сокетов процессов
+        """
+        super().__init__()
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.path = os.path.join(directory, f"{self.origin}.sock")
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sock.bind(self.path)
+        self._sock.settimeout(0.5)
+        self._sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        # публикация не должна блокировать запрос из-за медленного получателя
+        self._sender.setblocking(False)
+
+    def _peers(self) -> list[str]:
+        return [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(".sock") and name != f"{self.origin}.sock"
+        ]
+
+    def _send(self, payload: str):
+        data = payload.encode("utf-8")
+        for peer in self._peers():
+            try:
+                self._sender.sendto(data, peer)
+            except (ConnectionRefusedError, FileNotFoundError):
+                # процесс завершился, а файл сокета остался
+                try:
+                    os.unlink(peer)
+                except FileNotFoundError:
+                    pass
+            except BlockingIOError:
+                # очередь получателя переполнена — сообщение теряется
+                pass
+
+    def _listen(self):
+        while not self._stop.is_set():
+            try:
+                data = self._sock.recv(65536)
+            except TimeoutError:
+                continue
+            except OSError:
+                return
+            self._receive(data)
+
+    def close(self, timeout: float = 2.0):
+        super().close(timeout)
+        self._sock.close()
+        self._sender.close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class InvalidationPublisher(BatchObserver):
+    """
+    Наблюдатель репозитория: публикует изменения в шину.
+    Подписывается на EventCoalescer — тогда пакет изменений уходит
+    одним сообщением.
+    """
+
+    def __init__(
+        self, bus: InvalidationBus, entity: str = "supplier", key_attr="supplier_id"
+    ):
+        """
+        Args:
+            bus: шина инвалидации
+            entity: тип сущности в сообщениях
+            key_attr: атрибут модели с ID (item_deleted передаёт сам ID)
+        """
+        self.bus = bus
+        self.entity = entity
+        self.key_attr = key_attr
+
+    def update(self, event_type: str, data: Any = None):
+        self.update_batch([(event_type, data)])
+
+    def update_batch(self, events: list[tuple[str, Any]]):
+        changes = [
+            (event_type, getattr(data, self.key_attr, data))
+            for event_type, data in events
+        ]
+        if changes:
+            self.bus.publish(self.entity, changes)
+
+
+class MiniCacheInvalidator(Observer):
+    """Наблюдатель шины: сбрасывает записи общего кэша кратких объектов"""
+
+    def update(self, event_type: str, data: Any = None):
+        if event_type == RESYNC_EVENT:
+            mini_cache.clear()
+            return
+        if not isinstance(data, Invalidation):
+            return
+        if data.entity == "supplier":
+            mini_cache.invalidate_supplier(data.key)
+        elif data.entity == "detail":
+            mini_cache.invalidate_detail(data.key)
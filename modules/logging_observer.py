@@ -0,0 +1,96 @@
+"""
+Наблюдатель-журнал событий репозитория
+
+Замена print-наблюдателю: у каждого типа события свой уровень логирования,
+события чтения пишутся с выборкой (sample_rate), данные сокращаются до
+краткого описания — список из тысяч поставщиков не форматируется целиком.
+"""
+
+import logging
+import random
+from collections import Counter
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from modules.coalescing import BatchObserver
+
+# События чтения (частые, пишутся на DEBUG с выборкой)
+READ_EVENTS = ("data_loaded", "item_selected", "short_list_loaded", "data_sorted")
+
+DEFAULT_LEVELS = {
+    "item_added": logging.INFO,
+    "items_added": logging.INFO,
+    "item_updated": logging.INFO,
+    "item_deleted": logging.INFO,
+    **{event: logging.DEBUG for event in READ_EVENTS},
+}
+
+MAX_REPR = 200
+
+
+def summarize(data: Any) -> str:
+    """Краткое описание данных события для журнала"""
+    if isinstance(data, (list, tuple)):
+        return f"<{len(data)} объектов>"
+    if isinstance(data, dict) and "items" in data:
+        rest = ", ".join(f"{k}={v}" for k, v in data.items() if k != "items")
+        return f"<{len(data['items'])} объектов; {rest}>"
+    text = str(data)
+    if len(text) > MAX_REPR:
+        return text[:MAX_REPR] + "..."
+    return text
+
+
+class LoggingObserver(BatchObserver):
+    """Пишет события в журнал с уровнями и выборкой"""
+
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        levels: dict[str, int] | None = None,
+        sample_rate: float = 1.0,
+        random_fn: Callable[[], float] = random.random,
+    ):
+        """
+        Args:
+            logger: журнал (по умолчанию modules.events)
+            levels: уровень для каждого типа события (остальные — DEBUG)
+            sample_rate: доля записываемых событий уровня ниже INFO (0..1)
+            random_fn: источник случайных чисел для выборки
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate должен быть в диапазоне 0..1")
+        self.logger = logger or logging.getLogger("modules.events")
+        self.levels = {**DEFAULT_LEVELS, **(levels or {})}
+        self.sample_rate = sample_rate
+        self.random_fn = random_fn
+        self.skipped = 0
+
+    def level_of(self, event_type: str) -> int:
+        return self.levels.get(event_type, logging.DEBUG)
+
+    def enabled_events(self, events: Iterable[str]) -> list[str]:
+        """
+        События, которые журнал сейчас запишет (по уровню).
+        Подписываться стоит только на них — остальные не будут строиться.
+        """
+        return [e for e in events if self.logger.isEnabledFor(self.level_of(e))]
+
+    def update(self, event_type: str, data: Any = None):
+        level = self.level_of(event_type)
+        if not self.logger.isEnabledFor(level):
+            return
+        if level < logging.INFO and self.random_fn() >= self.sample_rate:
+            self.skipped += 1
+            return
+        self.logger.log(level, "Событие: %s | %s", event_type, summarize(data))
+
+    def update_batch(self, events: list[tuple[str, Any]]):
+        if len(events) == 1:
+            self.update(*events[0])
+            return
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        counts = Counter(event_type for event_type, _ in events)
+        summary = ", ".join(f"{name} x{n}" for name, n in counts.items())
+        self.logger.info("Пакет событий: %s", summary)
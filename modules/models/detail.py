@@ -2,6 +2,13 @@ from decimal import Decimal, InvalidOperation
 
 from modules.models.detail_base import DetailBase
 from modules.models.detail_mini import DetailMini
+from modules.models.money import (
+    MAX_PRICE_KOP,
+    MIN_PRICE_KOP,
+    format_kopecks,
+    from_kopecks,
+    to_kopecks,
+)
 
 
 class Detail(DetailBase):
@@ -12,6 +19,7 @@ class Detail(DetailBase):
         article (str): Артикул детали (уникальный идентификатор)
         name (str): Наименование детали
         price (Decimal): Цена за единицу (руб.)
+        price_kop (int): Цена за единицу в копейках (хранится внутри)
     """
 
     def __init__(self, *args, **kwargs):
@@ -45,7 +53,7 @@ class Detail(DetailBase):
                 # article, name (цена по умолчанию = 0)
                 article, name = args
                 super().__init__(article, name)
-                self.price = Decimal("0.00")
+                self.price_kop = 0
 
             elif len(args) == 3 and not kwargs:
                 # article, name, price
@@ -151,8 +159,8 @@ class Detail(DetailBase):
 
     @property
     def price(self) -> Decimal:
-        """Цена за единицу (руб.)"""
-        return self._price
+        """Цена за единицу (руб.) — Decimal-представление для совместимости"""
+        return from_kopecks(self._price_kop)
 
     @price.setter
     def price(self, value):
@@ -165,24 +173,41 @@ class Detail(DetailBase):
         Raises:
             ValueError: Некорректная цена
         """
-        if not self._validate_price(value):
+        try:
+            price_kop = to_kopecks(value)
+        except ValueError:
+            price_kop = None
+
+        if price_kop is None or not MIN_PRICE_KOP <= price_kop <= MAX_PRICE_KOP:
             raise ValueError(
                 f"Некорректная цена: '{value}'. "
                 "Цена должна быть неотрицательным числом от 0.00 до 999,999.99 руб."
             )
+        self._price_kop = price_kop
 
-        # Преобразуем в Decimal
-        if isinstance(value, Decimal):
-            self._price = value
-        elif isinstance(value, (int, float)):
-            self._price = Decimal(str(value))
-        elif isinstance(value, str):
-            try:
-                self._price = Decimal(value)
-            except InvalidOperation:
-                raise ValueError(f"Невозможно преобразовать '{value}' в число")
-        else:
-            raise ValueError(f"Неподдерживаемый тип для цены: {type(value)}")
+    @property
+    def price_kop(self) -> int:
+        """Цена за единицу в копейках (внутреннее представление)"""
+        return self._price_kop
+
+    @price_kop.setter
+    def price_kop(self, value: int):
+        """
+        Установка цены в копейках.
+
+        Raises:
+            ValueError: Цена вне диапазона или не целое число
+        """
+        if (
+            not isinstance(value, int)
+            or isinstance(value, bool)
+            or not MIN_PRICE_KOP <= value <= MAX_PRICE_KOP
+        ):
+            raise ValueError(
+                f"Некорректная цена в копейках: '{value}'. "
+                f"Ожидается целое число от {MIN_PRICE_KOP} до {MAX_PRICE_KOP}."
+            )
+        self._price_kop = value
 
     @staticmethod
     def _validate_price(value) -> bool:
@@ -201,25 +226,8 @@ class Detail(DetailBase):
             bool: True если валидно, False иначе
         """
         try:
-            if isinstance(value, str):
-                price = Decimal(value)
-            elif isinstance(value, (int, float, Decimal)):
-                price = Decimal(str(value))
-            else:
-                return False
-
-            # Проверка диапазона (разрешаем 0 для новых записей)
-            if price < Decimal("0.00") or price > Decimal("999999.99"):
-                return False
-
-            # Проверка количества знаков после запятой (максимум 2)
-            # Decimal('123.456').as_tuple().exponent вернет -3
-            if price.as_tuple().exponent < -2:  # type: ignore
-                return False
-
-            return True
-
-        except (ValueError, InvalidOperation):
+            return MIN_PRICE_KOP <= to_kopecks(value) <= MAX_PRICE_KOP
+        except ValueError:
             return False
 
     # ==================== МЕТОДЫ ====================
@@ -228,7 +236,7 @@ class Detail(DetailBase):
         """Строковое представление"""
         return (
             f"Деталь: {self._name} "
-            f"(артикул: {self._article}, цена: {self._price:.2f} ₽)"
+            f"(артикул: {self._article}, цена: {format_kopecks(self._price_kop)} ₽)"
         )
 
     def __eq__(self, other) -> bool:
@@ -246,7 +254,7 @@ class Detail(DetailBase):
         return (
             self._article == other._article
             and self._name == other._name
-            and self._price == other._price
+            and self._price_kop == other._price_kop
         )
 
     def to_mini(self) -> DetailMini:
@@ -262,11 +270,26 @@ class Detail(DetailBase):
         """
         Преобразование в словарь.
 
+        Цена возвращается как Decimal (точное значение, без float).
+
+        Returns:
+            dict: Словарь с полями article, name, price
+        """
+        return {
+            "article": self._article,
+            "name": self._name,
+            "price": from_kopecks(self._price_kop),
+        }
+
+    def to_json_dict(self) -> dict:
+        """
+        Преобразование в словарь для JSON: цена — точная строка ("500.50").
+
         Returns:
             dict: Словарь с полями article, name, price
         """
         return {
             "article": self._article,
             "name": self._name,
-            "price": float(self._price),  # Для JSON-сериализации
+            "price": format_kopecks(self._price_kop),
         }
@@ -0,0 +1,112 @@
+"""
+Flyweight-кэш кратких объектов (SupplierMini, DetailMini).
+
+Одинаковые пары (id, name) при повторных загрузках страниц не создаются
+и не валидируются заново, а берутся из ограниченного LRU-кэша.
+Объекты из кэша неизменяемы, поэтому их безопасно разделять.
+"""
+
+import threading
+from collections import OrderedDict
+
+from modules.models.detail_mini import DetailMini
+from modules.models.supplier_mini import SupplierMini
+
+
+class _FrozenMixin:
+    """Запрет изменения атрибутов после создания объекта"""
+
+    def __setattr__(self, key, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"{type(self).__name__} неизменяем")
+        super().__setattr__(key, value)
+
+
+class FrozenSupplierMini(_FrozenMixin, SupplierMini):
+    """Неизменяемый SupplierMini для разделения между запросами"""
+
+    def __init__(self, supplier_id: int, name: str):
+        super().__init__(supplier_id, name)
+        self._frozen = True
+
+    def __hash__(self):
+        return hash((self._supplier_id, self._name))
+
+
+class FrozenDetailMini(_FrozenMixin, DetailMini):
+    """Неизменяемый DetailMini для разделения между запросами"""
+
+    def __init__(self, article: str, name: str):
+        super().__init__(article, name)
+        self._frozen = True
+
+    def __hash__(self):
+        return hash((self._article, self._name))
+
+
+class MiniCache:
+    """
+    Ограниченный LRU-кэш кратких объектов.
+
+    Ключ — (тип, id); попадание засчитывается, только если совпадает и name,
+    т.е. фактически объект определяется парой (id, name).
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._items: OrderedDict[tuple, object] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key: tuple, name: str, factory):
+        with self._lock:
+            obj = self._items.get(key)
+            if obj is not None and obj.name == name:  # type: ignore
+                self._items.move_to_end(key)
+                self.hits += 1
+                return obj
+            self.misses += 1
+
+        obj = factory()
+        with self._lock:
+            self._items[key] = obj
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return obj
+
+    def supplier(self, supplier_id: int, name: str) -> SupplierMini:
+        """Получить (или создать) SupplierMini"""
+        return self._get(
+            ("supplier", supplier_id),
+            name,
+            lambda: FrozenSupplierMini(supplier_id, name),
+        )
+
+    def detail(self, article: str, name: str) -> DetailMini:
+        """Получить (или создать) DetailMini"""
+        return self._get(
+            ("detail", article), name, lambda: FrozenDetailMini(article, name)
+        )
+
+    def invalidate_supplier(self, supplier_id: int):
+        """Удалить поставщика из кэша (после изменения/удаления)"""
+        with self._lock:
+            self._items.pop(("supplier", supplier_id), None)
+
+    def invalidate_detail(self, article: str):
+        """Удалить деталь из кэша (после изменения/удаления)"""
+        with self._lock:
+            self._items.pop(("detail", article), None)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+# Общий кэш процесса
+mini_cache = MiniCache()
@@ -0,0 +1,70 @@
+"""
+Денежные суммы в копейках (целые числа с фиксированной точкой).
+
+Внутри моделей и в агрегатах цены хранятся как int (копейки), что даёт
+точную и быструю арифметику. Decimal используется только на границах:
+при разборе входных данных и для совместимых представлений.
+"""
+
+from decimal import Decimal, InvalidOperation
+
+KOPECKS_PER_RUBLE = 100
+
+# Диапазон цены детали: DECIMAL(10,2), от 0.00 до 999 999.99
+MIN_PRICE_KOP = 0
+MAX_PRICE_KOP = 99_999_999
+
+
+def to_kopecks(value) -> int:
+    """
+    Преобразовать сумму в рублях в копейки без потери точности.
+
+    Args:
+        value: Сумма (Decimal, int, float или str)
+
+    Returns:
+        int: Сумма в копейках
+
+    Raises:
+        ValueError: Некорректное значение или больше 2 знаков после запятой
+    """
+    if isinstance(value, bool):
+        raise ValueError(f"Неподдерживаемый тип для суммы: {type(value)}")
+    if isinstance(value, int):
+        return value * KOPECKS_PER_RUBLE
+
+    try:
+        if isinstance(value, Decimal):
+            amount = value
+        elif isinstance(value, float):
+            amount = Decimal(str(value))
+        elif isinstance(value, str):
+            amount = Decimal(value.strip())
+        else:
+            raise ValueError(f"Неподдерживаемый тип для суммы: {type(value)}")
+    except InvalidOperation:
+        raise ValueError(f"Невозможно преобразовать '{value}' в число")
+
+    if not amount.is_finite():
+        raise ValueError(f"Некорректная сумма: '{value}'")
+    if amount.as_tuple().exponent < -2:  # type: ignore
+        raise ValueError(f"Больше 2 знаков после запятой: '{value}'")
+
+    return int(amount.scaleb(2))
+
+
+def from_kopecks(kopecks: int) -> Decimal:
+    """Представление суммы в копейках как Decimal с двумя знаками"""
+    return Decimal(kopecks).scaleb(-2)
+
+
+def format_kopecks(kopecks: int) -> str:
+    """Точная строка для JSON/CSV: 50050 -> '500.50'"""
+    sign = "-" if kopecks < 0 else ""
+    rubles, kop = divmod(abs(kopecks), KOPECKS_PER_RUBLE)
+    return f"{sign}{rubles}.{kop:02d}"
+
+
+def spend_kopecks(price_kop: int, quantity: int) -> int:
+    """Стоимость закупки в копейках: цена × количество"""
+    return price_kop * quantity
@@ -3,8 +3,17 @@
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
 from typing import Any
 
+from modules.dispatch import SyncDispatcher
+
+# Общий синхронный диспетчер (поведение по умолчанию)
+_SYNC = SyncDispatcher()
+
+# Подписчики события: (все, доставляемые сразу, доставляемые диспетчером)
+Route = tuple[list["Observer"], list["Observer"], list["Observer"]]
+
 
 class Observer(ABC):
     """Абстрактный класс наблюдателя"""
@@ -24,20 +33,102 @@ class Observer(ABC):
 class Subject(ABC):
     """Абстрактный класс наблюдаемого объекта (Subject)"""
 
-    def __init__(self):
+    def __init__(self, dispatcher=None):
+        """
+        Args:
+            dispatcher: стратегия доставки событий (SyncDispatcher по умолчанию,
+                QueueDispatcher — асинхронно через очередь)
+        """
         self._observers: list[Observer] = []
+        # наблюдатель -> типы событий (None — все события)
+        self._subscriptions: dict[Observer, frozenset[str] | None] = {}
+        # наблюдатели, которым события доставляются сразу, минуя очередь
+        self._immediate: set[Observer] = set()
+        # кэш «тип события -> (подписчики, сразу, через диспетчер)»,
+        # сбрасывается при attach/detach
+        self._routes: dict[str, Route] = {}
+        self.dispatcher = dispatcher or _SYNC
+
+    def attach(
+        self,
+        observer: Observer,
+        events: Iterable[str] | None = None,
+        immediate: bool = False,
+    ):
+        """
+        Подписать наблюдателя
 
-    def attach(self, observer: Observer):
-        """Подписать наблюдателя"""
+        Args:
+            observer: наблюдатель
+            events: типы событий (None — все события); повторный вызов
+                заменяет набор событий
+            immediate: доставлять синхронно внутри notify даже при
+                асинхронном диспетчере (для счётчиков версий и т.п., которые
+                должны измениться до ответа на запрос)
+        """
         if observer not in self._observers:
             self._observers.append(observer)
+        self._subscriptions[observer] = None if events is None else frozenset(events)
+        if immediate:
+            self._immediate.add(observer)
+        else:
+            self._immediate.discard(observer)
+        self._routes = {}
 
     def detach(self, observer: Observer):
         """Отписать наблюдателя"""
         if observer in self._observers:
             self._observers.remove(observer)
+            del self._subscriptions[observer]
+            self._immediate.discard(observer)
+            self._routes = {}
+
+    def _route(self, event_type: str) -> Route:
+        route = self._routes.get(event_type)
+        if route is None:
+            observers = [
+                observer
+                for observer in self._observers
+                if self._subscriptions[observer] is None
+                or event_type in self._subscriptions[observer]
+            ]
+            route = (
+                observers,
+                [o for o in observers if o in self._immediate],
+                [o for o in observers if o not in self._immediate],
+            )
+            self._routes[event_type] = route
+        return route
+
+    def has_subscribers(self, event_type: str) -> bool:
+        """Есть ли подписчики на тип события"""
+        return bool(self._route(event_type)[0])
+
+    def _dispatch(self, route: Route, event_type: str, data: Any):
+        observers, immediate, deferred = route
+        if isinstance(self.dispatcher, SyncDispatcher):
+            # всё синхронно — сохраняем порядок подписки
+            self.dispatcher.dispatch(observers, event_type, data)
+            return
+        if immediate:
+            _SYNC.dispatch(immediate, event_type, data)
+        if deferred:
+            self.dispatcher.dispatch(deferred, event_type, data)
 
     def notify(self, event_type: str, data: Any = None):
-        """Уведомить всех наблюдателей об изменении"""
-        for observer in self._observers:
-            observer.update(event_type, data)
+        """Уведомить подписчиков события об изменении"""
+        route = self._route(event_type)
+        if route[0]:
+            self._dispatch(route, event_type, data)
+
+    def notify_lazy(self, event_type: str, factory: Callable[[], Any]):
+        """
+        Уведомить подписчиков, построив данные события только при их наличии
+
+        Args:
+            event_type: тип события
+            factory: функция без аргументов, возвращающая данные события
+        """
+        route = self._route(event_type)
+        if route[0]:
+            self._dispatch(route, event_type, factory())
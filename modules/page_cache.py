@@ -0,0 +1,187 @@
+"""
+Кэш страниц списка поставщиков
+
+DataVersion — счётчик версии данных: любое изменение репозитория (своё
+или пришедшее из другого процесса) увеличивает его. PageCache хранит
+готовые результаты страниц по полной спецификации запроса
+(страница, размер, фильтр, сортировка) и версии данных: пока данные
+не менялись, повторный запрос не обращается к БД, а одновременные
+одинаковые промахи выполняются одним запросом (SingleFlight).
+Запись живёт не дольше max_age секунд: если сообщение шины инвалидации
+потерялось, устаревшая страница не останется в кэше навсегда.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from modules.invalidation_bus import RESYNC_EVENT, Invalidation
+from modules.observer import Observer
+from modules.single_flight import SingleFlight
+from modules.stale import StaleWhileRevalidate
+
+# Предельный возраст страницы в кэше, секунды
+PAGE_MAX_AGE = 60.0
+
+
+class DataVersion(Observer):
+    """
+    Монотонный счётчик версии данных.
+    local_value — версия после последнего изменения в этом процессе:
+    страницы старше неё не отдаются даже как устаревшие (клиент должен
+    увидеть свою запись).
+    """
+
+    CHANGE_EVENTS = (
+        "item_added",
+        "item_updated",
+        "item_deleted",
+        "data_sorted",
+        RESYNC_EVENT,
+    )
+
+    def __init__(self):
+        self._value = 0
+        self.local_value = 0
+        self.changed_at = time.time()
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def bump(self, local: bool = False) -> int:
+        """Отметить изменение данных (local — изменение этого процесса)"""
+        with self._lock:
+            self._value += 1
+            if local:
+                self.local_value = self._value
+            self.changed_at = time.time()
+            return self._value
+
+    def update(self, event_type: str, data: Any = None):
+        if event_type in self.CHANGE_EVENTS:
+            # события шины — изменения других процессов
+            remote = event_type == RESYNC_EVENT or isinstance(data, Invalidation)
+            self.bump(local=not remote)
+
+
+class PageCache:
+    """
+    LRU-кэш результатов страниц, привязанный к версии данных.
+    При смене версии или по истечении max_age записи становятся
+    недействительными; с политикой stale они ещё max_stale секунд могут
+    отдаваться, пока БД не отвечает, — кроме записей, сделанных до
+    изменения данных в этом процессе.
+    """
+
+    def __init__(
+        self,
+        version: DataVersion,
+        maxsize: int = 256,
+        flight: SingleFlight | None = None,
+        stale: StaleWhileRevalidate | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        max_age: float | None = PAGE_MAX_AGE,
+    ):
+        """
+        Args:
+            version: счётчик версии данных
+            maxsize: максимальное число страниц в кэше
+            flight: объединение одновременных промахов по одному ключу
+            stale: отдавать устаревшие страницы при медленной БД
+            clock: источник времени (возраст записей)
+            max_age: предельный возраст записи в секундах (None — без предела)
+        """
+        self.version = version
+        self.maxsize = maxsize
+        self.max_age = max_age
+        self.flight = flight or SingleFlight()
+        self.stale = stale
+        self.clock = clock
+        # ключ -> (версия данных, время сохранения, результат)
+        self._items: OrderedDict[Hashable, tuple[int, float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Any],
+        cacheable: Callable[[Any], bool] = lambda result: True,
+    ) -> Any:
+        """
+        Вернуть результат из кэша или вычислить и сохранить его.
+
+        Args:
+            key: спецификация запроса
+            compute: функция получения результата
+            cacheable: сохранять ли результат (например, только успешные)
+        """
+        version = self.version.value
+        fallback = None
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is not None:
+                age = self.clock() - entry[1]
+                if entry[0] == version:
+                    if self.max_age is None or age < self.max_age:
+                        self._items.move_to_end(key)
+                        self.hits += 1
+                        return entry[2]
+                    self.expirations += 1
+                if (
+                    self.stale
+                    and age <= self.stale.max_stale
+                    and entry[0] >= self.version.local_value
+                ):
+                    fallback = (entry[2],)
+                else:
+                    del self._items[key]
+            self.misses += 1
+
+        # версия в ключе: после изменения данных новые запросы не
+        # присоединяются к вычислению, начатому по старым данным
+        flight_key = (version, key)
+        if self.stale is None:
+            result = self.flight.do(flight_key, compute)
+            self._store(version, key, result, cacheable)
+            return result
+        return self.stale.get(
+            self.flight,
+            flight_key,
+            compute,
+            lambda result: self._store(version, key, result, cacheable),
+            fallback,
+            cacheable,
+        )
+
+    def _store(self, version: int, key: Hashable, result: Any, cacheable: Callable):
+        with self._lock:
+            # данные изменились во время вычисления — результат не сохраняем
+            if version == self.version.value and cacheable(result):
+                self._items[key] = (version, self.clock(), result)
+                self._items.move_to_end(key)
+                while len(self._items) > self.maxsize:
+                    self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._items),
+                "maxsize": self.maxsize,
+                "version": self.version.value,
+                "max_age": self.max_age,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expirations": self.expirations,
+                **self.flight.stats(),
+            }
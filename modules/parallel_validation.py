@@ -0,0 +1,119 @@
+"""
+Параллельная валидация больших пакетов импорта
+
+Строки делятся на шарды и проверяются в пуле процессов (ProcessPoolExecutor).
+Правила валидации — те же, что в моделях Supplier, Detail и Purchase:
+каждая строка проходит через конструктор модели.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from modules.models.detail import Detail
+from modules.models.purchase import Purchase
+from modules.models.supplier import Supplier
+
+# Модели, доступные для валидации (по имени — чтобы не передавать классы)
+MODELS = {
+    "supplier": Supplier,
+    "detail": Detail,
+    "purchase": Purchase,
+}
+
+# Меньше этого числа строк пул процессов не окупается
+MIN_PARALLEL_ROWS = 10_000
+
+
+@dataclass
+class ValidationResult:
+    """
+    Результат валидации пакета.
+
+    Attributes:
+        valid (list[tuple[int, dict]]): Пары (индекс строки, нормализованная
+            строка) в исходном порядке
+        errors (list[tuple[int, str]]): Пары (индекс строки, текст ошибки)
+    """
+
+    valid: list[tuple[int, dict[str, Any]]] = field(default_factory=list)
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return len(self.valid) + len(self.errors)
+
+    @property
+    def records(self) -> list[dict[str, Any]]:
+        """Валидные строки без индексов"""
+        return [record for _, record in self.valid]
+
+
+def _to_record(obj) -> dict[str, Any]:
+    """Нормализованное представление валидного объекта"""
+    if isinstance(obj, Supplier):
+        return obj.to_dict(obj.supplier_id)
+    return obj.to_dict()
+
+
+def _validate_chunk(model: str, start: int, rows: list) -> ValidationResult:
+    """
+    Валидация одного шарда (выполняется в дочернем процессе).
+
+    Args:
+        model: имя модели из MODELS
+        start: индекс первой строки шарда во входных данных
+        rows: строки шарда (dict или CSV-строки)
+    """
+    cls = MODELS[model]
+    result = ValidationResult()
+    for offset, row in enumerate(rows):
+        try:
+            result.valid.append((start + offset, _to_record(cls(row))))
+        except (ValueError, TypeError) as e:
+            result.errors.append((start + offset, str(e)))
+    return result
+
+
+def validate_rows(
+    model: str,
+    rows: list,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+) -> ValidationResult:
+    """
+    Проверить строки импорта по правилам модели.
+
+    Args:
+        model: "supplier", "detail" или "purchase"
+        rows: список строк (dict или CSV-строки)
+        workers: число процессов (по умолчанию — число ядер)
+        chunk_size: размер шарда (по умолчанию — ~4 шарда на процесс)
+
+    Returns:
+        ValidationResult: валидные строки и ошибки с индексами, в исходном порядке
+    """
+    if model not in MODELS:
+        raise ValueError(f"Неизвестная модель для валидации: {model}")
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(rows) < MIN_PARALLEL_ROWS:
+        return _validate_chunk(model, 0, rows)
+
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(rows) // (workers * 4)))
+    starts = list(range(0, len(rows), chunk_size))
+
+    result = ValidationResult()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map сохраняет порядок шардов, а значит и порядок строк
+        for part in pool.map(
+            _validate_chunk,
+            [model] * len(starts),
+            starts,
+            [rows[s : s + chunk_size] for s in starts],
+        ):
+            result.valid.extend(part.valid)
+            result.errors.extend(part.errors)
+    return result
@@ -0,0 +1,59 @@
+"""
+Кэш цен деталей в копейках
+
+Цена детали по условию предметной области постоянна, поэтому агрегаты
+и индексы запрашивают её из репозитория деталей один раз на артикул.
+Отсутствие артикула в каталоге кэшируется ненадолго (MISSING_TTL):
+деталь могут добавить позже.
+"""
+
+import threading
+import time
+
+# Через сколько секунд снова искать артикул, которого нет в каталоге
+MISSING_TTL = 60.0
+
+
+class PriceCache:
+    """Цены артикулов в копейках с ленивой загрузкой из репозитория деталей"""
+
+    def __init__(self, detail_repository, missing_ttl: float = MISSING_TTL):
+        """
+        Args:
+            detail_repository: репозиторий деталей (get_by_article)
+            missing_ttl: сколько секунд помнить, что артикула нет в каталоге
+        """
+        self.detail_repository = detail_repository
+        self.missing_ttl = missing_ttl
+        self._prices: dict[str, int] = {}
+        # артикул -> момент (time.monotonic), до которого он считается отсутствующим
+        self._missing: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, article: str) -> int:
+        """Цена артикула в копейках (0, если детали нет в каталоге)"""
+        price = self._prices.get(article)
+        if price is not None:
+            return price
+        missing_until = self._missing.get(article)
+        if missing_until is not None and time.monotonic() < missing_until:
+            return 0
+        detail = self.detail_repository.get_by_article(article)
+        with self._lock:
+            if detail is None:
+                self._missing[article] = time.monotonic() + self.missing_ttl
+                return 0
+            self._missing.pop(article, None)
+            self._prices[article] = detail.price_kop
+        return detail.price_kop
+
+    def set(self, article: str, price_kop: int):
+        """Обновить цену (после изменения детали в каталоге)"""
+        with self._lock:
+            self._missing.pop(article, None)
+            self._prices[article] = price_kop
+
+    def clear(self):
+        with self._lock:
+            self._prices.clear()
+            self._missing.clear()
@@ -0,0 +1,231 @@
+"""
+Представления истории закупок в памяти
+
+Агрегаты затрат (SpendAggregates), индекс поставщиков артикулов
+(ArticleSupplierIndex) и ряды по корзинам (PurchaseRollups) строятся по
+всей истории закупок. rebuild_views строит их за один проход: при старте
+процесса история читается один раз, а не по разу на представление.
+
+Закупки, добавленные другими процессами (импорт, другие воркеры),
+представления дочитывают по отметке purchase_id (PurchaseFeed):
+refresh() читает только закупки с id выше отметки. Удаления закупок
+в других процессах refresh() не видит — их учитывает пересборка.
+"""
+
+import threading
+import time
+from collections.abc import Iterator
+from itertools import chain
+
+from modules.models.purchase import Purchase
+from modules.observer import Observer
+
+# Сколько секунд ждать закупку с пропущенным id
+GAP_TTL = 300.0
+# Сколько пропущенных id подряд запоминать (больше — сдвиг последовательности)
+MAX_GAP = 1000
+# Как часто представления подтягивают новые закупки при чтении (секунды)
+REFRESH_MAX_AGE = 60.0
+
+
+def rebuild_views(purchase_repository, *views) -> int:
+    """
+    Пересобрать представления за один проход по закупкам.
+
+    Args:
+        purchase_repository: репозиторий закупок (iter_all)
+        views: представления с методами clear() и apply(purchase)
+
+    Returns:
+        int: число учтённых закупок
+    """
+    for view in views:
+        view.clear()
+    count = 0
+    for purchase in purchase_repository.iter_all():
+        for view in views:
+            view.apply(purchase)
+        count += 1
+    return count
+
+
+class PurchaseFeed:
+    """
+    Какие закупки уже учтены представлением.
+
+    Отметка hwm_id — все id до неё учтены, кроме пропусков (gaps).
+    Идентификаторы выдаются последовательностью до фиксации транзакции,
+    поэтому закупка с меньшим id может стать видимой позже закупки с
+    большим: пропуски id ниже отметки проверяются при каждом чтении, пока
+    закупка не появится или не пройдёт GAP_TTL секунд (транзакция
+    откатилась). Закупки после отметки, учтённые по событиям своего
+    процесса (ahead), при чтении по отметке пропускаются.
+    """
+
+    def __init__(self):
+        self.hwm_id = 0
+        # пропущенный id ниже отметки -> когда замечен (time.monotonic)
+        self.gaps: dict[int, float] = {}
+        self.ahead: set[int] = set()
+
+    def counted(self, purchase_id: int) -> bool:
+        """Учтена ли закупка представлением"""
+        if purchase_id > self.hwm_id:
+            return purchase_id in self.ahead
+        return purchase_id not in self.gaps
+
+    def mark(self, purchase_id: int):
+        """Закупка учтена по событию: чтение по отметке её пропустит"""
+        if purchase_id > self.hwm_id:
+            self.ahead.add(purchase_id)
+        else:
+            self.gaps.pop(purchase_id, None)
+
+    def advance(self, purchase_id: int):
+        """Сдвинуть отметку при полной пересборке (пропусков нет)"""
+        self.hwm_id = max(self.hwm_id, purchase_id)
+
+    def fill_gaps(self, purchase_repository) -> list[Purchase]:
+        """Закупки с пропущенными id, ставшие видимыми"""
+        now = time.monotonic()
+        found = []
+        for purchase_id, seen in list(self.gaps.items()):
+            purchase = purchase_repository.get_by_id(purchase_id)
+            if purchase is not None:
+                found.append(purchase)
+            elif now - seen < GAP_TTL:
+                continue
+            del self.gaps[purchase_id]
+        return found
+
+    def after_hwm(
+        self, purchase_repository, batch_size: int = 10_000
+    ) -> Iterator[Purchase]:
+        """
+        Неучтённые закупки с purchase_id выше отметки; отметка сдвигается
+        по мере чтения, пропуски id запоминаются
+        """
+        now = time.monotonic()
+        while True:
+            batch = purchase_repository.find_after_id(self.hwm_id, batch_size)
+            for purchase in batch:
+                purchase_id = purchase.purchase_id
+                if self.hwm_id:
+                    first = max(self.hwm_id + 1, purchase_id - MAX_GAP)
+                    for missing_id in range(first, purchase_id):
+                        if missing_id not in self.ahead:
+                            self.gaps[missing_id] = now
+                self.hwm_id = purchase_id
+                if purchase_id in self.ahead:
+                    continue
+                yield purchase
+            if len(batch) < batch_size:
+                break
+        # учтённые по событиям id ниже отметки — обычные учтённые закупки
+        self.ahead = {i for i in self.ahead if i > self.hwm_id}
+
+    def clear(self):
+        self.hwm_id = 0
+        self.gaps.clear()
+        self.ahead.clear()
+
+
+class PurchaseView(Observer):
+    """
+    Представление, обновляемое инкрементально: события
+    PurchaseRepObservable своего процесса применяются сразу, закупки
+    других процессов подтягивает refresh().
+
+    Подклассы реализуют _add(purchase) и _remove(purchase) (вызываются
+    под self._lock) и сбрасывают свои данные в clear().
+    """
+
+    def __init__(self):
+        self._feed = PurchaseFeed()
+        self.refreshed_at: float | None = None
+        self._lock = threading.RLock()
+
+    @property
+    def hwm_id(self) -> int:
+        return self._feed.hwm_id
+
+    def _add(self, purchase: Purchase):
+        raise NotImplementedError
+
+    def _remove(self, purchase: Purchase):
+        raise NotImplementedError
+
+    # ==================== ОБНОВЛЕНИЕ ====================
+
+    def update(self, event_type: str, data=None):
+        """Реакция на события PurchaseRepObservable"""
+        if event_type == "item_added":
+            self._add_local([data])
+        elif event_type == "items_added":
+            self._add_local(data)
+        elif event_type == "item_deleted":
+            with self._lock:
+                # закупку, ещё не учтённую представлением, откатывать нечего
+                if self._feed.counted(data.purchase_id):
+                    self._remove(data)
+                    self._feed.ahead.discard(data.purchase_id)
+
+    def _add_local(self, purchases: list[Purchase]):
+        with self._lock:
+            for purchase in purchases:
+                if not self._feed.counted(purchase.purchase_id):
+                    self._add(purchase)
+                    self._feed.mark(purchase.purchase_id)
+
+    def apply(self, purchase: Purchase):
+        """
+        Учесть закупку при полной пересборке общим проходом по истории
+        (rebuild_views); отметка hwm_id сдвигается вперёд
+        """
+        with self._lock:
+            self._add(purchase)
+            self._feed.advance(purchase.purchase_id)
+
+    def refresh(self, purchase_repository, batch_size: int = 10_000) -> int:
+        """
+        Учесть закупки, появившиеся после отметки (и с пропущенными id).
+
+        Returns:
+            int: число учтённых закупок
+        """
+        with self._lock:
+            added = 0
+            for purchase in chain(
+                self._feed.fill_gaps(purchase_repository),
+                self._feed.after_hwm(purchase_repository, batch_size),
+            ):
+                self._add(purchase)
+                added += 1
+            self.refreshed_at = time.monotonic()
+            return added
+
+    def refresh_if_stale(
+        self, purchase_repository, max_age: float = REFRESH_MAX_AGE
+    ) -> bool:
+        """Обновить представление, если с прошлого обновления прошло max_age"""
+        if (
+            self.refreshed_at is not None
+            and time.monotonic() - self.refreshed_at < max_age
+        ):
+            return False
+        self.refresh(purchase_repository)
+        return True
+
+    def clear(self):
+        with self._lock:
+            self._feed.clear()
+            self.refreshed_at = None
+
+    def rebuild(self, purchase_repository) -> int:
+        """
+        Построить представление заново по всем закупкам репозитория.
+
+        Returns:
+            int: число учтённых закупок
+        """
+        return rebuild_views(purchase_repository, self)
@@ -0,0 +1,121 @@
+"""
+Рейтинг поставщиков по затратам (top-N)
+
+Итоги поставщиков проходят через ограниченную кучу из N элементов:
+O(P log N) по времени и O(N) по памяти, без сортировки всех поставщиков.
+Источник итогов — готовые корзины PurchaseRollups (если их границы
+совпадают с периодом) или поток закупок, упорядоченный по поставщику.
+"""
+
+import heapq
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import groupby
+
+from modules.models.money import spend_kopecks
+from modules.prices import PriceCache
+
+
+@dataclass(frozen=True)
+class SupplierTotal:
+    """
+    Итог поставщика за период.
+
+    Attributes:
+        supplier_id (int): ID поставщика
+        spend_kop (int): затраты в копейках
+        count (int): число закупок
+        units (int): количество единиц
+    """
+
+    supplier_id: int
+    spend_kop: int
+    count: int
+    units: int
+
+
+class TopN:
+    """
+    Ограниченная min-куча n лучших итогов.
+    При равных затратах выше поставщик с меньшим ID.
+    """
+
+    def __init__(self, n: int):
+        if n < 1:
+            raise ValueError("Размер рейтинга должен быть положительным")
+        self.n = n
+        self._heap: list[tuple[int, int, SupplierTotal]] = []
+
+    def push(self, total: SupplierTotal):
+        item = (total.spend_kop, -total.supplier_id, total)
+        if len(self._heap) < self.n:
+            heapq.heappush(self._heap, item)
+        elif item[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, item)
+
+    def items(self) -> list[SupplierTotal]:
+        """Итоги от большего к меньшему"""
+        return [item[2] for item in sorted(self._heap, reverse=True)]
+
+
+def top_from_totals(
+    totals: Iterable[tuple[int, int, int, int]], n: int
+) -> list[SupplierTotal]:
+    """Рейтинг по готовым итогам (supplier_id, count, units, spend_kop)"""
+    top = TopN(n)
+    for supplier_id, count, units, spend in totals:
+        top.push(SupplierTotal(supplier_id, spend, count, units))
+    return top.items()
+
+
+def top_from_rows(
+    rows: Iterable[tuple[int, str, int]], prices: PriceCache, n: int
+) -> list[SupplierTotal]:
+    """
+    Рейтинг по потоку строк (supplier_id, article, quantity).
+    Строки одного поставщика должны идти подряд — тогда в памяти
+    только итог текущего поставщика и куча.
+    """
+    top = TopN(n)
+    for supplier_id, group in groupby(rows, key=lambda row: row[0]):
+        count = units = spend = 0
+        for _, article, quantity in group:
+            count += 1
+            units += quantity
+            spend += spend_kopecks(prices.get(article), quantity)
+        top.push(SupplierTotal(supplier_id, spend, count, units))
+    return top.items()
+
+
+def top_suppliers(
+    n: int,
+    purchase_repository,
+    prices: PriceCache,
+    rollups=None,
+    date_from=None,
+    date_to=None,
+) -> list[SupplierTotal]:
+    """
+    Топ-n поставщиков по затратам за период.
+
+    Args:
+        n: размер рейтинга
+        purchase_repository: репозиторий закупок (iter_supplier_rows)
+        prices: цены артикулов
+        rollups: PurchaseRollups (опционально) — читаются, если период
+            покрывается корзинами целиком; закупки, ещё не попавшие
+            в корзины, добавляются из purchase_repository
+        date_from: начало периода (включительно)
+        date_to: конец периода (включительно)
+    """
+    if rollups is not None:
+        granularity = rollups.granularity_for(date_from, date_to)
+        if granularity is not None:
+            return top_from_totals(
+                rollups.supplier_totals(
+                    granularity, date_from, date_to, purchase_repository
+                ),
+                n,
+            )
+    rows = purchase_repository.iter_supplier_rows(date_from, date_to)
+    return top_from_rows(rows, prices, n)
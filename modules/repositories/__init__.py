@@ -3,7 +3,9 @@
 
 Репозитории реализуют паттерны:
 - Adapter (supplier_rep_DB)
-- Observer (supplier_rep_observable)
+- Observer (supplier_rep_observable, detail_rep_observable)
+- Decorator + Observer (supplier_rep_cached: кэш get_by_id)
+- Adapter (supplier_rep_async: асинхронные репозитории для ASGI)
 - Decorator (через Decorators.py)
 """
 
@@ -12,6 +14,22 @@ from .supplier_rep_json import Supplier_rep_json
 from .supplier_rep_yaml import Supplier_rep_yaml
 from .supplier_rep_DB import Supplier_rep_DB
 from .supplier_rep_observable import SupplierRepObservable
+from .supplier_rep_cached import SupplierRepCached
+from .supplier_rep_async import (
+    AsyncSupplierRepository,
+    SupplierRepAsyncDB,
+    SupplierRepAsyncFile,
+)
+from .detail_rep_base import detail_rep_base
+from .detail_rep_json import Detail_rep_json
+from .detail_rep_yaml import Detail_rep_yaml
+from .detail_rep_DB import Detail_rep_DB
+from .detail_rep_observable import DetailRepObservable
+from .purchase_rep_base import purchase_rep_base
+from .purchase_rep_json import Purchase_rep_json
+from .purchase_rep_jsonl import Purchase_rep_jsonl
+from .purchase_rep_DB import Purchase_rep_DB
+from .purchase_rep_observable import PurchaseRepObservable
 
 __all__ = [
     "supplier_rep_base",
@@ -19,5 +37,19 @@ __all__ = [
     "Supplier_rep_yaml",
     "Supplier_rep_DB",
     "SupplierRepObservable",
+    "SupplierRepCached",
+    "AsyncSupplierRepository",
+    "SupplierRepAsyncDB",
+    "SupplierRepAsyncFile",
+    "detail_rep_base",
+    "Detail_rep_json",
+    "Detail_rep_yaml",
+    "Detail_rep_DB",
+    "DetailRepObservable",
+    "purchase_rep_base",
+    "Purchase_rep_json",
+    "Purchase_rep_jsonl",
+    "Purchase_rep_DB",
+    "PurchaseRepObservable",
 ]
 
@@ -0,0 +1,135 @@
+from psycopg2.extras import execute_values
+
+from modules.DBconnection import SupplierDBConnection
+from modules.models.detail import Detail
+from modules.models.detail_mini import DetailMini
+from modules.models.mini_cache import mini_cache
+from modules.repositories.detail_rep_base import SORT_FIELDS, detail_rep_base
+
+# Таблица деталей: артикул — первичный ключ (поиск по индексу),
+# отдельные индексы для сортировки страниц по наименованию и цене
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS details (
+    article VARCHAR(50) PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    price NUMERIC(10, 2) NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS details_name_idx ON details (name, article);
+CREATE INDEX IF NOT EXISTS details_price_idx ON details (price, article);
+"""
+
+
+class Detail_rep_DB(detail_rep_base):
+    """
+    ADAPTER
+    """
+
+    def __init__(self):
+        super().__init__("")
+        self.db = SupplierDBConnection()
+
+    def load(self, file):  # абстрактный метод
+        raise NotImplementedError("load() не поддерживается для БД")
+
+    def save(self, file):  # абстрактный метод
+        raise NotImplementedError("save() не поддерживается для БД")
+
+    def create_table(self):
+        """Создать таблицу и индексы деталей (если их ещё нет)"""
+        self.db._execute_update(SCHEMA)
+
+    @staticmethod
+    def _row_to_detail(row) -> Detail:
+        return Detail(article=row[0], name=row[1], price=row[2])
+
+    # a. Получить объект по артикулу
+    def get_by_article(self, article: str) -> Detail | None:
+        query = "SELECT article, name, price FROM details WHERE article = %s;"
+        result = self.db._execute_query(query, (article,))
+        if result:
+            return self._row_to_detail(result[0])
+        return None
+
+    # b. Получить несколько объектов по артикулам одним запросом
+    def get_many(self, articles: list[str]) -> list[Detail]:
+        if not articles:
+            return []
+        query = "SELECT article, name, price FROM details WHERE article = ANY(%s);"
+        result = self.db._execute_query(query, (list(articles),))
+        found = {row[0]: row for row in result}
+        return [
+            self._row_to_detail(found[article])
+            for article in articles
+            if article in found
+        ]
+
+    # c. Получить список k по счету n объектов класса short
+    def get_k_n_short_list(
+        self, k: int, n: int, sort_field: str = "article"
+    ) -> list[DetailMini]:
+        if sort_field not in SORT_FIELDS:
+            raise ValueError(f"Поле {sort_field} не поддерживает сортировку")
+        offset = (k - 1) * n
+        query = f"""
+        SELECT article, name FROM details
+        ORDER BY {sort_field}, article
+        LIMIT %s OFFSET %s;
+        """
+        result = self.db._execute_query(query, (n, offset))
+        return [mini_cache.detail(row[0], row[1]) for row in result]
+
+    # d. Добавить объект
+    def add(self, detail: Detail):
+        self.add_many([detail])
+
+    # e. Добавить несколько объектов одним запросом
+    def add_many(self, details: list[Detail]):
+        if not details:
+            return
+        articles = [d.article for d in details]
+        if len(set(articles)) != len(articles):
+            raise ValueError("В пакете есть повторяющиеся артикулы.")
+
+        query = "SELECT article FROM details WHERE article = ANY(%s);"
+        existing = self.db._execute_query(query, (articles,))
+        if existing:
+            raise ValueError(f"Деталь с артикулом '{existing[0][0]}' уже существует.")
+
+        with self.db._cursor() as cur:
+            execute_values(
+                cur,
+                "INSERT INTO details (article, name, price) VALUES %s;",
+                [(d.article, d.name, d.price) for d in details],
+            )
+
+    # f. Заменить элемент по артикулу
+    def replace_by_article(self, article: str, detail: Detail):
+        query = """
+        UPDATE details
+        SET article = %s, name = %s, price = %s
+        WHERE article = %s;
+        """
+        self.db._execute_update(
+            query, (detail.article, detail.name, detail.price, article)
+        )
+        mini_cache.invalidate_detail(article)
+
+    # g. Удалить элемент по артикулу
+    def remove_by_article(self, article: str):
+        query = "DELETE FROM details WHERE article = %s;"
+        self.db._execute_update(query, (article,))
+        mini_cache.invalidate_detail(article)
+
+    # h. Получить количество элементов
+    def get_count(self) -> int:
+        query = "SELECT COUNT(*) FROM details;"
+        result = self.db._execute_query(query)
+        return result[0][0]
+
+    def get_all(self) -> list[Detail]:
+        query = "SELECT article, name, price FROM details;"
+        result = self.db._execute_query(query)
+        return [self._row_to_detail(row) for row in result]
+
+    def close(self):
+        return self.db._close()
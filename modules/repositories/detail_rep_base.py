@@ -0,0 +1,163 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from modules.models.detail import Detail
+from modules.models.detail_mini import DetailMini
+from modules.models.mini_cache import mini_cache
+from modules.models.money import to_kopecks
+
+# Поля, по которым поддерживается сортировка списка деталей
+SORT_FIELDS = ["article", "name", "price"]
+
+
+class detail_rep_base(ABC):
+    """
+    Файловый репозиторий деталей с индексом по артикулу.
+
+    Записи хранятся как словари {"article", "name", "price"}, где price —
+    точная строка ("500.50"). Индекс article -> позиция даёт поиск за O(1).
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.data: list[dict[str, Any]] = self._load_data()
+        self._rebuild_index()
+
+    def _load_data(self) -> list[dict[str, Any]]:
+        """Загрузка данных из файла"""
+
+        try:
+            with open(self.file_path, encoding="utf-8") as f:
+                return self.load(f)
+        except FileNotFoundError:
+            return []
+
+    def _save_data(self):
+        """Сохранение данных в файл"""
+
+        with open(self.file_path, "w", encoding="utf-8") as f:
+            self.save(f)
+
+    @abstractmethod
+    def load(self, file) -> list[dict[str, Any]]:
+        """Абстрактный метод загрузки данных из файла"""
+        pass
+
+    @abstractmethod
+    def save(self, file):
+        """Абстрактный метод сохранения данных в файл"""
+        pass
+
+    # ==================== ИНДЕКСЫ ====================
+
+    def _rebuild_index(self):
+        """Пересобрать индекс article -> позиция в self.data"""
+        self._index: dict[str, int] = {
+            item["article"]: i for i, item in enumerate(self.data)
+        }
+        self._sorted: dict[str, list[dict[str, Any]]] = {}
+
+    def _sorted_by(self, field: str) -> list[dict[str, Any]]:
+        """Отсортированный список записей (кэшируется до первого изменения)"""
+        if field not in SORT_FIELDS:
+            raise ValueError(f"Поле {field} не поддерживает сортировку")
+        if field not in self._sorted:
+            if field == "price":
+                key = lambda x: (to_kopecks(x["price"]), x["article"])  # noqa: E731
+            else:
+                key = lambda x: (x[field], x["article"])  # noqa: E731
+            self._sorted[field] = sorted(self.data, key=key)
+        return self._sorted[field]
+
+    @staticmethod
+    def _to_record(detail: Detail) -> dict[str, Any]:
+        return detail.to_json_dict()
+
+    # a. Чтение всех значений из файла
+    def get_all(self) -> list[Detail]:
+        return [Detail(item) for item in self.data]
+
+    # b. Запись всех значений в файл
+    def save_all(self, details: list[Detail]):
+        self.data = [self._to_record(d) for d in details]
+        self._rebuild_index()
+        self._save_data()
+        mini_cache.clear()
+
+    # c. Получить объект по артикулу (O(1))
+    def get_by_article(self, article: str) -> Detail | None:
+        pos = self._index.get(article)
+        if pos is None:
+            return None
+        return Detail(self.data[pos])
+
+    # d. Получить несколько объектов по артикулам (в порядке запроса)
+    def get_many(self, articles: list[str]) -> list[Detail]:
+        result = []
+        for article in articles:
+            pos = self._index.get(article)
+            if pos is not None:
+                result.append(Detail(self.data[pos]))
+        return result
+
+    # e. Получить список k по счету n объектов класса short
+    def get_k_n_short_list(
+        self, k: int, n: int, sort_field: str = "article"
+    ) -> list[DetailMini]:
+        start = (k - 1) * n
+        items = self._sorted_by(sort_field)[start : start + n]
+        return [mini_cache.detail(item["article"], item["name"]) for item in items]
+
+    # f. Добавить объект в список
+    def add(self, detail: Detail):
+        self.add_many([detail])
+
+    # g. Добавить несколько объектов за одну запись в файл
+    def add_many(self, details: list[Detail]):
+        seen = set()
+        for detail in details:
+            if detail.article in self._index or detail.article in seen:
+                raise ValueError(
+                    f"Деталь с артикулом '{detail.article}' уже существует."
+                )
+            seen.add(detail.article)
+
+        for detail in details:
+            self._index[detail.article] = len(self.data)
+            self.data.append(self._to_record(detail))
+        self._sorted.clear()
+        self._save_data()
+
+    # h. Заменить элемент по артикулу
+    def replace_by_article(self, article: str, detail: Detail):
+        pos = self._index.get(article)
+        if pos is None:
+            raise ValueError(f"Деталь с артикулом {article} не найдена")
+        if detail.article != article and detail.article in self._index:
+            raise ValueError(f"Деталь с артикулом '{detail.article}' уже существует.")
+
+        del self._index[article]
+        self.data[pos] = self._to_record(detail)
+        self._index[detail.article] = pos
+        self._sorted.clear()
+        self._save_data()
+        mini_cache.invalidate_detail(article)
+
+    # i. Удалить элемент по артикулу
+    def remove_by_article(self, article: str):
+        pos = self._index.pop(article, None)
+        if pos is None:
+            raise ValueError(f"Деталь с артикулом {article} не найдена")
+
+        # Последняя запись переносится на место удалённой — O(1)
+        last = self.data.pop()
+        if pos < len(self.data):
+            self.data[pos] = last
+            self._index[last["article"]] = pos
+        self._sorted.clear()
+        self._save_data()
+        mini_cache.invalidate_detail(article)
+
+    # j. Получить количество элементов
+    def get_count(self) -> int:
+        return len(self.data)
@@ -0,0 +1,17 @@
+import json
+from typing import Any
+
+from modules.repositories.detail_rep_base import detail_rep_base
+
+
+class Detail_rep_json(detail_rep_base):
+    """Класс для работы с деталями в JSON"""
+
+    def load(self, file) -> list[dict[str, Any]]:
+        content = file.read()
+        if content.strip():
+            return json.loads(content)
+        return []
+
+    def save(self, file):
+        json.dump(self.data, file, ensure_ascii=False, indent=2)
@@ -0,0 +1,70 @@
+"""
+Observable репозиторий деталей
+Уведомляет наблюдателей об изменениях каталога (цены в индексах закупок)
+"""
+
+from modules.models.detail import Detail
+from modules.models.detail_mini import DetailMini
+from modules.observer import Subject
+from modules.repositories.detail_rep_base import detail_rep_base
+
+
+class DetailRepObservable(Subject):
+    """
+    Обёртка над репозиторием деталей с поддержкой паттерна Observer
+
+    События:
+    - item_added: Detail
+    - items_added: list[Detail] (пакетное добавление)
+    - item_updated: Detail (новое состояние детали)
+    - item_deleted: str (артикул; при смене артикула в replace_by_article
+      старый артикул приходит как удалённый)
+    """
+
+    def __init__(self, repository: detail_rep_base, dispatcher=None):
+        super().__init__(dispatcher)
+        self.repository = repository
+
+    def get_all(self) -> list[Detail]:
+        """Получить все детали"""
+        return self.repository.get_all()
+
+    def get_by_article(self, article: str) -> Detail | None:
+        """Получить деталь по артикулу"""
+        return self.repository.get_by_article(article)
+
+    def get_many(self, articles: list[str]) -> list[Detail]:
+        """Получить несколько деталей по списку артикулов"""
+        return self.repository.get_many(articles)
+
+    def get_k_n_short_list(
+        self, k: int, n: int, sort_field: str = "article"
+    ) -> list[DetailMini]:
+        """Получить список k по счету n объектов класса short"""
+        return self.repository.get_k_n_short_list(k, n, sort_field)
+
+    def add(self, detail: Detail):
+        """Добавить деталь"""
+        self.repository.add(detail)
+        self.notify("item_added", detail)
+
+    def add_many(self, details: list[Detail]):
+        """Добавить пакет деталей"""
+        self.repository.add_many(details)
+        self.notify("items_added", details)
+
+    def replace_by_article(self, article: str, detail: Detail):
+        """Заменить деталь по артикулу"""
+        self.repository.replace_by_article(article, detail)
+        if detail.article != article:
+            self.notify("item_deleted", article)
+        self.notify("item_updated", detail)
+
+    def remove_by_article(self, article: str):
+        """Удалить деталь по артикулу"""
+        self.repository.remove_by_article(article)
+        self.notify("item_deleted", article)
+
+    def get_count(self) -> int:
+        """Получить количество элементов"""
+        return self.repository.get_count()
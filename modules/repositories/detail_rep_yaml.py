@@ -0,0 +1,18 @@
+from typing import Any
+
+import yaml
+
+from modules.repositories.detail_rep_base import detail_rep_base
+
+
+class Detail_rep_yaml(detail_rep_base):
+    """Класс для работы с деталями в YAML"""
+
+    def load(self, file) -> list[dict[str, Any]]:
+        content = file.read()
+        if content.strip():
+            return yaml.safe_load(content)
+        return []
+
+    def save(self, file):
+        yaml.dump(self.data, file, allow_unicode=True)
@@ -0,0 +1,187 @@
+from datetime import date
+
+from psycopg2.extras import execute_values
+
+from modules.DBconnection import SupplierDBConnection
+from modules.models.purchase import Purchase
+from modules.repositories.purchase_rep_base import purchase_rep_base
+
+# Таблица закупок. Составные индексы (поле, дата, id) покрывают запросы
+# «закупки поставщика/артикула за период» и keyset-пагинацию по (дата, id).
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS purchases (
+    purchase_id BIGSERIAL PRIMARY KEY,
+    supplier_id INTEGER NOT NULL REFERENCES suppliers (supplier_id),
+    article VARCHAR(50) NOT NULL,
+    quantity INTEGER NOT NULL CHECK (quantity BETWEEN 1 AND 10000),
+    purchase_date DATE NOT NULL
+);
+CREATE INDEX IF NOT EXISTS purchases_supplier_date_idx
+    ON purchases (supplier_id, purchase_date, purchase_id);
+CREATE INDEX IF NOT EXISTS purchases_article_date_idx
+    ON purchases (article, purchase_date, purchase_id);
+CREATE INDEX IF NOT EXISTS purchases_date_idx
+    ON purchases (purchase_date, purchase_id);
+"""
+
+COLUMNS = "purchase_id, supplier_id, article, quantity, purchase_date"
+
+
+class Purchase_rep_DB(purchase_rep_base):
+    """
+    ADAPTER
+    """
+
+    def __init__(self):
+        super().__init__("")
+        self.db = SupplierDBConnection()
+
+    def load(self, file):  # абстрактный метод
+        raise NotImplementedError("load() не поддерживается для БД")
+
+    def save(self, file):  # абстрактный метод
+        raise NotImplementedError("save() не поддерживается для БД")
+
+    def create_table(self):
+        """Создать таблицу и индексы закупок (если их ещё нет)"""
+        self.db._execute_update(SCHEMA)
+
+    @staticmethod
+    def _row_to_purchase(row) -> Purchase:
+        return Purchase(row[0], row[1], row[2], row[3], row[4])
+
+    def get_all(self) -> list[Purchase]:
+        query = f"SELECT {COLUMNS} FROM purchases ORDER BY purchase_id;"
+        result = self.db._execute_query(query)
+        return [self._row_to_purchase(row) for row in result]
+
+    # a. Получить объект по ID
+    def get_by_id(self, purchase_id: int) -> Purchase | None:
+        query = f"SELECT {COLUMNS} FROM purchases WHERE purchase_id = %s;"
+        result = self.db._execute_query(query, (purchase_id,))
+        if result:
+            return self._row_to_purchase(result[0])
+        return None
+
+    # b. Поиск по индексам с диапазоном дат и keyset-пагинацией
+    def find(
+        self,
+        supplier_id: int | None = None,
+        article: str | None = None,
+        date_from: date | str | None = None,
+        date_to: date | str | None = None,
+        after: tuple[date | str, int] | None = None,
+        limit: int = 100,
+    ) -> list[Purchase]:
+        conditions = []
+        params: list = []
+
+        if supplier_id is not None:
+            conditions.append("supplier_id = %s")
+            params.append(supplier_id)
+        if article is not None:
+            conditions.append("article = %s")
+            params.append(article)
+        if date_from is not None:
+            conditions.append("purchase_date >= %s")
+            params.append(date_from)
+        if date_to is not None:
+            conditions.append("purchase_date <= %s")
+            params.append(date_to)
+        if after is not None:
+            # Keyset: строки строго после курсора, без OFFSET
+            conditions.append("(purchase_date, purchase_id) > (%s, %s)")
+            params.extend(after)
+
+        query = f"SELECT {COLUMNS} FROM purchases"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY purchase_date, purchase_id LIMIT %s;"
+        params.append(limit)
+
+        result = self.db._execute_query(query, tuple(params))
+        return [self._row_to_purchase(row) for row in result]
+
+    # c. Закупки с purchase_id больше заданного (по первичному ключу)
+    def find_after_id(
+        self,
+        purchase_id: int,
+        limit: int = 10_000,
+        supplier_id: int | None = None,
+        date_from: date | str | None = None,
+        date_to: date | str | None = None,
+    ) -> list[Purchase]:
+        conditions = ["purchase_id > %s"]
+        params: list = [purchase_id]
+        if supplier_id is not None:
+            conditions.append("supplier_id = %s")
+            params.append(supplier_id)
+        if date_from is not None:
+            conditions.append("purchase_date >= %s")
+            params.append(date_from)
+        if date_to is not None:
+            conditions.append("purchase_date <= %s")
+            params.append(date_to)
+        query = (
+            f"SELECT {COLUMNS} FROM purchases WHERE {' AND '.join(conditions)} "
+            "ORDER BY purchase_id LIMIT %s;"
+        )
+        params.append(limit)
+        result = self.db._execute_query(query, tuple(params))
+        return [self._row_to_purchase(row) for row in result]
+
+    # d. Построчный обход через серверный курсор
+    def iter_rows(self, batch_size: int = 10_000):
+        query = f"SELECT {COLUMNS} FROM purchases ORDER BY purchase_id;"
+        return self.db._iter_query(query, itersize=batch_size)
+
+    # e. Строки за период подряд по поставщикам (индекс supplier_id, дата)
+    def iter_supplier_rows(
+        self, date_from: date | str | None = None, date_to: date | str | None = None
+    ):
+        conditions = []
+        params: list = []
+        if date_from is not None:
+            conditions.append("purchase_date >= %s")
+            params.append(date_from)
+        if date_to is not None:
+            conditions.append("purchase_date <= %s")
+            params.append(date_to)
+        query = "SELECT supplier_id, article, quantity FROM purchases"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY supplier_id;"
+        return self.db._iter_query(query, tuple(params))
+
+    # f. Пакетное добавление одним запросом
+    def add_many(self, purchases: list[Purchase]):
+        if not purchases:
+            return
+        with self.db._cursor() as cur:
+            ids = execute_values(
+                cur,
+                "INSERT INTO purchases "
+                "(supplier_id, article, quantity, purchase_date) "
+                "VALUES %s RETURNING purchase_id;",
+                [
+                    (p.supplier_id, p.article, p.quantity, p.purchase_date)
+                    for p in purchases
+                ],
+                fetch=True,
+            )
+        for purchase, row in zip(purchases, ids):
+            purchase.purchase_id = row[0]
+
+    # g. Удалить элемент по ID
+    def remove_by_id(self, purchase_id: int):
+        query = "DELETE FROM purchases WHERE purchase_id = %s;"
+        self.db._execute_update(query, (purchase_id,))
+
+    # h. Получить количество элементов
+    def get_count(self) -> int:
+        query = "SELECT COUNT(*) FROM purchases;"
+        result = self.db._execute_query(query)
+        return result[0][0]
+
+    def close(self):
+        return self.db._close()
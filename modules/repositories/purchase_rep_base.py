@@ -0,0 +1,322 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterator
+from datetime import date
+from typing import Any
+
+from modules.models.purchase import Purchase
+
+# Ключ индекса: (дата в ISO-формате, purchase_id).
+# ISO-строки сортируются так же, как даты, поэтому ключи сравниваются напрямую.
+IndexKey = tuple[str, int]
+
+# Порядок колонок в строках iter_rows (и в экспорте)
+PURCHASE_COLUMNS = (
+    "purchase_id",
+    "supplier_id",
+    "article",
+    "quantity",
+    "purchase_date",
+)
+
+
+def date_key(value: date | str) -> str:
+    """Дата (date или строка YYYY-MM-DD) -> строка ISO для индексов"""
+    if isinstance(value, date):
+        return value.isoformat()
+    return date.fromisoformat(value).isoformat()
+
+
+class purchase_rep_base(ABC):
+    """
+    Файловый репозиторий закупок с индексами в памяти.
+
+    Индексы:
+    - purchase_id -> запись
+    - supplier_id -> отсортированный список (дата, purchase_id)
+    - article -> отсортированный список (дата, purchase_id)
+    - общий отсортированный список (дата, purchase_id)
+    - отсортированный список purchase_id (чтение новых закупок после id)
+    - supplier_id -> отсортированный список purchase_id
+
+    Диапазоны дат и keyset-пагинация (after=(дата, id)) обходятся
+    двоичным поиском по индексу, без полного просмотра закупок.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._rebuild_index(self._load_data())
+
+    def _load_data(self) -> list[dict[str, Any]]:
+        """Загрузка данных из файла"""
+
+        try:
+            with open(self.file_path, encoding="utf-8") as f:
+                return self.load(f)
+        except FileNotFoundError:
+            return []
+
+    def _save_data(self):
+        """Сохранение данных в файл"""
+
+        with open(self.file_path, "w", encoding="utf-8") as f:
+            self.save(f)
+
+    def _append_data(self, records: list[dict[str, Any]]):
+        """
+        Дописать новые записи в файл.
+        По умолчанию файл перезаписывается целиком; форматы с построчным
+        хранением переопределяют метод и дописывают только новые строки.
+        """
+        self._save_data()
+
+    def _remove_data(self, record: dict[str, Any]):
+        """
+        Отразить удаление записи в файле.
+        По умолчанию файл перезаписывается целиком; форматы с построчным
+        хранением переопределяют метод и дописывают отметку удаления.
+        """
+        self._save_data()
+
+    @abstractmethod
+    def load(self, file) -> list[dict[str, Any]]:
+        """Абстрактный метод загрузки данных из файла"""
+        pass
+
+    @abstractmethod
+    def save(self, file):
+        """Абстрактный метод сохранения данных в файл"""
+        pass
+
+    @property
+    def data(self) -> list[dict[str, Any]]:
+        """Все записи в порядке добавления"""
+        return list(self._by_id.values())
+
+    # ==================== ИНДЕКСЫ ====================
+
+    def _rebuild_index(self, records: list[dict[str, Any]]):
+        # Списки заполняются добавлением в конец и сортируются один раз:
+        # insort на каждую запись дал бы O(n²) сдвигов при загрузке
+        self._by_id: dict[int, dict[str, Any]] = {}
+        self._by_supplier: dict[int, list[IndexKey]] = {}
+        self._by_article: dict[str, list[IndexKey]] = {}
+        self._by_date: list[IndexKey] = []
+        self._ids: list[int] = []
+        self._supplier_ids: dict[int, list[int]] = {}
+        for record in records:
+            key = (record["purchase_date"], record["purchase_id"])
+            self._by_id[record["purchase_id"]] = record
+            self._by_supplier.setdefault(record["supplier_id"], []).append(key)
+            self._by_article.setdefault(record["article"], []).append(key)
+            self._by_date.append(key)
+            self._ids.append(record["purchase_id"])
+            self._supplier_ids.setdefault(record["supplier_id"], []).append(
+                record["purchase_id"]
+            )
+        for keys in (
+            *self._by_supplier.values(),
+            *self._by_article.values(),
+            *self._supplier_ids.values(),
+        ):
+            keys.sort()
+        self._by_date.sort()
+        self._ids.sort()
+        self._next_id = self._ids[-1] + 1 if self._ids else 1
+
+    def _index_record(self, record: dict[str, Any]):
+        key = (record["purchase_date"], record["purchase_id"])
+        self._by_id[record["purchase_id"]] = record
+        insort(self._by_supplier.setdefault(record["supplier_id"], []), key)
+        insort(self._by_article.setdefault(record["article"], []), key)
+        insort(self._by_date, key)
+        insort(self._ids, record["purchase_id"])
+        insort(
+            self._supplier_ids.setdefault(record["supplier_id"], []),
+            record["purchase_id"],
+        )
+        self._next_id = max(self._next_id, record["purchase_id"] + 1)
+
+    def _unindex_record(self, record: dict[str, Any]):
+        key = (record["purchase_date"], record["purchase_id"])
+        for keys in (
+            self._by_supplier[record["supplier_id"]],
+            self._by_article[record["article"]],
+            self._by_date,
+        ):
+            del keys[bisect_left(keys, key)]
+        for ids in (self._ids, self._supplier_ids[record["supplier_id"]]):
+            del ids[bisect_left(ids, record["purchase_id"])]
+        del self._by_id[record["purchase_id"]]
+
+    @staticmethod
+    def _to_record(purchase: Purchase) -> dict[str, Any]:
+        return purchase.to_dict()
+
+    # a. Чтение всех значений
+    def get_all(self) -> list[Purchase]:
+        return [Purchase(item) for item in self._by_id.values()]
+
+    # b. Получить объект по ID
+    def get_by_id(self, purchase_id: int) -> Purchase | None:
+        record = self._by_id.get(purchase_id)
+        if record is None:
+            return None
+        return Purchase(record)
+
+    # c. Поиск по индексам с диапазоном дат и keyset-пагинацией
+    def find(
+        self,
+        supplier_id: int | None = None,
+        article: str | None = None,
+        date_from: date | str | None = None,
+        date_to: date | str | None = None,
+        after: tuple[date | str, int] | None = None,
+        limit: int = 100,
+    ) -> list[Purchase]:
+        """
+        Найти закупки, упорядоченные по (дата, purchase_id).
+
+        Args:
+            supplier_id: фильтр по поставщику
+            article: фильтр по артикулу
+            date_from: начало периода (включительно)
+            date_to: конец периода (включительно)
+            after: курсор (дата, purchase_id) последней строки предыдущей страницы
+            limit: размер страницы
+
+        Returns:
+            list[Purchase]: страница закупок
+        """
+        if supplier_id is not None:
+            keys = self._by_supplier.get(supplier_id, [])
+        elif article is not None:
+            keys = self._by_article.get(article, [])
+        else:
+            keys = self._by_date
+
+        start = 0
+        if date_from is not None:
+            start = bisect_left(keys, (date_key(date_from), -1))
+        if after is not None:
+            start = max(start, bisect_right(keys, (date_key(after[0]), after[1])))
+        end = len(keys)
+        if date_to is not None:
+            end = bisect_right(keys, (date_key(date_to), float("inf")))
+
+        result = []
+        for i in range(start, end):
+            record = self._by_id[keys[i][1]]
+            if article is not None and record["article"] != article:
+                continue
+            result.append(Purchase(record))
+            if len(result) >= limit:
+                break
+        return result
+
+    # d. Закупки с purchase_id больше заданного (по возрастанию id)
+    def find_after_id(
+        self,
+        purchase_id: int,
+        limit: int = 10_000,
+        supplier_id: int | None = None,
+        date_from: date | str | None = None,
+        date_to: date | str | None = None,
+    ) -> list[Purchase]:
+        """
+        Закупки с purchase_id больше заданного, по возрастанию id.
+        Фильтры по поставщику и датам применяются до limit, поэтому
+        страницы обходятся курсором — id последней закупки страницы.
+        """
+        ids = (
+            self._ids
+            if supplier_id is None
+            else self._supplier_ids.get(supplier_id, [])
+        )
+        start = bisect_right(ids, purchase_id)
+        if date_from is None and date_to is None:
+            return [Purchase(self._by_id[i]) for i in ids[start : start + limit]]
+
+        # Обход по возрастанию id с позиции курсора до limit совпадений:
+        # следующая страница продолжает с места, где остановилась эта
+        first = date_key(date_from) if date_from is not None else None
+        last = date_key(date_to) if date_to is not None else None
+        result = []
+        for i in range(start, len(ids)):
+            record = self._by_id[ids[i]]
+            day = record["purchase_date"]
+            if (first is not None and day < first) or (last is not None and day > last):
+                continue
+            result.append(Purchase(record))
+            if len(result) >= limit:
+                break
+        return result
+
+    # e. Обход всех закупок страницами (постоянная память)
+    def iter_all(self, batch_size: int = 10_000) -> Iterator[Purchase]:
+        after = None
+        while True:
+            page = self.find(after=after, limit=batch_size)
+            yield from page
+            if len(page) < batch_size:
+                return
+            after = (page[-1].purchase_date, page[-1].purchase_id)
+
+    # f. Построчный обход по возрастанию id (кортежи PURCHASE_COLUMNS)
+    def iter_rows(self, batch_size: int = 10_000) -> Iterator[tuple]:
+        # Курсор — последний выданный id, поэтому добавления и удаления
+        # во время обхода не ломают его
+        last_id = 0
+        while True:
+            start = bisect_right(self._ids, last_id)
+            batch = self._ids[start : start + batch_size]
+            for purchase_id in batch:
+                record = self._by_id.get(purchase_id)
+                if record is not None:
+                    yield tuple(record[column] for column in PURCHASE_COLUMNS)
+            if len(batch) < batch_size:
+                return
+            last_id = batch[-1]
+
+    # g. Строки (supplier_id, article, quantity) за период подряд по поставщикам
+    def iter_supplier_rows(
+        self, date_from: date | str | None = None, date_to: date | str | None = None
+    ) -> Iterator[tuple[int, str, int]]:
+        for supplier_id in sorted(self._by_supplier):
+            keys = self._by_supplier[supplier_id]
+            start = 0
+            if date_from is not None:
+                start = bisect_left(keys, (date_key(date_from), -1))
+            end = len(keys)
+            if date_to is not None:
+                end = bisect_right(keys, (date_key(date_to), float("inf")))
+            for _, purchase_id in keys[start:end]:
+                record = self._by_id[purchase_id]
+                yield supplier_id, record["article"], record["quantity"]
+
+    # h. Добавить объект (с новым ID)
+    def add(self, purchase: Purchase):
+        self.add_many([purchase])
+
+    # i. Пакетное добавление (одна запись в файл на пакет)
+    def add_many(self, purchases: list[Purchase]):
+        records = []
+        for purchase in purchases:
+            purchase.purchase_id = self._next_id
+            record = self._to_record(purchase)
+            self._index_record(record)
+            records.append(record)
+        if records:
+            self._append_data(records)
+
+    # j. Удалить элемент по ID
+    def remove_by_id(self, purchase_id: int):
+        record = self._by_id.get(purchase_id)
+        if record is None:
+            raise ValueError(f"Закупка с ID {purchase_id} не найдена")
+        self._unindex_record(record)
+        self._remove_data(record)
+
+    # k. Получить количество элементов
+    def get_count(self) -> int:
+        return len(self._by_id)
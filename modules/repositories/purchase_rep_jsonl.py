@@ -0,0 +1,53 @@
+import json
+from typing import Any
+
+from modules.repositories.purchase_rep_base import purchase_rep_base
+
+# Строка-отметка удаления: {"deleted": purchase_id}
+DELETED = "deleted"
+
+
+class Purchase_rep_jsonl(purchase_rep_base):
+    """
+    Класс для работы с закупками в JSON Lines (одна закупка — одна строка).
+    Новые закупки дописываются в конец файла, без перезаписи истории.
+    Удаление дописывает отметку {"deleted": id}; файл сжимается
+    (перезаписывается без удалённых), когда отметок больше, чем записей.
+    """
+
+    # Число отметок удаления в файле
+    _tombstones = 0
+
+    def load(self, file) -> list[dict[str, Any]]:
+        # Строки применяются по порядку: отметка удаляет только записи
+        # выше неё (после перезагрузки id удалённой записи может вернуться)
+        records: dict[int, dict[str, Any]] = {}
+        self._tombstones = 0
+        for line in file:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if DELETED in record:
+                records.pop(record[DELETED], None)
+                self._tombstones += 1
+            else:
+                records[record["purchase_id"]] = record
+        return list(records.values())
+
+    def save(self, file):
+        for record in self.data:
+            file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._tombstones = 0
+
+    def _append_data(self, records: list[dict[str, Any]]):
+        with open(self.file_path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def _remove_data(self, record: dict[str, Any]):
+        if self._tombstones + 1 > self.get_count():
+            self._save_data()
+            return
+        with open(self.file_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({DELETED: record["purchase_id"]}) + "\n")
+        self._tombstones += 1
@@ -0,0 +1,70 @@
+"""
+Observable репозиторий закупок
+Уведомляет наблюдателей о добавлении и удалении закупок
+"""
+
+from modules.models.purchase import Purchase
+from modules.observer import Subject
+from modules.repositories.purchase_rep_base import purchase_rep_base
+
+
+class PurchaseRepObservable(Subject):
+    """
+    Обёртка над репозиторием закупок с поддержкой паттерна Observer
+
+    События:
+    - item_added: Purchase
+    - items_added: list[Purchase] (пакетное добавление)
+    - item_deleted: Purchase (удалённая закупка целиком, а не только ID,
+      чтобы наблюдатели могли откатить её вклад в агрегаты)
+    """
+
+    def __init__(self, repository: purchase_rep_base, dispatcher=None):
+        super().__init__(dispatcher)
+        self.repository = repository
+
+    def get_by_id(self, purchase_id: int) -> Purchase | None:
+        """Получить закупку по ID"""
+        return self.repository.get_by_id(purchase_id)
+
+    def find(self, *args, **kwargs) -> list[Purchase]:
+        """Поиск закупок (см. purchase_rep_base.find)"""
+        return self.repository.find(*args, **kwargs)
+
+    def find_after_id(self, purchase_id: int, limit: int = 10_000, **filters):
+        """Закупки с purchase_id больше заданного (см. purchase_rep_base)"""
+        return self.repository.find_after_id(purchase_id, limit, **filters)
+
+    def iter_all(self, batch_size: int = 10_000):
+        """Обход всех закупок страницами"""
+        return self.repository.iter_all(batch_size)
+
+    def iter_rows(self, batch_size: int = 10_000):
+        """Построчный обход для экспорта"""
+        return self.repository.iter_rows(batch_size)
+
+    def iter_supplier_rows(self, date_from=None, date_to=None):
+        """Строки (supplier_id, article, quantity) подряд по поставщикам"""
+        return self.repository.iter_supplier_rows(date_from, date_to)
+
+    def add(self, purchase: Purchase):
+        """Добавить закупку"""
+        self.repository.add(purchase)
+        self.notify("item_added", purchase)
+
+    def add_many(self, purchases: list[Purchase]):
+        """Добавить пакет закупок"""
+        self.repository.add_many(purchases)
+        self.notify("items_added", purchases)
+
+    def remove_by_id(self, purchase_id: int):
+        """Удалить закупку по ID"""
+        purchase = self.repository.get_by_id(purchase_id)
+        if purchase is None:
+            raise ValueError(f"Закупка с ID {purchase_id} не найдена")
+        self.repository.remove_by_id(purchase_id)
+        self.notify("item_deleted", purchase)
+
+    def get_count(self) -> int:
+        """Получить количество элементов"""
+        return self.repository.get_count()
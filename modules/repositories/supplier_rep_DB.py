@@ -1,4 +1,5 @@
 from modules.DBconnection import SupplierDBConnection
+from modules.models.mini_cache import mini_cache
 from modules.models.supplier import Supplier
 from modules.models.supplier_mini import SupplierMini
 from modules.repositories.supplier_rep_base import supplier_rep_base
@@ -33,6 +34,21 @@ class Supplier_rep_DB(supplier_rep_base):
             )
         return None
 
+    # a1. Получить несколько объектов по списку ID одним запросом
+    def get_many(self, supplier_ids: list[int]) -> list[Supplier]:
+        if not supplier_ids:
+            return []
+        query = (
+            "SELECT supplier_id, name, phone, address "
+            "FROM suppliers WHERE supplier_id = ANY(%s);"
+        )
+        result = self.db._execute_query(query, (list(supplier_ids),))
+        found = {row[0]: row for row in result}
+        return [
+            Supplier(name=row[1], phone=row[2], address=row[3], supplier_id=row[0])
+            for row in (found[i] for i in supplier_ids if i in found)
+        ]
+
     # b. Получить список k по счету n объектов класса short
     def get_k_n_short_list(self, k: int, n: int) -> list[SupplierMini]:
         offset = (k - 1) * n
@@ -42,7 +58,7 @@ class Supplier_rep_DB(supplier_rep_base):
         LIMIT %s OFFSET %s;
         """
         result = self.db._execute_query(query, (n, offset))
-        return [SupplierMini(supplier_id=row[0], name=row[1]) for row in result]
+        return [mini_cache.supplier(row[0], row[1]) for row in result]
 
     # c. Добавить объект в список (с новым ID)
     def add(self, supplier: Supplier):
@@ -60,7 +76,7 @@ class Supplier_rep_DB(supplier_rep_base):
             VALUES (%s, %s, %s)
             RETURNING supplier_id;
         """
-        with self.db.conn.cursor() as cur:
+        with self.db._cursor() as cur:
             cur.execute(query, (supplier.name, supplier.phone, supplier.address))
             new_id = cur.fetchone()[0]
             supplier.supplier_id = new_id
@@ -75,11 +91,13 @@ class Supplier_rep_DB(supplier_rep_base):
         self.db._execute_update(
             query, (supplier.name, supplier.phone, supplier.address, supplier_id)
         )
+        mini_cache.invalidate_supplier(supplier_id)
 
     # e. Удалить элемент списка по ID
     def remove_by_id(self, supplier_id: int):
         query = "DELETE FROM suppliers WHERE supplier_id = %s;"
         self.db._execute_update(query, (supplier_id,))
+        mini_cache.invalidate_supplier(supplier_id)
 
     # f. Получить количество элементов
     def get_count(self) -> int:
@@ -98,5 +116,12 @@ class Supplier_rep_DB(supplier_rep_base):
             list_of_Suppliers.append(s)
         return list_of_Suppliers
 
+    def iter_rows(self, batch_size: int = 10_000):
+        query = (
+            "SELECT supplier_id, name, phone, address "
+            "FROM suppliers ORDER BY supplier_id;"
+        )
+        return self.db._iter_query(query, itersize=batch_size)
+
     def close(self):
         return self.db._close()
@@ -0,0 +1,269 @@
+"""
+Асинхронные репозитории поставщиков (для ASGI-приложения)
+
+Ожидание БД или файла не занимает поток ОС: один процесс с циклом
+событий держит тысячи одновременных подключений.
+
+- AsyncSupplierRepository — протокол асинхронного репозитория
+- SupplierRepAsyncDB — PostgreSQL через asyncpg (пул соединений)
+- SupplierRepAsyncFile — файловые репозитории (JSON/YAML) через
+  asyncio.to_thread
+"""
+
+import asyncio
+from typing import Protocol
+
+from modules.DBconnection import current_statement_timeout, params
+from modules.models.mini_cache import mini_cache
+from modules.models.supplier import Supplier
+from modules.models.supplier_mini import SupplierMini
+from modules.repositories.supplier_rep_base import supplier_rep_base
+
+try:
+    import asyncpg
+except ImportError:  # asyncpg нужен только SupplierRepAsyncDB
+    asyncpg = None
+
+FILTER_FIELDS = ("name", "phone", "address")
+SORT_FIELDS = ("supplier_id", "name", "phone", "address")
+
+
+def check_fields(filter_field: str | None, sort_field: str | None = None):
+    """Поля фильтра и сортировки подставляются в SQL — только из списка"""
+    if filter_field and filter_field not in FILTER_FIELDS:
+        raise ValueError(f"Поле {filter_field} не поддерживается для фильтрации")
+    if sort_field is not None and sort_field not in SORT_FIELDS:
+        raise ValueError(f"Поле {sort_field} не поддерживается для сортировки")
+
+
+class AsyncSupplierRepository(Protocol):
+    """Асинхронный репозиторий поставщиков"""
+
+    async def get_by_id(self, supplier_id: int) -> Supplier | None: ...
+
+    async def get_page(
+        self,
+        k: int,
+        n: int,
+        filter_field: str | None = None,
+        filter_value: str | None = None,
+        sort_field: str = "supplier_id",
+    ) -> list[SupplierMini]:
+        """k-я страница по n кратких объектов с фильтром и сортировкой"""
+        ...
+
+    async def get_count(
+        self, filter_field: str | None = None, filter_value: str | None = None
+    ) -> int: ...
+
+    async def add(self, supplier: Supplier): ...
+
+    async def replace_by_id(self, supplier_id: int, supplier: Supplier): ...
+
+    async def remove_by_id(self, supplier_id: int): ...
+
+    async def close(self): ...
+
+
+class SupplierRepAsyncDB:
+    """
+    ADAPTER
+    Репозиторий поставщиков на asyncpg.
+    Пул создаётся при первом запросе — в цикле событий процесса-воркера.
+    Лимит времени запроса берётся из statement_timeout (DBconnection).
+    """
+
+    def __init__(
+        self, conn_params: dict | None = None, min_size: int = 2, max_size: int = 20
+    ):
+        """
+        Args:
+            conn_params: параметры соединения (по умолчанию DBconnection.params)
+            min_size: минимальный размер пула соединений
+            max_size: максимальный размер пула соединений
+        """
+        if asyncpg is None:
+            raise ImportError("Для SupplierRepAsyncDB нужен пакет asyncpg")
+        self.conn_params = conn_params or params
+        self.min_size = min_size
+        self.max_size = max_size
+        self._pool = None
+        self._pool_lock = asyncio.Lock()
+
+    async def _get_pool(self):
+        if self._pool is None:
+            async with self._pool_lock:
+                if self._pool is None:
+                    self._pool = await asyncpg.create_pool(
+                        **self.conn_params,
+                        min_size=self.min_size,
+                        max_size=self.max_size,
+                    )
+        return self._pool
+
+    @staticmethod
+    def _timeout() -> float | None:
+        ms = current_statement_timeout()
+        return ms / 1000 if ms else None
+
+    @staticmethod
+    def _where(filter_field: str | None, filter_value: str | None) -> tuple[str, list]:
+        if filter_field and filter_value:
+            return f" WHERE {filter_field} ILIKE $1", [f"%{filter_value}%"]
+        return "", []
+
+    async def get_by_id(self, supplier_id: int) -> Supplier | None:
+        pool = await self._get_pool()
+        row = await pool.fetchrow(
+            "SELECT supplier_id, name, phone, address "
+            "FROM suppliers WHERE supplier_id = $1;",
+            supplier_id,
+            timeout=self._timeout(),
+        )
+        if row is None:
+            return None
+        return Supplier(name=row[1], phone=row[2], address=row[3], supplier_id=row[0])
+
+    async def get_page(
+        self,
+        k: int,
+        n: int,
+        filter_field: str | None = None,
+        filter_value: str | None = None,
+        sort_field: str = "supplier_id",
+    ) -> list[SupplierMini]:
+        check_fields(filter_field, sort_field)
+        where, args = self._where(filter_field, filter_value)
+        query = (
+            f"SELECT supplier_id, name FROM suppliers{where} "
+            f"ORDER BY {sort_field} LIMIT ${len(args) + 1} OFFSET ${len(args) + 2};"
+        )
+        pool = await self._get_pool()
+        rows = await pool.fetch(query, *args, n, (k - 1) * n, timeout=self._timeout())
+        return [mini_cache.supplier(row[0], row[1]) for row in rows]
+
+    async def get_count(
+        self, filter_field: str | None = None, filter_value: str | None = None
+    ) -> int:
+        check_fields(filter_field)
+        where, args = self._where(filter_field, filter_value)
+        pool = await self._get_pool()
+        return await pool.fetchval(
+            f"SELECT COUNT(*) FROM suppliers{where};", *args, timeout=self._timeout()
+        )
+
+    async def add(self, supplier: Supplier):
+        pool = await self._get_pool()
+        async with pool.acquire() as conn, conn.transaction():
+            exists = await conn.fetchval(
+                "SELECT supplier_id FROM suppliers WHERE name = $1 OR phone = $2;",
+                supplier.name,
+                supplier.phone,
+                timeout=self._timeout(),
+            )
+            if exists is not None:
+                raise ValueError(
+                    f"Поставщик с именем '{supplier.name}' и/или "
+                    f"телефоном '{supplier.phone}' уже существует."
+                )
+            supplier.supplier_id = await conn.fetchval(
+                "INSERT INTO suppliers (name, phone, address) "
+                "VALUES ($1, $2, $3) RETURNING supplier_id;",
+                supplier.name,
+                supplier.phone,
+                supplier.address,
+                timeout=self._timeout(),
+            )
+
+    async def replace_by_id(self, supplier_id: int, supplier: Supplier):
+        pool = await self._get_pool()
+        await pool.execute(
+            "UPDATE suppliers SET name = $1, phone = $2, address = $3 "
+            "WHERE supplier_id = $4;",
+            supplier.name,
+            supplier.phone,
+            supplier.address,
+            supplier_id,
+            timeout=self._timeout(),
+        )
+        mini_cache.invalidate_supplier(supplier_id)
+
+    async def remove_by_id(self, supplier_id: int):
+        pool = await self._get_pool()
+        await pool.execute(
+            "DELETE FROM suppliers WHERE supplier_id = $1;",
+            supplier_id,
+            timeout=self._timeout(),
+        )
+        mini_cache.invalidate_supplier(supplier_id)
+
+    async def close(self):
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+
+class SupplierRepAsyncFile:
+    """
+    ADAPTER
+    Асинхронная обёртка над файловым репозиторием: работа с данными
+    выполняется в потоке (asyncio.to_thread), записи в файл — по одной.
+    """
+
+    def __init__(self, repository: supplier_rep_base):
+        """
+        Args:
+            repository: файловый репозиторий (Supplier_rep_json / _yaml)
+        """
+        # Decorators импортирует repositories — импорт здесь, не в модуле
+        from modules.Decorators import SupplierFiles_Decorator
+
+        self.repository = repository
+        self._decorator = SupplierFiles_Decorator(repository)
+        self._write_lock = asyncio.Lock()
+
+    async def get_by_id(self, supplier_id: int) -> Supplier | None:
+        return await asyncio.to_thread(self.repository.get_by_id, supplier_id)
+
+    async def get_page(
+        self,
+        k: int,
+        n: int,
+        filter_field: str | None = None,
+        filter_value: str | None = None,
+        sort_field: str = "supplier_id",
+    ) -> list[SupplierMini]:
+        check_fields(filter_field, sort_field)
+        return await asyncio.to_thread(
+            self._decorator.get_k_n_short_list,
+            k,
+            n,
+            filter_field,
+            filter_value,
+            sort_field,
+        )
+
+    async def get_count(
+        self, filter_field: str | None = None, filter_value: str | None = None
+    ) -> int:
+        check_fields(filter_field)
+        return await asyncio.to_thread(
+            self._decorator.get_count, filter_field, filter_value
+        )
+
+    async def add(self, supplier: Supplier):
+        async with self._write_lock:
+            await asyncio.to_thread(self.repository.add, supplier)
+
+    async def replace_by_id(self, supplier_id: int, supplier: Supplier):
+        async with self._write_lock:
+            await asyncio.to_thread(
+                self.repository.replace_by_id, supplier_id, supplier
+            )
+
+    async def remove_by_id(self, supplier_id: int):
+        async with self._write_lock:
+            await asyncio.to_thread(self.repository.remove_by_id, supplier_id)
+
+    async def close(self):
+        pass
@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import Any
 
+from modules.models.mini_cache import mini_cache
 from modules.models.supplier import Supplier
 from modules.models.supplier_mini import SupplierMini
 
+# Порядок колонок в строках iter_rows (и в экспорте)
+SUPPLIER_COLUMNS = ("supplier_id", "name", "phone", "address")
+
 
 class supplier_rep_base(ABC):
     def __init__(self, file_path: str):
@@ -43,6 +48,7 @@ class supplier_rep_base(ABC):
     def save_all(self, suppliers: list[Supplier]):
         self.data = [s.to_dict(s.supplier_id) for s in suppliers]
         self._save_data()
+        mini_cache.clear()
 
     # c. Получить объект по ID
     def get_by_id(self, supplier_id: int) -> Supplier | None:
@@ -51,13 +57,25 @@ class supplier_rep_base(ABC):
                 return Supplier(**item)
         return None
 
+    # c1. Получить несколько объектов по списку ID (порядок — как в списке)
+    def get_many(self, supplier_ids: list[int]) -> list[Supplier]:
+        wanted = set(supplier_ids)
+        found = {
+            item["supplier_id"]: item
+            for item in self.data
+            if item["supplier_id"] in wanted
+        }
+        return [Supplier(**found[i]) for i in supplier_ids if i in found]
+
     # d. Получить список k по счету n объектов класса short
     def get_k_n_short_list(self, k: int, n: int) -> list[SupplierMini]:
         start = (k - 1) * n
         end = start + n
         sorted_data = sorted(self.data, key=lambda x: x["supplier_id"])
         items = sorted_data[start:end]
-        return [SupplierMini(item["supplier_id"], item["name"]) for item in items]
+        return [
+            mini_cache.supplier(item["supplier_id"], item["name"]) for item in items
+        ]
 
     # e. Сортировать элементы по выбранному полю
     def sort_by_field(self, field: str):
@@ -92,6 +110,7 @@ class supplier_rep_base(ABC):
                 supplier.supplier_id = supplier_id
                 self.data[i] = supplier.to_dict(supplier_id)
                 self._save_data()
+                mini_cache.invalidate_supplier(supplier_id)
                 return
         raise ValueError(f"Поставщик с ID {supplier_id} не найден")
 
@@ -101,9 +120,18 @@ class supplier_rep_base(ABC):
             if item["supplier_id"] == supplier_id:
                 del self.data[i]
                 self._save_data()
+                mini_cache.invalidate_supplier(supplier_id)
                 return
         raise ValueError(f"Поставщик с ID {supplier_id} не найден")
 
     # i. Получить количество элементов
     def get_count(self) -> int:
         return len(self.data)
+
+    # j. Построчный обход (кортежи SUPPLIER_COLUMNS) без создания моделей
+    def iter_rows(self, batch_size: int = 10_000) -> Iterator[tuple]:
+        # Записи копируются пачками по batch_size: изменение списка во время
+        # обхода (экспорт идёт параллельно с запросами) не ломает итерацию
+        for start in range(0, len(self.data), batch_size):
+            for item in self.data[start : start + batch_size]:
+                yield tuple(item.get(column) for column in SUPPLIER_COLUMNS)
@@ -0,0 +1,222 @@
+"""
+Кэширующий репозиторий поставщиков
+Read-through кэш get_by_id: ограниченный LRU с TTL и метриками.
+Одновременные промахи по одному ID выполняются одним запросом;
+при медленной БД могут отдаваться устаревшие записи (StaleWhileRevalidate).
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from modules.invalidation_bus import RESYNC_EVENT
+from modules.models.supplier import Supplier
+from modules.models.supplier_mini import SupplierMini
+from modules.observer import Observer
+from modules.repositories.supplier_rep_base import supplier_rep_base
+from modules.single_flight import SingleFlight
+from modules.stale import StaleWhileRevalidate
+
+# Метка «поставщика нет» (отсутствие тоже кэшируется)
+_MISSING = object()
+
+
+class SupplierRepCached(Observer):
+    """
+    DECORATOR + Observer
+    Обёртка над репозиторием поставщиков с тем же интерфейсом.
+
+    get_by_id читается из памяти, пока запись не устарела (TTL) и не
+    вытеснена (LRU). Записи сбрасываются при собственных изменениях
+    (сразу, до асинхронной доставки событий) и по событиям
+    item_added / item_updated / item_deleted — в том числе пришедшим
+    из других процессов через шину инвалидации.
+    """
+
+    INVALIDATING_EVENTS = ("item_added", "item_updated", "item_deleted")
+
+    def __init__(
+        self,
+        repository: supplier_rep_base,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        flight: SingleFlight | None = None,
+        stale: StaleWhileRevalidate | None = None,
+    ):
+        """
+        Args:
+            repository: исходный репозиторий
+            maxsize: максимальное число записей
+            ttl: время жизни записи в секундах
+            clock: источник времени
+            flight: объединение одновременных промахов по одному ID
+            stale: отдавать записи с истёкшим TTL, пока БД не отвечает
+        """
+        self.repository = repository
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.flight = flight or SingleFlight()
+        self.stale = stale
+        self._items: OrderedDict[int, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        # растёт при каждой инвалидации: значение, прочитанное до неё,
+        # в кэш не кладётся
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    # ==================== КЭШ ====================
+
+    def get_by_id(self, supplier_id: int) -> Supplier | None:
+        now = self.clock()
+        fallback = None
+        with self._lock:
+            entry = self._items.get(supplier_id)
+            if entry is not None:
+                if entry[0] > now:
+                    self._items.move_to_end(supplier_id)
+                    self.hits += 1
+                    return None if entry[1] is _MISSING else copy.copy(entry[1])
+                self.expirations += 1
+                if self.stale and now - entry[0] <= self.stale.max_stale:
+                    fallback = (None if entry[1] is _MISSING else entry[1],)
+                else:
+                    del self._items[supplier_id]
+            self.misses += 1
+            generation = self._generation
+
+        # поколение в ключе: после инвалидации новые запросы не
+        # присоединяются к чтению, начатому до неё
+        key = (supplier_id, generation)
+
+        def load():
+            return self.repository.get_by_id(supplier_id)
+
+        if self.stale is None:
+            supplier = self.flight.do(key, load)
+            self._store(supplier_id, generation, supplier)
+        else:
+            supplier = self.stale.get(
+                self.flight,
+                key,
+                load,
+                lambda result: self._store(supplier_id, generation, result),
+                fallback,
+            )
+        # объект общий для всех ожидавших — каждому своя копия
+        return None if supplier is None else copy.copy(supplier)
+
+    def get_many(self, supplier_ids: list[int]) -> list[Supplier]:
+        """
+        Несколько поставщиков по списку ID: свежие записи берутся из кэша,
+        промахи читаются из репозитория одним запросом
+        """
+        now = self.clock()
+        found: dict[int, Any] = {}
+        with self._lock:
+            for supplier_id in supplier_ids:
+                entry = self._items.get(supplier_id)
+                if entry is not None and entry[0] > now:
+                    self._items.move_to_end(supplier_id)
+                    self.hits += 1
+                    found[supplier_id] = entry[1]
+            missing = [i for i in dict.fromkeys(supplier_ids) if i not in found]
+            self.misses += len(missing)
+            generation = self._generation
+
+        if missing:
+            loaded = {s.supplier_id: s for s in self.repository.get_many(missing)}
+            for supplier_id in missing:
+                supplier = loaded.get(supplier_id)
+                self._store(supplier_id, generation, supplier)
+                found[supplier_id] = _MISSING if supplier is None else supplier
+        return [copy.copy(found[i]) for i in supplier_ids if found[i] is not _MISSING]
+
+    def _store(self, supplier_id: int, generation: int, supplier: Supplier | None):
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._items[supplier_id] = (
+                self.clock() + self.ttl,
+                _MISSING if supplier is None else copy.copy(supplier),
+            )
+            self._items.move_to_end(supplier_id)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, supplier_id: int):
+        """Сбросить запись поставщика"""
+        with self._lock:
+            self._generation += 1
+            if self._items.pop(supplier_id, None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._items.clear()
+
+    def stats(self) -> dict:
+        """Метрики кэша"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._items),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                **self.flight.stats(),
+            }
+
+    def update(self, event_type: str, data: Any = None):
+        """Инвалидация по событиям репозитория или шины инвалидации"""
+        if event_type == RESYNC_EVENT:
+            self.clear()
+            return
+        if event_type not in self.INVALIDATING_EVENTS:
+            return
+        key = getattr(data, "key", data)  # Invalidation из шины
+        self.invalidate(getattr(key, "supplier_id", key))
+
+    # ==================== ДЕЛЕГИРОВАНИЕ ====================
+
+    def get_all(self) -> list[Supplier]:
+        return self.repository.get_all()
+
+    def get_k_n_short_list(self, k: int, n: int) -> list[SupplierMini]:
+        return self.repository.get_k_n_short_list(k, n)
+
+    def get_count(self) -> int:
+        return self.repository.get_count()
+
+    def iter_rows(self, batch_size: int = 10_000):
+        return self.repository.iter_rows(batch_size)
+
+    def sort_by_field(self, field: str):
+        self.repository.sort_by_field(field)
+
+    def add(self, supplier: Supplier):
+        self.repository.add(supplier)
+        self.invalidate(supplier.supplier_id)
+
+    def replace_by_id(self, supplier_id: int, supplier: Supplier):
+        self.repository.replace_by_id(supplier_id, supplier)
+        self.invalidate(supplier_id)
+
+    def remove_by_id(self, supplier_id: int):
+        self.repository.remove_by_id(supplier_id)
+        self.invalidate(supplier_id)
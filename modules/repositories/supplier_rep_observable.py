@@ -14,16 +14,20 @@ class SupplierRepObservable(Subject):
     Обёртка над репозиторием поставщиков с поддержкой паттерна Observer
     """
 
-    def __init__(self, repository: supplier_rep_base):
-        super().__init__()
+    def __init__(self, repository: supplier_rep_base, dispatcher=None):
+        super().__init__(dispatcher)
         self.repository = repository
 
     def get_all(self) -> list[Supplier]:
         """Получить всех поставщиков"""
         suppliers = self.repository.get_all()
-        self.notify("data_loaded", suppliers)
+        self.notify_lazy("data_loaded", lambda: suppliers)
         return suppliers
 
+    def iter_rows(self, batch_size: int = 10_000):
+        """Построчный обход для экспорта (без события data_loaded)"""
+        return self.repository.iter_rows(batch_size)
+
     def get_by_id(self, supplier_id: int) -> Supplier | None:
         """Получить поставщика по ID"""
         supplier = self.repository.get_by_id(supplier_id)
@@ -31,10 +35,16 @@ class SupplierRepObservable(Subject):
             self.notify("item_selected", supplier)
         return supplier
 
+    def get_many(self, supplier_ids: list[int]) -> list[Supplier]:
+        """Получить несколько поставщиков по списку ID"""
+        return self.repository.get_many(supplier_ids)
+
     def get_k_n_short_list(self, k: int, n: int) -> list[SupplierMini]:
         """Получить список k по счету n объектов класса short"""
         short_list = self.repository.get_k_n_short_list(k, n)
-        self.notify("short_list_loaded", {"items": short_list, "page": k, "size": n})
+        self.notify_lazy(
+            "short_list_loaded", lambda: {"items": short_list, "page": k, "size": n}
+        )
         return short_list
 
     def add(self, supplier: Supplier):
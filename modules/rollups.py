@@ -0,0 +1,478 @@
+"""
+Ряды закупок по временным корзинам (день / неделя / месяц)
+
+PurchaseRollups хранит для каждого поставщика готовые суммы по корзинам
+и обновляет их пакетно: refresh() читает только закупки с purchase_id выше
+отметки (high-water mark) и пересчитывает из сырых данных только корзины,
+помеченные грязными (удаления закупок ниже отметки). Отчёты читают ряды из
+корзин; свежие закупки после отметки можно подмешать на лету.
+
+Идентификаторы выдаются последовательностью до фиксации транзакции, поэтому
+закупка с меньшим id может стать видимой позже закупки с большим. Пропуски
+id ниже отметки запоминаются и проверяются при каждом refresh(), пока
+закупка не появится или не пройдёт GAP_TTL секунд (транзакция откатилась) —
+см. purchase_views.PurchaseFeed.
+
+Состояние можно сохранить (save) и загрузить при старте (load), тогда
+refresh() дочитывает только закупки после отметки.
+
+Полная пересборка:
+    python -m modules.rollups --purchases purchases.jsonl --details details.json
+    python -m modules.rollups --db
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from datetime import date, timedelta
+from typing import Any
+
+from modules.models.money import format_kopecks, spend_kopecks
+from modules.models.purchase import Purchase
+from modules.observer import Observer
+from modules.prices import PriceCache
+from modules.purchase_views import PurchaseFeed
+
+GRANULARITIES = ("day", "week", "month")
+
+# Индексы значений в ячейке корзины
+COUNT, UNITS, SPEND = 0, 1, 2
+
+
+def bucket_start(value: date, granularity: str) -> date:
+    """Начало корзины, в которую попадает дата (неделя — с понедельника)"""
+    if granularity == "day":
+        return value
+    if granularity == "week":
+        return value - timedelta(days=value.weekday())
+    if granularity == "month":
+        return value.replace(day=1)
+    raise ValueError(
+        f"Гранулярность {granularity} не поддерживается ({', '.join(GRANULARITIES)})"
+    )
+
+
+def bucket_end(start: date, granularity: str) -> date:
+    """Последний день корзины, начинающейся с start"""
+    if granularity == "day":
+        return start
+    if granularity == "week":
+        return start + timedelta(days=6)
+    next_month = (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return next_month - timedelta(days=1)
+
+
+def _as_date(value: date | str | None) -> date | None:
+    if value is None or isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+class PurchaseRollups(Observer):
+    """
+    Суммы закупок по поставщикам и временным корзинам.
+
+    Ячейка корзины — [число закупок, количество единиц, затраты в копейках].
+    Отметка hwm_id — максимальный purchase_id, уже учтённый в корзинах.
+    """
+
+    def __init__(
+        self,
+        detail_repository,
+        granularities=GRANULARITIES,
+        prices: PriceCache | None = None,
+    ):
+        """
+        Args:
+            detail_repository: репозиторий деталей (источник цен по артикулу)
+            granularities: какие гранулярности материализовать
+            prices: общий кэш цен (по умолчанию — свой)
+        """
+        for granularity in granularities:  # проверка имён гранулярностей
+            bucket_start(date.today(), granularity)
+        self.prices = prices or PriceCache(detail_repository)
+        self.granularities = tuple(granularities)
+        # гранулярность -> supplier_id -> начало корзины -> ячейка
+        self._buckets: dict[str, dict[int, dict[date, list[int]]]] = {
+            g: {} for g in self.granularities
+        }
+        self._dirty: set[tuple[str, int, date]] = set()
+        self._feed = PurchaseFeed()
+        self.hwm_date: date | None = None
+        self.refreshed_at: float | None = None
+        self._lock = threading.RLock()
+
+    @property
+    def hwm_id(self) -> int:
+        return self._feed.hwm_id
+
+    # ==================== ОБНОВЛЕНИЕ ====================
+
+    def update(self, event_type: str, data: Any = None):
+        """
+        Реакция на события PurchaseRepObservable.
+        Новые закупки подхватит refresh() по отметке; удаление уже учтённой
+        закупки помечает её корзины грязными.
+        """
+        if event_type == "item_deleted" and data.purchase_id <= self.hwm_id:
+            self.invalidate(data.supplier_id, data.purchase_date, data.purchase_date)
+
+    def invalidate(self, supplier_id: int, date_from: date | str, date_to: date | str):
+        """Пометить корзины поставщика за период для пересчёта из сырых данных"""
+        date_from, date_to = _as_date(date_from), _as_date(date_to)
+        with self._lock:
+            for granularity in self.granularities:
+                start = bucket_start(date_from, granularity)
+                while start <= date_to:
+                    self._dirty.add((granularity, supplier_id, start))
+                    start = bucket_end(start, granularity) + timedelta(days=1)
+
+    def _apply(self, purchase: Purchase, sign: int = 1, granularities=None):
+        spend = spend_kopecks(self.prices.get(purchase.article), purchase.quantity)
+        for granularity in granularities or self.granularities:
+            buckets = self._buckets[granularity].setdefault(purchase.supplier_id, {})
+            start = bucket_start(purchase.purchase_date, granularity)
+            cell = buckets.setdefault(start, [0, 0, 0])
+            cell[COUNT] += sign
+            cell[UNITS] += sign * purchase.quantity
+            cell[SPEND] += sign * spend
+            if cell[COUNT] == 0:
+                del buckets[start]
+
+    def apply(self, purchase: Purchase):
+        """
+        Учесть закупку при полной пересборке общим проходом по истории
+        (purchase_views.rebuild_views); отметка hwm_id сдвигается вперёд
+        """
+        with self._lock:
+            self._apply(purchase)
+            self._feed.advance(purchase.purchase_id)
+            self._advance(purchase)
+
+    def _recompute(self, purchase_repository, granularity, supplier_id, start):
+        """Пересчитать одну корзину по сырым закупкам (только id <= hwm_id)"""
+        self._buckets[granularity].get(supplier_id, {}).pop(start, None)
+        after = None
+        while True:
+            batch = purchase_repository.find(
+                supplier_id=supplier_id,
+                date_from=start,
+                date_to=bucket_end(start, granularity),
+                after=after,
+                limit=10_000,
+            )
+            for purchase in batch:
+                if self._feed.counted(purchase.purchase_id):
+                    self._apply(purchase, +1, (granularity,))
+            if len(batch) < 10_000:
+                return
+            last = batch[-1]
+            after = (last.purchase_date, last.purchase_id)
+
+    def _advance(self, purchase: Purchase):
+        if self.hwm_date is None or purchase.purchase_date > self.hwm_date:
+            self.hwm_date = purchase.purchase_date
+
+    def refresh(self, purchase_repository, batch_size: int = 10_000) -> dict:
+        """
+        Инкрементально обновить корзины.
+
+        1. Учесть закупки с пропущенными ранее id, если они появились.
+        2. Пересчитать грязные корзины из сырых данных.
+        3. Учесть закупки с purchase_id > hwm_id и сдвинуть отметку;
+           пропуски id запомнить.
+
+        Returns:
+            dict: {"recomputed": число корзин, "added": число новых закупок}
+        """
+        with self._lock:
+            added = 0
+            for purchase in self._feed.fill_gaps(purchase_repository):
+                self._apply(purchase)
+                self._advance(purchase)
+                added += 1
+            dirty, self._dirty = self._dirty, set()
+            for granularity, supplier_id, start in sorted(dirty):
+                self._recompute(purchase_repository, granularity, supplier_id, start)
+
+            for purchase in self._feed.after_hwm(purchase_repository, batch_size):
+                self._apply(purchase)
+                self._advance(purchase)
+                added += 1
+
+            self.refreshed_at = time.monotonic()
+            return {"recomputed": len(dirty), "added": added}
+
+    def refresh_if_stale(self, purchase_repository, max_age: float = 60.0) -> bool:
+        """Обновить корзины, если с прошлого обновления прошло max_age секунд"""
+        if (
+            self.refreshed_at is not None
+            and time.monotonic() - self.refreshed_at < max_age
+        ):
+            return False
+        self.refresh(purchase_repository)
+        return True
+
+    def clear(self):
+        with self._lock:
+            for buckets in self._buckets.values():
+                buckets.clear()
+            self._dirty.clear()
+            self._feed.clear()
+            self.hwm_date = None
+            self.refreshed_at = None
+        self.prices.clear()
+
+    def rebuild(self, purchase_repository) -> int:
+        """
+        Построить корзины заново по всем закупкам репозитория.
+
+        Returns:
+            int: число учтённых закупок
+        """
+        self.clear()
+        return self.refresh(purchase_repository)["added"]
+
+    # ==================== ЧТЕНИЕ ====================
+
+    def series(
+        self,
+        supplier_id: int,
+        granularity: str = "month",
+        date_from: date | str | None = None,
+        date_to: date | str | None = None,
+        recent_repository=None,
+    ) -> list[dict]:
+        """
+        Ряд по корзинам поставщика (только непустые корзины).
+
+        Args:
+            supplier_id: ID поставщика
+            granularity: day, week или month
+            date_from: первая дата периода (корзина, содержащая её, входит)
+            date_to: последняя дата периода
+            recent_repository: репозиторий закупок — если задан, закупки
+                после отметки hwm_id (и с пропущенными id) подмешиваются
+                к ряду без сдвига отметки
+        """
+        if granularity not in self.granularities:
+            raise ValueError(f"Гранулярность {granularity} не материализована")
+        date_from, date_to = _as_date(date_from), _as_date(date_to)
+        first = bucket_start(date_from, granularity) if date_from else None
+
+        with self._lock:
+            cells = {
+                start: list(cell)
+                for start, cell in self._buckets[granularity]
+                .get(supplier_id, {})
+                .items()
+                if (first is None or start >= first)
+                and (date_to is None or start <= date_to)
+            }
+            hwm_id = self.hwm_id
+            gaps = list(self._feed.gaps)
+
+        if recent_repository is not None:
+            for purchase in self._recent(
+                recent_repository, hwm_id, gaps, supplier_id, date_from, date_to
+            ):
+                start = bucket_start(purchase.purchase_date, granularity)
+                self._count(cells.setdefault(start, [0, 0, 0]), purchase)
+
+        return [
+            {
+                "bucket": start.isoformat(),
+                "count": cell[COUNT],
+                "units": cell[UNITS],
+                "total": format_kopecks(cell[SPEND]),
+            }
+            for start, cell in sorted(cells.items())
+        ]
+
+    def _count(self, cell: list[int], purchase: Purchase):
+        """Добавить к ячейке закупку, ещё не учтённую в корзинах"""
+        cell[COUNT] += 1
+        cell[UNITS] += purchase.quantity
+        cell[SPEND] += spend_kopecks(
+            self.prices.get(purchase.article), purchase.quantity
+        )
+
+    @staticmethod
+    def _recent(
+        purchase_repository,
+        hwm_id: int,
+        gaps: list[int],
+        supplier_id: int | None,
+        date_from: date | None,
+        date_to: date | None,
+        batch_size: int = 10_000,
+    ) -> Iterator[Purchase]:
+        """Закупки за период, ещё не учтённые в корзинах (None — все поставщики)"""
+        for purchase_id in gaps:
+            purchase = purchase_repository.get_by_id(purchase_id)
+            if (
+                purchase is not None
+                and supplier_id in (None, purchase.supplier_id)
+                and (date_from is None or purchase.purchase_date >= date_from)
+                and (date_to is None or purchase.purchase_date <= date_to)
+            ):
+                yield purchase
+        after = hwm_id
+        while True:
+            batch = purchase_repository.find_after_id(
+                after,
+                batch_size,
+                supplier_id=supplier_id,
+                date_from=date_from,
+                date_to=date_to,
+            )
+            yield from batch
+            if len(batch) < batch_size:
+                return
+            after = batch[-1].purchase_id
+
+    def granularity_for(
+        self, date_from: date | str | None = None, date_to: date | str | None = None
+    ) -> str | None:
+        """
+        Самая крупная гранулярность, корзины которой точно покрывают период
+        (границы периода совпадают с границами корзин); None — таких нет.
+        """
+        date_from, date_to = _as_date(date_from), _as_date(date_to)
+        for granularity in ("month", "week", "day"):
+            if granularity not in self.granularities:
+                continue
+            if date_from and bucket_start(date_from, granularity) != date_from:
+                continue
+            if date_to and (
+                bucket_end(bucket_start(date_to, granularity), granularity) != date_to
+            ):
+                continue
+            return granularity
+        return None
+
+    def supplier_totals(
+        self,
+        granularity: str,
+        date_from: date | str | None = None,
+        date_to: date | str | None = None,
+        recent_repository=None,
+    ) -> Iterator[tuple[int, int, int, int]]:
+        """
+        Итоги по поставщикам за период из корзин (по одному на поставщика):
+        (supplier_id, число закупок, единиц, затраты в копейках).
+        С recent_repository добавляются закупки, ещё не учтённые в корзинах,
+        и итоги совпадают с подсчётом по сырым закупкам.
+        """
+        date_from, date_to = _as_date(date_from), _as_date(date_to)
+        totals: dict[int, list[int]] = {}
+        with self._lock:
+            for supplier_id, buckets in self._buckets[granularity].items():
+                cell = [0, 0, 0]
+                for start, bucket in buckets.items():
+                    if date_from and start < date_from:
+                        continue
+                    if date_to and start > date_to:
+                        continue
+                    for i in (COUNT, UNITS, SPEND):
+                        cell[i] += bucket[i]
+                if cell[COUNT]:
+                    totals[supplier_id] = cell
+            hwm_id = self.hwm_id
+            gaps = list(self._feed.gaps)
+
+        if recent_repository is not None:
+            for purchase in self._recent(
+                recent_repository, hwm_id, gaps, None, date_from, date_to
+            ):
+                self._count(
+                    totals.setdefault(purchase.supplier_id, [0, 0, 0]), purchase
+                )
+
+        for supplier_id, cell in totals.items():
+            yield supplier_id, cell[COUNT], cell[UNITS], cell[SPEND]
+
+    # ==================== СОХРАНЕНИЕ СОСТОЯНИЯ ====================
+
+    def save(self, file_path: str):
+        """Сохранить корзины и отметку в JSON (чтобы не пересобирать при старте)"""
+        with self._lock:
+            state = {
+                "hwm_id": self.hwm_id,
+                "hwm_date": self.hwm_date.isoformat() if self.hwm_date else None,
+                "dirty": [[g, s, d.isoformat()] for g, s, d in sorted(self._dirty)],
+                "gaps": sorted(self._feed.gaps),
+                "buckets": {
+                    granularity: [
+                        [supplier_id, start.isoformat(), *cell]
+                        for supplier_id, buckets in by_supplier.items()
+                        for start, cell in buckets.items()
+                    ]
+                    for granularity, by_supplier in self._buckets.items()
+                },
+            }
+        # запись во временный файл и замена: читатель не увидит половину
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, file_path)
+
+    def load(self, file_path: str):
+        """Загрузить состояние, сохранённое save()"""
+        with open(file_path, encoding="utf-8") as f:
+            state = json.load(f)
+        with self._lock:
+            self.clear()
+            self._feed.hwm_id = state["hwm_id"]
+            self.hwm_date = _as_date(state["hwm_date"])
+            self._dirty = {(g, s, date.fromisoformat(d)) for g, s, d in state["dirty"]}
+            now = time.monotonic()
+            self._feed.gaps = {
+                purchase_id: now for purchase_id in state.get("gaps", [])
+            }
+            for granularity, rows in state["buckets"].items():
+                if granularity not in self._buckets:
+                    continue
+                for supplier_id, start, *cell in rows:
+                    self._buckets[granularity].setdefault(supplier_id, {})[
+                        date.fromisoformat(start)
+                    ] = cell
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Пересборка рядов закупок")
+    parser.add_argument("--db", action="store_true", help="источник — PostgreSQL")
+    parser.add_argument("--purchases", help="файл закупок (.json или .jsonl)")
+    parser.add_argument("--details", help="файл деталей (.json или .yaml)")
+    parser.add_argument("--state", help="куда сохранить состояние (JSON)")
+    args = parser.parse_args()
+
+    from modules import repositories
+
+    if args.db:
+        purchases = repositories.Purchase_rep_DB()
+        details = repositories.Detail_rep_DB()
+    elif args.purchases and args.details:
+        if args.purchases.endswith(".jsonl"):
+            purchases = repositories.Purchase_rep_jsonl(args.purchases)
+        else:
+            purchases = repositories.Purchase_rep_json(args.purchases)
+        if args.details.endswith((".yaml", ".yml")):
+            details = repositories.Detail_rep_yaml(args.details)
+        else:
+            details = repositories.Detail_rep_json(args.details)
+    else:
+        parser.error("укажите --db или --purchases и --details")
+
+    rollups = PurchaseRollups(details)
+    count = rollups.rebuild(purchases)
+    if args.state:
+        rollups.save(args.state)
+    print(f"[OK] Учтено закупок: {count}; отметка purchase_id: {rollups.hwm_id}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Пакетная JSON-сериализация моделей
+
+Списки моделей и «сырые» строки из БД пишутся сразу в JSON (bytes),
+без промежуточного to_dict() на каждый объект.
+Decimal пишется точным числом, date/datetime — в формате ISO.
+Цена детали — точная строка ("500.50"), как в Detail.to_json_dict.
+NaN и бесконечности не сериализуются (ValueError), как json.dumps
+с allow_nan=False.
+"""
+
+import json
+import math
+from datetime import date, datetime
+from decimal import Decimal
+
+from modules.models.detail import Detail
+from modules.models.detail_mini import DetailMini
+from modules.models.money import format_kopecks
+from modules.models.purchase import Purchase
+from modules.models.purchase_mini import PurchaseMini
+from modules.models.supplier import Supplier
+from modules.models.supplier_mini import SupplierMini
+
+# Строка -> JSON-строка без экранирования не-ASCII (публичный API json)
+encode_basestring = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _opt_str(value) -> str:
+    return "null" if value is None else encode_basestring(value)
+
+
+def _purchase_id(obj) -> str:
+    # purchase_id пишется только если он задан (как в to_dict)
+    if obj._purchase_id is None:
+        return ""
+    return f',"purchase_id":{obj._purchase_id}'
+
+
+# Кодировщики моделей: объект -> JSON-текст (без вызова to_dict)
+_MODEL_ENCODERS = {
+    SupplierMini: lambda o: (
+        f'{{"supplier_id":{o._supplier_id},"name":{encode_basestring(o._name)}}}'
+    ),
+    Supplier: lambda o: (
+        f'{{"supplier_id":{o._supplier_id},"name":{encode_basestring(o._name)},'
+        f'"phone":{encode_basestring(o._phone)},"address":{_opt_str(o._address)}}}'
+    ),
+    DetailMini: lambda o: (
+        f'{{"article":{encode_basestring(o._article)},'
+        f'"name":{encode_basestring(o._name)}}}'
+    ),
+    Detail: lambda o: (
+        f'{{"article":{encode_basestring(o._article)},'
+        f'"name":{encode_basestring(o._name)},'
+        f'"price":"{format_kopecks(o._price_kop)}"}}'
+    ),
+    PurchaseMini: lambda o: (
+        f'{{"article":{encode_basestring(o._article)},'
+        f'"quantity":{o._quantity}{_purchase_id(o)}}}'
+    ),
+    Purchase: lambda o: (
+        f'{{"supplier_id":{o._supplier_id},'
+        f'"article":{encode_basestring(o._article)},'
+        f'"quantity":{o._quantity},'
+        f'"purchase_date":"{o._purchase_date.isoformat()}"{_purchase_id(o)}}}'
+    ),
+}
+
+# Кэш: конкретный тип (в т.ч. подклассы моделей) -> кодировщик
+_encoder_cache: dict[type, object] = {}
+
+
+def _model_encoder(tp: type):
+    if tp in _encoder_cache:
+        return _encoder_cache[tp]
+    encoder = None
+    for base in tp.__mro__:
+        if base in _MODEL_ENCODERS:
+            encoder = _MODEL_ENCODERS[base]
+            break
+    _encoder_cache[tp] = encoder
+    return encoder
+
+
+def _key(key) -> str:
+    """Ключ словаря как в json.dumps: True -> "true", None -> "null" и т.д."""
+    if isinstance(key, str):
+        return encode_basestring(key)
+    if key is True:
+        return '"true"'
+    if key is False:
+        return '"false"'
+    if key is None:
+        return '"null"'
+    if isinstance(key, (int, float)):
+        return f'"{_number(key)}"'
+    raise TypeError(f"Ключ типа {type(key).__name__} не сериализуется в JSON")
+
+
+def _number(obj) -> str:
+    """Число JSON; NaN и бесконечности недопустимы"""
+    if isinstance(obj, int):
+        return int.__repr__(obj)
+    if isinstance(obj, float):
+        if not math.isfinite(obj):
+            raise ValueError(f"Значение {obj!r} недопустимо в JSON")
+        return float.__repr__(obj)
+    if not obj.is_finite():
+        raise ValueError(f"Значение {obj} недопустимо в JSON")
+    return format(obj, "f")
+
+
+def _write(obj, out: list[str]):
+    """Записать объект в список JSON-фрагментов"""
+    if obj is None:
+        out.append("null")
+    elif obj is True:
+        out.append("true")
+    elif obj is False:
+        out.append("false")
+    elif isinstance(obj, str):
+        out.append(encode_basestring(obj))
+    elif isinstance(obj, (int, float, Decimal)):
+        out.append(_number(obj))
+    elif isinstance(obj, (list, tuple)):
+        if not obj:
+            out.append("[]")
+            return
+        encoder = _model_encoder(type(obj[0]))
+        if encoder is not None and all(type(o) is type(obj[0]) for o in obj):
+            # Быстрый путь: однородный список моделей
+            out.append("[" + ",".join([encoder(o) for o in obj]) + "]")  # type: ignore
+            return
+        out.append("[")
+        for i, item in enumerate(obj):
+            if i:
+                out.append(",")
+            _write(item, out)
+        out.append("]")
+    elif isinstance(obj, dict):
+        out.append("{")
+        for i, (key, value) in enumerate(obj.items()):
+            if i:
+                out.append(",")
+            out.append(_key(key))
+            out.append(":")
+            _write(value, out)
+        out.append("}")
+    elif isinstance(obj, datetime):
+        out.append(f'"{obj.isoformat()}"')
+    elif isinstance(obj, date):
+        out.append(f'"{obj.isoformat()}"')
+    else:
+        encoder = _model_encoder(type(obj))
+        if encoder is None:
+            raise TypeError(f"Тип {type(obj).__name__} не сериализуется в JSON")
+        out.append(encoder(obj))  # type: ignore
+
+
+def dumps(obj) -> bytes:
+    """
+    Сериализовать объект (dict/list/модели/Decimal/date) в JSON (UTF-8).
+
+    Args:
+        obj: Данные ответа
+
+    Returns:
+        bytes: JSON в кодировке UTF-8
+    """
+    out: list[str] = []
+    _write(obj, out)
+    return "".join(out).encode("utf-8")
+
+
+def dumps_rows(columns: list[str], rows) -> bytes:
+    """
+    Сериализовать строки из БД (кортежи) в JSON-массив объектов.
+
+    Args:
+        columns: имена колонок
+        rows: итерируемое кортежей значений
+
+    Returns:
+        bytes: JSON-массив в кодировке UTF-8
+    """
+    keys = [encode_basestring(c) + ":" for c in columns]
+    out: list[str] = ["["]
+    for i, row in enumerate(rows):
+        if i:
+            out.append(",")
+        out.append("{")
+        for j, value in enumerate(row):
+            if j:
+                out.append(",")
+            out.append(keys[j])
+            _write(value, out)
+        out.append("}")
+    out.append("]")
+    return "".join(out).encode("utf-8")
@@ -0,0 +1,95 @@
+"""
+Single-flight: объединение одинаковых одновременных запросов
+
+Когда много клиентов одновременно запрашивают одно и то же (старт рабочего
+дня, перезапуск после выкладки), в БД уходит один запрос: первый вызов
+выполняет вычисление, остальные с тем же ключом ждут его результата.
+Исключение вычисления получают все ожидающие.
+"""
+
+import contextvars
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Executor, Future
+from typing import Any
+
+
+class SingleFlight:
+    """Группа вычислений, объединяемых по ключу"""
+
+    def __init__(self, timeout: float | None = None):
+        """
+        Args:
+            timeout: сколько ждать чужое вычисление, секунды
+                (None — без ограничения); по истечении — TimeoutError
+        """
+        self.timeout = timeout
+        self._calls: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Выполнить fn или дождаться уже идущего вычисления с тем же ключом.
+
+        Raises:
+            TimeoutError: чужое вычисление не завершилось за timeout
+            Exception: исключение, с которым завершилось вычисление
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                self.executed += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            return future.result(self.timeout)
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            # следующие вызовы с этим ключом выполнят вычисление заново
+            with self._lock:
+                del self._calls[key]
+
+    def submit(
+        self, key: Hashable, fn: Callable[[], Any], executor: Executor
+    ) -> Future:
+        """
+        Запустить fn в executor или вернуть уже идущее вычисление с тем же
+        ключом. Вызывающий сам решает, сколько ждать результат.
+        fn выполняется в копии контекста вызывающего (contextvars).
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.shared += 1
+                return future
+            context = contextvars.copy_context()
+            future = self._calls[key] = executor.submit(context.run, fn)
+            self.executed += 1
+        future.add_done_callback(lambda done: self._forget(key, done))
+        return future
+
+    def _forget(self, key: Hashable, future: Future):
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "executed": self.executed,
+                "shared": self.shared,
+            }
@@ -0,0 +1,142 @@
+"""
+Server-Sent Events: живые обновления списка поставщиков
+
+SSEBroker — наблюдатель изменений поставщиков. Каждое изменение
+превращается в небольшое SSE-сообщение и кладётся в очередь каждого
+подключённого клиента; браузер правит только затронутую строку таблицы.
+Очередь клиента ограничена: отставший клиент получает событие resync
+и перезагружает страницу списка целиком.
+"""
+
+import queue
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+from modules.coalescing import BatchObserver
+from modules.invalidation_bus import RESYNC_EVENT, Invalidation
+from modules.serialization import dumps
+
+# Интервал комментария-пинга (держит соединение через прокси), секунды
+HEARTBEAT_INTERVAL = 15.0
+# Задержка переподключения EventSource, миллисекунды
+RETRY_MS = 3000
+
+RESYNC = b"event: resync\ndata: {}\n\n"
+
+
+def format_event(event_type: str, payload: bytes, event_id: int) -> bytes:
+    """Одно SSE-сообщение: event, id и data (JSON в одну строку)"""
+    return (
+        f"event: {event_type}\nid: {event_id}\n".encode()
+        + b"data: "
+        + payload
+        + b"\n\n"
+    )
+
+
+def event_payload(event_type: str, data: Any) -> tuple[str, bytes]:
+    """
+    Данные события для клиента: только то, что видно в строке таблицы.
+
+    Returns:
+        (тип SSE-события, JSON)
+    """
+    if event_type == RESYNC_EVENT:
+        # изменения других процессов могли потеряться
+        return "resync", b"{}"
+    if isinstance(data, Invalidation):
+        # изменение из другого процесса: клиент сам запросит строку
+        return "item_changed", dumps({"supplier_id": data.key, "event": event_type})
+    if event_type == "item_deleted":
+        return event_type, dumps({"supplier_id": getattr(data, "supplier_id", data)})
+    return event_type, dumps({"supplier_id": data.supplier_id, "name": data.name})
+
+
+class SSEClient:
+    """Подключённый клиент: ограниченная очередь готовых сообщений"""
+
+    def __init__(self, maxsize: int):
+        self.queue: queue.Queue[bytes] = queue.Queue(maxsize)
+        self.resyncs = 0
+
+    def push(self, message: bytes):
+        try:
+            self.queue.put_nowait(message)
+        except queue.Full:
+            # клиент отстал: отдельные правки уже бесполезны
+            self.resyncs += 1
+            while True:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                self.queue.put_nowait(RESYNC)
+            except queue.Full:
+                pass
+
+
+class SSEBroker(BatchObserver):
+    """Рассылка событий поставщиков подключённым SSE-клиентам"""
+
+    def __init__(self, client_queue_size: int = 100):
+        """
+        Args:
+            client_queue_size: ёмкость очереди одного клиента
+        """
+        self.client_queue_size = client_queue_size
+        self._clients: set[SSEClient] = set()
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def subscribe(self) -> SSEClient:
+        client = SSEClient(self.client_queue_size)
+        with self._lock:
+            self._clients.add(client)
+        return client
+
+    def unsubscribe(self, client: SSEClient):
+        with self._lock:
+            self._clients.discard(client)
+
+    # ==================== РАССЫЛКА ====================
+
+    def update(self, event_type: str, data: Any = None):
+        self.update_batch([(event_type, data)])
+
+    def update_batch(self, events: list[tuple[str, Any]]):
+        with self._lock:
+            if not self._clients:
+                return
+            messages = []
+            for event_type, data in events:
+                name, payload = event_payload(event_type, data)
+                messages.append(format_event(name, payload, self._next_id))
+                self._next_id += 1
+            clients = list(self._clients)
+        for client in clients:
+            for message in messages:
+                client.push(message)
+
+    def stream(self, heartbeat: float = HEARTBEAT_INTERVAL) -> Iterator[bytes]:
+        """
+        Поток сообщений нового клиента для ответа text/event-stream.
+        Клиент подписывается при первом чтении потока и отписывается при
+        его закрытии: если соединение оборвалось раньше, чем сервер начал
+        ответ, подписки не остаётся.
+        """
+        client = self.subscribe()
+        try:
+            yield f"retry: {RETRY_MS}\n\n".encode()
+            while True:
+                try:
+                    yield client.queue.get(timeout=heartbeat)
+                except queue.Empty:
+                    yield b": ping\n\n"
+        finally:
+            self.unsubscribe(client)
@@ -0,0 +1,134 @@
+"""
+Устаревшие данные при медленной БД (stale-while-revalidate)
+
+Пока БД отвечает вовремя, кэши отдают только свежие данные. Если свежий
+результат не получен за soft_timeout (или запрос завершился ошибкой),
+а в кэше есть устаревшая запись не старше max_stale, клиент получает её,
+а обновление продолжается в фоне и по завершении попадает в кэш.
+Без устаревшей записи запрос выполняется в потоке клиента, без пула;
+фоновых обновлений одновременно не больше max_pending (остальным клиентам
+сразу отдаётся устаревшая запись), поэтому очередь пула ограничена.
+Такой ответ помечается как деградированный (mark_degraded): маршрут
+добавляет заголовок и не выдаёт валидаторы кэширования.
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Executor, Future
+from contextvars import ContextVar
+from typing import Any
+
+from modules.single_flight import SingleFlight
+
+# Причина деградации текущего запроса (None — ответ полноценный)
+_degraded: ContextVar[str | None] = ContextVar("degraded", default=None)
+
+
+def mark_degraded(reason: str):
+    """Отметить, что текущий ответ собран из неполноценных данных"""
+    _degraded.set(reason)
+
+
+def degraded_reason() -> str | None:
+    return _degraded.get()
+
+
+def reset_degraded():
+    """Сбросить отметку (в начале обработки запроса)"""
+    _degraded.set(None)
+
+
+class StaleWhileRevalidate:
+    """Политика ожидания свежих данных с откатом на устаревшие"""
+
+    def __init__(
+        self,
+        executor: Executor,
+        soft_timeout: float,
+        max_stale: float,
+        max_pending: int = 16,
+    ):
+        """
+        Args:
+            executor: пул фоновых обновлений
+            soft_timeout: сколько ждать свежий результат, если есть
+                устаревший, секунды
+            max_stale: предельный возраст устаревшей записи, секунды
+            max_pending: предел одновременных фоновых обновлений
+        """
+        self.executor = executor
+        self.soft_timeout = soft_timeout
+        self.max_stale = max_stale
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._pending: set[Future] = set()
+        self.served_stale = 0
+        self.skipped_refreshes = 0
+
+    def get(
+        self,
+        flight: SingleFlight,
+        key: Hashable,
+        compute: Callable[[], Any],
+        on_result: Callable[[Any], None],
+        fallback: tuple[Any] | None = None,
+        is_ok: Callable[[Any], bool] = lambda result: True,
+    ) -> Any:
+        """
+        Свежий результат или, если его нет вовремя, устаревший.
+
+        Args:
+            flight: объединение одинаковых вычислений
+            key: ключ вычисления
+            compute: получение свежего результата (с fallback — в фоне)
+            on_result: сохранение свежего результата в кэш
+            fallback: (устаревшее значение,) или None, если его нет
+            is_ok: успешен ли результат (неуспешный заменяется устаревшим)
+        """
+        if fallback is None:
+            result = flight.do(key, compute)
+            on_result(result)
+            return result
+
+        with self._lock:
+            busy = len(self._pending) >= self.max_pending
+            if busy:
+                self.skipped_refreshes += 1
+        if busy:
+            return self._serve_stale(fallback[0])
+        future = flight.submit(key, compute, self.executor)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+        future.add_done_callback(lambda done: _store(done, on_result))
+        try:
+            result = future.result(self.soft_timeout)
+        except Exception:
+            # TimeoutError — БД не успела; прочее — запрос упал
+            return self._serve_stale(fallback[0])
+        return result if is_ok(result) else self._serve_stale(fallback[0])
+
+    def _done(self, future: Future):
+        with self._lock:
+            self._pending.discard(future)
+
+    def _serve_stale(self, value: Any) -> Any:
+        with self._lock:
+            self.served_stale += 1
+        mark_degraded("stale")
+        return value
+
+    def stats(self) -> dict:
+        return {
+            "soft_timeout": self.soft_timeout,
+            "max_stale": self.max_stale,
+            "max_pending": self.max_pending,
+            "pending": len(self._pending),
+            "served_stale": self.served_stale,
+            "skipped_refreshes": self.skipped_refreshes,
+        }
+
+
+def _store(future: Future, on_result: Callable[[Any], None]):
+    if not future.cancelled() and future.exception() is None:
+        on_result(future.result())
@@ -0,0 +1,58 @@
+"""
+Бенчмарк аналитики закупок на синтетических данных
+
+Запуск:
+    python -m utils.bench.bench_analytics [--rows 10000000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from modules.analytics import PurchaseColumns, spend_by
+
+
+def synthetic_columns(
+    rows: int, suppliers: int = 220, articles: int = 5000, seed: int = 42
+) -> tuple[PurchaseColumns, np.ndarray]:
+    """Сгенерировать закупки за ~3 года и каталог цен"""
+    rng = np.random.default_rng(seed)
+    columns = PurchaseColumns(
+        supplier_id=rng.integers(1, suppliers + 1, rows, dtype=np.int32),
+        article_code=rng.integers(0, articles, rows, dtype=np.int32),
+        quantity=rng.integers(1, 10_001, rows, dtype=np.int32),
+        day=np.datetime64("2023-01-01")
+        + rng.integers(0, 3 * 365, rows).astype("timedelta64[D]"),
+        articles=[f"ART-{i:05d}" for i in range(articles)],
+    )
+    prices = rng.integers(100, 99_999_999, articles, dtype=np.int64)
+    return columns, prices
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    columns, prices = synthetic_columns(args.rows)
+    print(f"Генерация {args.rows:,} закупок: {time.perf_counter() - start:.2f} с")
+
+    for by in [
+        ("supplier",),
+        ("article",),
+        ("month",),
+        ("day",),
+        ("supplier", "month"),
+        ("article", "month"),
+        ("supplier", "article"),
+    ]:
+        start = time.perf_counter()
+        report = spend_by(columns, prices, by=by)
+        elapsed = time.perf_counter() - start
+        print(f"{' + '.join(by):<20} групп: {len(report):>9,}  время: {elapsed:.2f} с")
+
+
+if __name__ == "__main__":
+    main()
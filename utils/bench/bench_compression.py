@@ -0,0 +1,74 @@
+"""
+Бенчмарк сжатия ответов API на синтетических страницах поставщиков
+
+Для каждого размера страницы: размер JSON без сжатия и после gzip/br
+(br — если установлен модуль brotli) и время сжатия (медиана повторов).
+
+Запуск:
+    python -m utils.bench.bench_compression [--sizes 100 1000 10000 50000]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from modules.compression import compress, supported_encodings
+from modules.models.supplier_mini import SupplierMini
+from modules.serialization import dumps
+
+CITIES = ["Москва", "Санкт-Петербург", "Казань", "Новосибирск", "Екатеринбург"]
+
+
+def synthetic_page(size: int, seed: int = 42) -> bytes:
+    """Тело ответа /api/suppliers со страницей из size поставщиков"""
+    rng = random.Random(seed)
+    items = [
+        SupplierMini(
+            supplier_id=i,
+            name=f"Поставщик {rng.choice(CITIES)} {rng.randint(1, 10**6)}",
+        )
+        for i in range(1, size + 1)
+    ]
+    return dumps(
+        {
+            "success": True,
+            "items": items,
+            "total_count": size * 10,
+            "page": 1,
+            "page_size": size,
+            "total_pages": 10,
+        }
+    )
+
+
+def measure(body: bytes, encoding: str, repeat: int) -> tuple[int, float]:
+    """Размер сжатого тела и медианное время сжатия, мс"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        compressed = compress(body, encoding)
+        times.append((time.perf_counter() - start) * 1000)
+    return len(compressed), statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 1000, 10_000, 50_000]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'страница':>9} {'кодировка':>9} {'байт':>11} {'доля':>6} {'мс':>8}")
+    for size in args.sizes:
+        body = synthetic_page(size)
+        print(f"{size:>9,} {'—':>9} {len(body):>11,} {'100%':>6} {0:>8.2f}")
+        for encoding in supported_encodings():
+            length, elapsed = measure(body, encoding, args.repeat)
+            share = f"{length / len(body):.0%}"
+            print(f"{size:>9,} {encoding:>9} {length:>11,} {share:>6} {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+import itertools
+
+import pytest
+
+
+@pytest.fixture
+def temp_path(tmp_path):
+    """Фабрика путей к пустым временным файлам (каталог удаляет pytest)"""
+    counter = itertools.count(1)
+
+    def make(suffix: str) -> str:
+        path = tmp_path / f"data_{next(counter)}{suffix}"
+        path.touch()
+        return str(path)
+
+    return make
@@ -0,0 +1,161 @@
+from modules.aggregates import SpendAggregates
+from modules.article_index import ArticleSupplierIndex
+from modules.models.detail import Detail
+from modules.models.purchase import Purchase
+from modules.prices import PriceCache
+from modules.purchase_views import rebuild_views
+from modules.repositories import (
+    Detail_rep_json,
+    Purchase_rep_jsonl,
+    PurchaseRepObservable,
+)
+from modules.rollups import PurchaseRollups
+
+
+def _repos(temp_path):
+    details_path = temp_path(".json")
+    purchases_path = temp_path(".jsonl")
+    details = Detail_rep_json(details_path)
+    details.add_many(
+        [Detail("FLT-001", "Фильтр", "0.10"), Detail("BRK-045", "Колодки", 1500)]
+    )
+    purchases = PurchaseRepObservable(Purchase_rep_jsonl(purchases_path))
+    return details, purchases
+
+
+def test_aggregates_follow_adds_and_removes(temp_path):
+    details, purchases = _repos(temp_path)
+    aggregates = SpendAggregates(details)
+    purchases.attach(aggregates)
+
+    purchases.add_many(
+        [
+            Purchase(1, "FLT-001", 10, "2025-01-10"),
+            Purchase(1, "BRK-045", 2, "2025-01-20"),
+            Purchase(2, "FLT-001", 5, "2025-02-01"),
+        ]
+    )
+    purchases.add(Purchase(1, "FLT-001", 5, "2025-01-11"))
+
+    rows = aggregates.supplier_months(supplier_id=1)
+    assert rows == [
+        {
+            "supplier_id": 1,
+            "month": "2025-01",
+            "count": 3,
+            "units": 17,
+            "total": "3001.50",
+        }
+    ]
+
+    purchases.remove_by_id(2)
+    assert aggregates.supplier_months(1)[0]["total"] == "1.50"
+    assert aggregates.article_months("BRK-045") == []
+
+
+def test_aggregates_rebuild_matches_incremental(temp_path):
+    details, purchases = _repos(temp_path)
+    incremental = SpendAggregates(details)
+    purchases.attach(incremental)
+
+    purchases.add_many(
+        [
+            Purchase(i % 3 + 1, "FLT-001", i, f"2025-0{i % 4 + 1}-01")
+            for i in range(1, 30)
+        ]
+    )
+    purchases.remove_by_id(7)
+
+    rebuilt = SpendAggregates(details)
+    assert rebuilt.rebuild(purchases.repository) == 28
+    assert rebuilt.supplier_months() == incremental.supplier_months()
+    assert rebuilt.article_months(month_from="2025-02") == incremental.article_months(
+        month_from="2025-02"
+    )
+
+
+def test_rebuild_views_single_pass_with_shared_prices(temp_path):
+    details, purchases = _repos(temp_path)
+    purchases.add_many(
+        [
+            Purchase(i % 3 + 1, "FLT-001" if i % 2 else "NEW-001", i, "2025-01-01")
+            for i in range(1, 20)
+        ]
+    )
+    prices = PriceCache(details)
+    views = (
+        SpendAggregates(details, prices),
+        ArticleSupplierIndex(details, prices),
+        PurchaseRollups(details, prices=prices),
+    )
+    assert rebuild_views(purchases.repository, *views) == 19
+
+    separate = SpendAggregates(details)
+    separate.rebuild(purchases.repository)
+    assert views[0].supplier_months() == separate.supplier_months()
+    assert views[2].hwm_id == 19
+    assert views[2].refresh(purchases.repository)["added"] == 0
+
+    # артикула не было в каталоге: 0 не запоминается навсегда
+    assert prices.get("NEW-001") == 0
+    details.add(Detail("NEW-001", "Новая", 5))
+    assert prices.get("NEW-001") == 0
+    prices._missing["NEW-001"] = 0.0  # срок отрицательной записи истёк
+    assert prices.get("NEW-001") == 500
+
+
+def test_delete_subtracts_spend_that_was_added(temp_path):
+    details, purchases = _repos(temp_path)
+    details.add(Detail("NEW-001", "Новая", 1))
+    prices = PriceCache(details)
+    aggregates = SpendAggregates(details, prices)
+    purchases.attach(aggregates)
+
+    purchases.add(Purchase(1, "NEW-001", 2, "2025-01-10"))
+    purchases.add(Purchase(1, "NEW-001", 1, "2025-01-11"))
+    prices.set("NEW-001", 500)  # цена изменилась между добавлением и удалением
+    purchases.remove_by_id(1)
+    assert aggregates.by_supplier_month == {(1, "2025-01"): [1, 1, 100]}
+    assert aggregates.by_article_month == {("NEW-001", "2025-01"): [1, 1, 100]}
+
+    # артикула не было в каталоге (0), цена появилась позже
+    purchases.add(Purchase(2, "ABS-777", 3, "2025-02-01"))
+    prices.set("ABS-777", 1000)
+    purchases.remove_by_id(3)
+    assert aggregates.supplier_months(2) == []
+    assert aggregates.by_article_month == {("NEW-001", "2025-01"): [1, 1, 100]}
+
+
+def test_views_refresh_purchases_of_other_processes(temp_path):
+    details_path = temp_path(".json")
+    purchases_path = temp_path(".jsonl")
+    details = Detail_rep_json(details_path)
+    details.add(Detail("FLT-001", "Фильтр", 500))
+    purchases = PurchaseRepObservable(Purchase_rep_jsonl(purchases_path))
+    aggregates = SpendAggregates(details)
+    index = ArticleSupplierIndex(details)
+    purchases.attach(aggregates)
+    purchases.attach(index)
+    purchases.add(Purchase(1, "FLT-001", 1, "2025-01-10"))
+
+    # другой процесс дописал закупки в то же хранилище
+    other = Purchase_rep_jsonl(purchases_path)
+    other.add_many(
+        [
+            Purchase(1, "FLT-001", 2, "2025-01-11"),
+            Purchase(2, "FLT-001", 1, "2025-01-12"),
+        ]
+    )
+
+    # своя закупка (учтена событием, id выше отметки) не учитывается повторно
+    reader = Purchase_rep_jsonl(purchases_path)
+    assert aggregates.refresh(reader) == 2
+    assert index.refresh(reader) == 2
+    assert aggregates.refresh(reader) == 0
+    assert aggregates.supplier_months(1)[0]["count"] == 2
+    assert aggregates.article_months("FLT-001")[0]["units"] == 4
+    assert [o.supplier_id for o in index.get_suppliers("FLT-001")] == [2, 1]
+
+    rebuilt = SpendAggregates(details)
+    rebuilt.rebuild(reader)
+    assert rebuilt.by_supplier_month == aggregates.by_supplier_month
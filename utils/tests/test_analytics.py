@@ -0,0 +1,70 @@
+from datetime import date
+
+from modules.analytics import PurchaseColumns, spend_by
+from modules.models.detail import Detail
+from modules.models.purchase import Purchase
+
+
+def _columns():
+    purchases = [
+        Purchase(1, "FLT-001", 10, "2025-01-10"),
+        Purchase(2, "FLT-001", 5, "2025-01-12"),
+        Purchase(1, "BRK-045", 3, "2025-02-01"),
+        Purchase(1, "FLT-001", 7, "2025-01-10"),
+    ]
+    columns = PurchaseColumns.from_purchases(purchases)
+    prices = columns.price_column(
+        [Detail("FLT-001", "Фильтр", "0.10"), Detail("BRK-045", "Колодки", 1500)]
+    )
+    return columns, prices
+
+
+def test_spend_by_supplier():
+    columns, prices = _columns()
+    report = spend_by(columns, prices, by=("supplier",))
+    assert report.keys["supplier"].tolist() == [1, 2]
+    assert report.total_kop.tolist() == [170 + 450000, 50]
+    assert report.units.tolist() == [20, 5]
+
+
+def test_spend_by_supplier_and_month_rows():
+    columns, prices = _columns()
+    rows = spend_by(columns, prices, by=("supplier", "month")).to_rows()
+    assert rows[0] == {
+        "supplier_id": 1,
+        "month": "2025-01",
+        "total": "1.70",
+        "units": 17,
+        "count": 2,
+        "avg_unit_price": "0.10",
+    }
+    assert [(r["supplier_id"], r["month"]) for r in rows] == [
+        (1, "2025-01"),
+        (1, "2025-02"),
+        (2, "2025-01"),
+    ]
+
+
+def test_spend_by_article_day_with_period():
+    columns, prices = _columns()
+    report = spend_by(columns, prices, by=("article", "day"), date_to=date(2025, 1, 11))
+    assert report.to_rows()[0]["day"] == "2025-01-10"
+    assert len(report) == 1
+
+    empty = spend_by(columns, prices, date_from=date(2030, 1, 1))
+    assert len(empty) == 0
+
+
+def test_dense_and_sorted_grouping_agree(monkeypatch):
+    from modules import analytics
+    from utils.bench.bench_analytics import synthetic_columns
+
+    columns, prices = synthetic_columns(20_000, suppliers=15, articles=40)
+    dense = spend_by(columns, prices, by=("supplier", "month"))
+
+    monkeypatch.setattr(analytics, "DENSE_GROUPS_LIMIT", 0)
+    sorted_ = spend_by(columns, prices, by=("supplier", "month"))
+
+    assert dense.total_kop.tolist() == sorted_.total_kop.tolist()
+    assert dense.units.tolist() == sorted_.units.tolist()
+    assert dense.keys["month"].tolist() == sorted_.keys["month"].tolist()
@@ -0,0 +1,54 @@
+import os
+
+import app as web
+from controllers.supplier_controller import SupplierController
+
+
+def test_create_app_is_independent_and_configurable():
+    first = web.create_app({"INIT_RESOURCES": False, "STALE_MAX_AGE": 5.0})
+    second = web.create_app({"INIT_RESOURCES": False})
+
+    assert first.config["STALE_MAX_AGE"] == 5.0
+    assert second.config["STALE_MAX_AGE"] == web.DEFAULT_CONFIG["STALE_MAX_AGE"]
+    assert first.extensions["controllers"] is not second.extensions["controllers"]
+    rules = {rule.rule for rule in first.url_map.iter_rules()}
+    assert {"/", "/api/suppliers", "/api/suppliers/<int:supplier_id>"} <= rules
+
+
+def test_resources_are_initialized_once_per_process(monkeypatch):
+    calls = []
+
+    def fake_initialize(app):
+        calls.append(os.getpid())
+        app.extensions["controllers"]["main"] = "контроллер"
+
+    monkeypatch.setattr(web, "initialize_app", fake_initialize)
+    application = web.create_app({"TESTING": True})
+    client = application.test_client()
+
+    client.get("/supplier_form")
+    client.get("/supplier_form")
+    assert calls == [os.getpid()]
+    assert application.extensions["controllers"]["main"] == "контроллер"
+
+    # в «новом процессе» (после fork) ресурсы и метка ETag создаются заново
+    boot_id = application.extensions["boot_id"]
+    application.extensions["pid"] = -1
+    client.get("/supplier_form")
+    assert len(calls) == 2
+    assert application.extensions["boot_id"] != boot_id
+
+
+def test_supplier_details_flight_timeout_is_503():
+    class TimingOutRepo:
+        def get_by_id(self, supplier_id):
+            raise TimeoutError
+
+    application = web.create_app({"TESTING": True, "INIT_RESOURCES": False})
+    application.extensions["controllers"]["main"] = SupplierController(
+        TimingOutRepo()  # type: ignore
+    )
+
+    response = application.test_client().get("/api/suppliers/1")
+    assert response.status_code == 503
+    assert response.get_json()["error"] == "Database timeout"
@@ -0,0 +1,74 @@
+from datetime import date
+
+from controllers.detail_controller import DetailController
+from modules.article_index import ArticleSupplierIndex, CatalogPrices
+from modules.models.detail import Detail
+from modules.models.purchase import Purchase
+from modules.models.supplier import Supplier
+from modules.repositories import (
+    Detail_rep_json,
+    DetailRepObservable,
+    Purchase_rep_json,
+    PurchaseRepObservable,
+    Supplier_rep_json,
+)
+
+
+def test_article_index_incremental_updates(temp_path):
+    details_path = temp_path(".json")
+    purchases_path = temp_path(".json")
+
+    details = Detail_rep_json(details_path)
+    details.add(Detail("FLT-001", "Фильтр", 500))
+    purchases = PurchaseRepObservable(Purchase_rep_json(purchases_path))
+    index = ArticleSupplierIndex(details)
+    purchases.attach(index)
+
+    purchases.add_many(
+        [
+            Purchase(1, "FLT-001", 10, "2025-01-10"),
+            Purchase(2, "FLT-001", 5, "2025-03-01"),
+            Purchase(1, "FLT-001", 1, "2025-01-11"),
+        ]
+    )
+
+    # Цена одинаковая — выше поставщик с более свежей закупкой
+    assert [o.supplier_id for o in index.get_suppliers("FLT-001")] == [2, 1]
+    cheapest = index.cheapest("FLT-001")
+    assert cheapest is not None and cheapest.price_kop == 50000
+
+    purchases.remove_by_id(2)
+    assert [o.supplier_id for o in index.get_suppliers("FLT-001")] == [1]
+    assert index.cheapest("FLT-001").last_purchase_date == date(2025, 1, 11)  # type: ignore
+
+    purchases.remove_by_id(1)
+    purchases.remove_by_id(3)
+    assert index.cheapest("FLT-001") is None
+
+    rebuilt = ArticleSupplierIndex(details)
+    assert rebuilt.rebuild(purchases.repository) == 0
+
+
+def test_article_suppliers_batch_and_catalog_prices(temp_path):
+    details = DetailRepObservable(Detail_rep_json(temp_path(".json")))
+    details.add(Detail("FLT-001", "Фильтр", 500))
+    suppliers = Supplier_rep_json(temp_path(".json"))
+    suppliers.add(Supplier(name="Поставщик 1", phone="+71234567890"))
+    suppliers.add(Supplier(name="Поставщик 2", phone="+70987654321"))
+    suppliers.get_by_id = None  # type: ignore # только пакетное чтение
+
+    purchases = PurchaseRepObservable(Purchase_rep_json(temp_path(".json")))
+    index = ArticleSupplierIndex(details)
+    purchases.attach(index)
+    details.attach(CatalogPrices(index))
+    purchases.add(Purchase(1, "FLT-001", 1, "2025-01-10"))
+    purchases.add(Purchase(2, "FLT-001", 1, "2025-01-11"))
+    purchases.add(Purchase(3, "FLT-001", 1, "2025-01-12"))  # поставщика нет
+
+    controller = DetailController(details, index, suppliers)
+    result = controller.get_article_suppliers("FLT-001")
+    assert [i["supplier"].supplier_id for i in result["items"]] == [2, 1]
+
+    details.replace_by_article("FLT-001", Detail("FLT-001", "Фильтр", 400))
+    assert index.cheapest("FLT-001").price_kop == 40000  # type: ignore
+    assert index.prices.get("FLT-001") == 40000
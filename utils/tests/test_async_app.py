@@ -0,0 +1,243 @@
+import asyncio
+import gzip
+import json
+import os
+import tempfile
+
+from async_app import create_async_app
+from controllers.async_supplier_controller import AsyncSupplierController
+from modules.invalidation_bus import InvalidationBus
+from modules.models.supplier import Supplier
+from modules.repositories import Supplier_rep_json, SupplierRepAsyncFile
+
+
+def make_repo(count: int) -> tuple[str, SupplierRepAsyncFile]:
+    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
+        file_path = f.name
+    repo = Supplier_rep_json(file_path)
+    for i in range(count):
+        repo.add(Supplier(name=f"Поставщик {i}", phone=f"+7{i:010d}", address="Москва"))
+    return file_path, SupplierRepAsyncFile(repo)
+
+
+async def call(app, method: str, path: str, body=None, headers=None) -> dict:
+    """Запрос к ASGI-приложению без сервера"""
+    path, _, query = path.partition("?")
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query.encode(),
+        "headers": [
+            (k.lower().encode(), v.encode()) for k, v in (headers or {}).items()
+        ],
+    }
+    payload = json.dumps(body).encode() if body is not None else b""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": payload, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return {
+        "status": messages[0]["status"],
+        "headers": {k.decode(): v.decode() for k, v in messages[0]["headers"]},
+        "body": messages[1]["body"],
+    }
+
+
+class RecordingBus(InvalidationBus):
+    """Шина без транспорта: запоминает опубликованные сообщения"""
+
+    def __init__(self):
+        super().__init__()
+        self.sent = []
+
+    def _send(self, payload: str):
+        self.sent.append(json.loads(payload))
+
+    def _listen(self):
+        pass
+
+
+def test_async_controller_crud():
+    file_path, repo = make_repo(3)
+    controller = AsyncSupplierController(repo)
+
+    async def scenario():
+        page = await controller.get_suppliers_page(page=1, page_size=2)
+        assert page["success"] and page["total_count"] == 3 and page["total_pages"] == 2
+        assert [s.name for s in page["items"]] == ["Поставщик 0", "Поставщик 1"]
+
+        result = await controller.validate_and_add_supplier("", "+70000000000")
+        assert set(result["validation_errors"]) == {"name"}
+        result = await controller.validate_and_add_supplier(
+            "Новый", "+79990000000", " Казань "
+        )
+        assert result["success"]
+        new_id = result["supplier_id"]
+
+        result = await controller.validate_and_update_supplier(
+            new_id, "Новый", "+79990000001"
+        )
+        assert result["success"]
+        details = await controller.get_supplier_details(new_id)
+        assert details["supplier"]["phone"] == "+79990000001"
+
+        result = await controller.validate_and_delete_supplier(new_id)
+        assert result["message"] == "Поставщик 'Новый' успешно удален"
+        assert not (await controller.get_supplier_details(new_id))["success"]
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        os.unlink(file_path)
+
+
+def test_asgi_routes_concurrent_requests_and_etag():
+    file_path, repo = make_repo(100)
+    app = create_async_app(repo, {"COMPRESS_MIN_SIZE": 512})
+
+    async def scenario():
+        # одновременные запросы обслуживаются одним циклом событий
+        responses = await asyncio.gather(
+            *(
+                call(app, "GET", f"/api/suppliers?page={k}&page_size=10")
+                for k in range(1, 11)
+            )
+        )
+        pages = [json.loads(r["body"]) for r in responses]
+        assert [p["page"] for p in pages] == list(range(1, 11))
+        assert {p["total_count"] for p in pages} == {100}
+
+        response = await call(
+            app,
+            "GET",
+            "/api/suppliers?page_size=100",
+            headers={"Accept-Encoding": "gzip"},
+        )
+        assert response["headers"]["content-encoding"] == "gzip"
+        assert json.loads(gzip.decompress(response["body"]))["total_count"] == 100
+
+        detail = await call(app, "GET", "/api/suppliers/1")
+        assert json.loads(detail["body"])["supplier"]["name"] == "Поставщик 0"
+        etag = detail["headers"]["etag"]
+        cached = await call(
+            app, "GET", "/api/suppliers/1", headers={"If-None-Match": etag}
+        )
+        assert cached["status"] == 304
+
+        added = await call(
+            app,
+            "POST",
+            "/api/suppliers/add",
+            {"name": "Новый", "phone": "+79990000000"},
+        )
+        assert json.loads(added["body"])["success"]
+        assert (await call(app, "POST", "/api/suppliers/add"))["status"] == 400
+        assert (await call(app, "DELETE", "/api/suppliers/1"))["status"] == 200
+        assert (await call(app, "GET", "/api/unknown"))["status"] == 404
+        assert (await call(app, "POST", "/api/suppliers"))["status"] == 405
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        os.unlink(file_path)
+
+
+def test_async_writes_published_to_invalidation_bus():
+    file_path, repo = make_repo(1)
+    bus = RecordingBus()
+    controller = AsyncSupplierController(repo, bus)
+
+    async def scenario():
+        new_id = (await controller.validate_and_add_supplier("Новый", "+79990000000"))[
+            "supplier_id"
+        ]
+        await controller.validate_and_update_supplier(new_id, "Новый", "+79990000001")
+        await controller.validate_and_delete_supplier(new_id)
+        # ошибка валидации ничего не публикует
+        await controller.validate_and_add_supplier("", "")
+        return new_id
+
+    try:
+        new_id = asyncio.run(scenario())
+    finally:
+        os.unlink(file_path)
+    assert [(m["e"], m["c"]) for m in bus.sent] == [
+        ("supplier", [["item_added", new_id]]),
+        ("supplier", [["item_updated", new_id]]),
+        ("supplier", [["item_deleted", new_id]]),
+    ]
+
+
+def test_asgi_request_body_size_limit():
+    file_path, repo = make_repo(0)
+    app = create_async_app(repo, {"MAX_BODY_SIZE": 100})
+
+    async def chunked(chunks: list[bytes]) -> int:
+        scope = {"type": "http", "method": "POST", "path": "/api/suppliers/add"}
+        messages = iter(
+            {"type": "http.request", "body": c, "more_body": i < len(chunks) - 1}
+            for i, c in enumerate(chunks)
+        )
+        sent = []
+
+        async def receive():
+            return next(messages)
+
+        async def send(message):
+            sent.append(message)
+
+        await app(scope, receive, send)
+        return sent[0]["status"]
+
+    async def scenario():
+        # объявленная длина больше лимита — тело не читается
+        response = await call(
+            app,
+            "POST",
+            "/api/suppliers/add",
+            {"name": "Новый", "phone": "+79990000000"},
+            headers={"Content-Length": "1000"},
+        )
+        assert response["status"] == 413
+        # без Content-Length чтение прерывается на превышении лимита
+        assert await chunked([b"x" * 60, b"x" * 60, b"x" * 60]) == 413
+        ok = await call(
+            app,
+            "POST",
+            "/api/suppliers/add",
+            {"name": "Новый", "phone": "+79990000000"},
+        )
+        assert json.loads(ok["body"])["success"]
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        os.unlink(file_path)
+
+
+def test_asgi_database_timeout_is_503():
+    file_path, repo = make_repo(1)
+    app = create_async_app(repo)
+
+    async def timeout(*args, **kwargs):
+        raise TimeoutError  # так asyncpg сообщает о лимите timeout=
+
+    repo.get_by_id = timeout  # type: ignore
+    repo.get_count = timeout  # type: ignore
+
+    async def scenario():
+        detail = await call(app, "GET", "/api/suppliers/1")
+        assert detail["status"] == 503
+        assert json.loads(detail["body"])["error"] == "Database timeout"
+        assert (await call(app, "GET", "/api/suppliers"))["status"] == 503
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        os.unlink(file_path)
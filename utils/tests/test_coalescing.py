@@ -0,0 +1,90 @@
+import threading
+
+from modules.coalescing import BatchObserver, EventCoalescer
+from modules.models.supplier import Supplier
+from modules.observer import Observer
+
+
+class RecordingBatchObserver(BatchObserver):
+    def __init__(self):
+        self.batches = []
+        self.delivered = threading.Event()
+
+    def update_batch(self, events):
+        self.batches.append(events)
+        self.delivered.set()
+
+
+class FailingObserver(Observer):
+    def update(self, event_type, data=None):
+        raise RuntimeError("сбой наблюдателя")
+
+
+class RecordingObserver(Observer):
+    def __init__(self):
+        self.events = []
+
+    def update(self, event_type, data=None):
+        self.events.append((event_type, data))
+
+
+def _supplier(supplier_id: int, name: str) -> Supplier:
+    return Supplier(
+        name=name, phone="+71234567890", address="Москва", supplier_id=supplier_id
+    )
+
+
+def test_flush_merges_events_per_id_in_order():
+    coalescer = EventCoalescer(window=None)
+    batch_observer = RecordingBatchObserver()
+    plain_observer = RecordingObserver()
+    deleted_only = RecordingObserver()
+    coalescer.attach(FailingObserver())
+    coalescer.attach(batch_observer)
+    coalescer.attach(plain_observer)
+    coalescer.attach(deleted_only, events=("item_deleted",))
+
+    s1, s1_new, s2, s3 = (
+        _supplier(1, "Поставщик 1"),
+        _supplier(1, "Новый поставщик"),
+        _supplier(2, "Поставщик 2"),
+        _supplier(3, "Поставщик 3"),
+    )
+    coalescer.update("item_added", s1)
+    coalescer.update("short_list_loaded", {"page": 1})
+    coalescer.update("item_updated", s1_new)  # added + updated -> added
+    coalescer.update("items_added", [s2])
+    coalescer.update("item_deleted", 2)  # added + deleted -> нет события
+    coalescer.update("item_updated", s3)
+    coalescer.update("item_deleted", 3)  # updated + deleted -> deleted
+    assert batch_observer.batches == []
+
+    assert coalescer.flush() == 3
+    expected = [
+        ("item_added", s1_new),
+        ("short_list_loaded", {"page": 1}),
+        ("item_deleted", 3),
+    ]
+    assert batch_observer.batches == [expected]
+    assert plain_observer.events == expected
+    assert deleted_only.events == [("item_deleted", 3)]
+    assert (coalescer.received, coalescer.delivered, coalescer.errors) == (7, 3, 1)
+    assert coalescer.flush() == 0
+
+
+def test_window_flushes_by_timer():
+    coalescer = EventCoalescer(window=0.01)
+    observer = RecordingBatchObserver()
+    coalescer.attach(observer)
+
+    for i in range(3):
+        coalescer.update("item_updated", _supplier(1, f"Поставщик {i}"))
+    coalescer.update("short_list_loaded", {"page": 1})
+
+    assert observer.delivered.wait(5)
+    [batch] = observer.batches
+    assert [event_type for event_type, _ in batch] == [
+        "item_updated",
+        "short_list_loaded",
+    ]
+    assert batch[0][1].name == "Поставщик 2"
@@ -0,0 +1,68 @@
+import gzip
+import os
+import tempfile
+
+import app as web
+from controllers.supplier_controller import SupplierController
+from modules.compression import choose_encoding, compress_stream, supported_encodings
+from modules.models.supplier import Supplier
+from modules.page_cache import DataVersion
+from modules.repositories import Supplier_rep_json, SupplierRepObservable
+
+
+def test_choose_encoding_and_stream():
+    preferred = supported_encodings()[0]
+    assert choose_encoding("gzip, deflate, br") == preferred
+    assert choose_encoding("gzip;q=0.5, br;q=0") == "gzip"
+    assert choose_encoding("*") == preferred
+    assert choose_encoding("identity") is None
+    assert choose_encoding("gzip;q=0") is None
+    assert choose_encoding(None) is None
+
+    chunks = [f"строка {i}\n".encode() for i in range(1000)]
+    compressed = b"".join(compress_stream(iter(chunks), "gzip"))
+    assert gzip.decompress(compressed) == b"".join(chunks)
+
+
+def test_api_and_static_responses_are_compressed():
+    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
+        file_path = f.name
+    repo = Supplier_rep_json(file_path)
+    for i in range(100):
+        repo.add(Supplier(name=f"Поставщик {i}", phone=f"+7{i:010d}", address="Москва"))
+    application = web.create_app({"TESTING": True, "INIT_RESOURCES": False})
+    controllers = application.extensions["controllers"]
+    controllers["main"] = SupplierController(SupplierRepObservable(repo))
+    controllers["version"] = DataVersion()
+    client = application.test_client()
+    gzip_only = {"Accept-Encoding": "gzip"}
+
+    try:
+        plain = client.get("/api/suppliers?page_size=100")
+        assert "Content-Encoding" not in plain.headers
+        assert plain.headers["Vary"] == "Accept-Encoding"
+
+        response = client.get("/api/suppliers?page_size=100", headers=gzip_only)
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(response.data) == plain.data
+        assert len(response.data) < len(plain.data)
+        etag = response.headers["ETag"]
+        assert etag == plain.headers["ETag"][:-1] + '-gzip"'
+
+        # ETag сжатого представления подходит для условного запроса
+        headers = {**gzip_only, "If-None-Match": etag}
+        response = client.get("/api/suppliers?page_size=100", headers=headers)
+        assert response.status_code == 304
+
+        # маленькие тела не сжимаются
+        small = client.get("/api/suppliers/1", headers=gzip_only)
+        assert "Content-Encoding" not in small.headers
+
+        static = client.get("/static/script.js", headers=gzip_only)
+        static_path = os.path.join(application.static_folder, "script.js")  # type: ignore
+        with open(static_path, "rb") as f:
+            assert gzip.decompress(static.data) == f.read()
+        assert static.headers["Vary"] == "Accept-Encoding"
+        static.close()
+    finally:
+        os.unlink(file_path)
@@ -0,0 +1,89 @@
+import os
+import tempfile
+from email.utils import formatdate
+
+import app as web
+from controllers.supplier_controller import SupplierController
+from modules.conditional import (
+    content_etag,
+    etag_matches,
+    new_boot_id,
+    not_modified,
+    validator_headers,
+    version_etag,
+)
+from modules.models.supplier import Supplier
+from modules.page_cache import DataVersion
+from modules.repositories import Supplier_rep_json, SupplierRepObservable
+
+
+class CountingRepo(Supplier_rep_json):
+    def __init__(self, file_path):
+        super().__init__(file_path)
+        self.reads = 0
+
+    def get_all(self):
+        self.reads += 1
+        return super().get_all()
+
+
+def test_etag_matching_and_last_modified():
+    etag = version_etag("boot", 3)
+    assert etag != version_etag("boot", 4)
+    assert etag != version_etag(new_boot_id(), 3)  # другой воркер
+    assert content_etag(b"a") == content_etag(b"a") != content_etag(b"b")
+
+    assert etag_matches(f'"x", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"x"', etag)
+
+    changed_at = 1_700_000_000.5
+    since = formatdate(1_700_000_000, usegmt=True)
+    assert not_modified(etag, None, changed_at, since)
+    assert not not_modified(etag, None, changed_at + 1, since)
+    assert not not_modified(etag, None, changed_at, "не дата")
+    # при наличии If-None-Match дата не учитывается
+    assert not not_modified(etag, '"x"', changed_at, since)
+
+    headers = validator_headers(etag, changed_at)
+    assert headers["Last-Modified"] == since
+    assert headers["Cache-Control"] == "no-cache"
+
+
+def test_supplier_routes_answer_304():
+    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
+        file_path = f.name
+    repo = CountingRepo(file_path)
+    repo.add(Supplier(name="Поставщик 1", phone="+71234567890", address="Москва"))
+    version = DataVersion()
+    application = web.create_app({"TESTING": True, "INIT_RESOURCES": False})
+    controllers = application.extensions["controllers"]
+    controllers["main"] = SupplierController(SupplierRepObservable(repo))
+    controllers["version"] = version
+    client = application.test_client()
+
+    try:
+        response = client.get("/api/suppliers")
+        etag = response.headers["ETag"]
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "no-cache"
+        reads = repo.reads
+
+        response = client.get("/api/suppliers", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.data == b""
+        assert repo.reads == reads  # запросы страницы не выполнялись
+
+        version.bump()
+        response = client.get("/api/suppliers", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+        response = client.get("/api/suppliers/1")
+        etag = response.headers["ETag"]
+        response = client.get("/api/suppliers/1", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert "ETag" not in client.get("/api/suppliers/99").headers
+    finally:
+        os.unlink(file_path)
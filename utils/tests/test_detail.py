@@ -299,3 +299,42 @@ def test_detail_price_max_value():
     """Тест максимальной валидной цены"""
     detail = Detail("FLT-001", "Фильтр", 999999.99)
     assert detail.price == Decimal("999999.99")
+
+
+# ============ Цена в копейках ============
+
+
+def test_detail_price_kop_internal():
+    """Тест внутреннего представления цены в копейках"""
+    detail = Detail("FLT-001", "Фильтр", "500.50")
+    assert detail.price_kop == 50050
+    assert detail.price == Decimal("500.50")
+
+
+def test_detail_price_kop_setter():
+    """Тест установки цены в копейках"""
+    detail = Detail("FLT-001", "Фильтр")
+    detail.price_kop = 12345
+    assert detail.price == Decimal("123.45")
+
+    with pytest.raises(ValueError, match="Некорректная цена в копейках"):
+        detail.price_kop = 100_000_000
+
+
+def test_detail_to_json_dict_exact():
+    """Тест точной JSON-сериализации цены"""
+    detail = Detail("FLT-001", "Фильтр", 0.1)
+    assert detail.to_json_dict()["price"] == "0.10"
+    assert detail.to_dict()["price"] == Decimal("0.10")
+
+
+def test_money_helpers():
+    """Тест вспомогательных функций для копеек"""
+    from modules.models.money import format_kopecks, spend_kopecks, to_kopecks
+
+    assert to_kopecks(Decimal("999999.99")) == 99_999_999
+    assert to_kopecks(15) == 1500
+    assert spend_kopecks(to_kopecks("0.10"), 3) == 30
+    assert format_kopecks(-5) == "-0.05"
+    with pytest.raises(ValueError):
+        to_kopecks("1.005")
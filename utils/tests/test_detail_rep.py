@@ -0,0 +1,78 @@
+import pytest
+
+from modules.models.detail import Detail
+from modules.repositories import Detail_rep_json, Detail_rep_yaml
+
+
+def test_json_detail_repo_add_many_and_get(temp_path):
+    file_path = temp_path(".json")
+
+    repo = Detail_rep_json(file_path)
+    repo.add_many(
+        [
+            Detail("FLT-001", "Фильтр масляный", "500.50"),
+            Detail("BRK-045", "Тормозные колодки", 1500),
+        ]
+    )
+
+    found = repo.get_by_article("FLT-001")
+    assert found is not None
+    assert found.price_kop == 50050
+    assert repo.get_by_article("NONE") is None
+
+    # Данные переживают перезагрузку из файла
+    reloaded = Detail_rep_json(file_path)
+    assert [d.article for d in reloaded.get_many(["BRK-045", "X", "FLT-001"])] == [
+        "BRK-045",
+        "FLT-001",
+    ]
+
+
+def test_json_detail_repo_duplicate_article(temp_path):
+    file_path = temp_path(".json")
+
+    repo = Detail_rep_json(file_path)
+    repo.add(Detail("FLT-001", "Фильтр", 100))
+    with pytest.raises(ValueError, match="уже существует"):
+        repo.add_many([Detail("AIR-001", "Воздушный", 1), Detail("FLT-001", "Ф", 1)])
+    assert repo.get_count() == 1
+
+
+def test_yaml_detail_repo_paging_by_price_and_name(temp_path):
+    file_path = temp_path(".yaml")
+
+    repo = Detail_rep_yaml(file_path)
+    repo.add_many(
+        [
+            Detail("A-1", "Виброопора", "30.00"),
+            Detail("A-2", "Амортизатор", "9.99"),
+            Detail("A-3", "Бампер", "100.00"),
+        ]
+    )
+
+    by_price = repo.get_k_n_short_list(1, 2, sort_field="price")
+    assert [d.article for d in by_price] == ["A-2", "A-1"]
+
+    by_name = repo.get_k_n_short_list(2, 2, sort_field="name")
+    assert [d.article for d in by_name] == ["A-1"]
+
+    with pytest.raises(ValueError):
+        repo.get_k_n_short_list(1, 2, sort_field="unknown")
+
+
+def test_json_detail_repo_replace_and_remove(temp_path):
+    file_path = temp_path(".json")
+
+    repo = Detail_rep_json(file_path)
+    repo.add_many([Detail(f"D-{i}", f"Деталь {i}", i) for i in range(1, 4)])
+
+    repo.replace_by_article("D-2", Detail("D-2", "Деталь новая", "2.50"))
+    assert repo.get_by_article("D-2").name == "Деталь новая"  # type: ignore
+
+    repo.remove_by_article("D-1")
+    assert repo.get_count() == 2
+    assert repo.get_by_article("D-1") is None
+    assert repo.get_by_article("D-3") is not None
+
+    with pytest.raises(ValueError):
+        repo.remove_by_article("D-1")
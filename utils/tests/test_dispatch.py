@@ -0,0 +1,133 @@
+import threading
+
+import pytest
+
+from modules.dispatch import DROP_NEW, DROP_OLDEST, QueueDispatcher, SyncDispatcher
+from modules.observer import Observer, Subject
+
+
+class RecordingObserver(Observer):
+    def __init__(self, gate: threading.Event | None = None):
+        self.events = []
+        self.gate = gate
+        self.started = threading.Event()
+
+    def update(self, event_type, data=None):
+        self.started.set()
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.events.append((event_type, data))
+
+
+class FailingObserver(Observer):
+    def update(self, event_type, data=None):
+        raise RuntimeError("сбой наблюдателя")
+
+
+class DemoSubject(Subject):
+    pass
+
+
+def test_sync_dispatch_is_default():
+    subject = DemoSubject()
+    observer = RecordingObserver()
+    subject.attach(observer)
+    subject.notify("item_added", 1)
+    assert isinstance(subject.dispatcher, SyncDispatcher)
+    assert observer.events == [("item_added", 1)]
+
+
+def test_queue_dispatch_isolates_observer_errors():
+    dispatcher = QueueDispatcher(maxsize=10)
+    subject = DemoSubject(dispatcher)
+    observer = RecordingObserver()
+    subject.attach(FailingObserver())
+    subject.attach(observer)
+
+    for i in range(3):
+        subject.notify("item_added", i)
+    assert dispatcher.flush(timeout=5)
+
+    assert observer.events == [("item_added", i) for i in range(3)]
+    metrics = dispatcher.snapshot()
+    assert metrics["delivered"] == 3
+    assert metrics["errors"] == 3
+    assert metrics["depth"] == 0
+    dispatcher.close()
+    with pytest.raises(RuntimeError):
+        subject.notify("item_added", 4)
+
+
+@pytest.mark.parametrize(
+    "policy, expected", [(DROP_NEW, [0, 1, 2]), (DROP_OLDEST, [0, 3, 4])]
+)
+def test_queue_dispatch_drop_policies(policy, expected):
+    gate = threading.Event()
+    dispatcher = QueueDispatcher(maxsize=2, policy=policy)
+    subject = DemoSubject(dispatcher)
+    observer = RecordingObserver(gate)
+    subject.attach(observer)
+
+    subject.notify("event", 0)
+    # Дождаться, пока обработчик заберёт первое событие и встанет на gate
+    assert observer.started.wait(5)
+    for i in range(1, 5):
+        subject.notify("event", i)
+    gate.set()
+    assert dispatcher.flush(timeout=5)
+
+    assert [data for _, data in observer.events] == expected
+    assert dispatcher.metrics.dropped == 2
+    assert dispatcher.metrics.max_depth == 2
+    dispatcher.close()
+
+
+def test_queue_dispatch_close_does_not_block_on_full_queue():
+    gate = threading.Event()
+    dispatcher = QueueDispatcher(maxsize=1, policy=DROP_NEW)
+    subject = DemoSubject(dispatcher)
+    observer = RecordingObserver(gate)
+    subject.attach(observer)
+
+    subject.notify("event", 0)
+    assert observer.started.wait(5)
+    subject.notify("event", 1)  # очередь заполнена, обработчик ждёт gate
+
+    dispatcher.close(timeout=0.1)
+    assert dispatcher.metrics.dropped == 1
+    gate.set()
+    dispatcher._worker.join(5)
+    assert not dispatcher._worker.is_alive()
+    assert observer.events == [("event", 0)]
+
+
+def test_queue_dispatch_close_survives_refill_after_drain():
+    gate = threading.Event()
+    dispatcher = QueueDispatcher(maxsize=1, policy=DROP_NEW)
+    subject = DemoSubject(dispatcher)
+    observer = RecordingObserver(gate)
+    subject.attach(observer)
+
+    subject.notify("event", 0)
+    assert observer.started.wait(5)
+    subject.notify("event", 1)
+
+    # производитель, прошедший проверку _closed, заполняет очередь
+    # между её очисткой и постановкой метки остановки
+    q = dispatcher._queue
+    put_nowait = q.put_nowait
+    refilled = []
+
+    def racing_put_nowait(item):
+        if item is None and not refilled:
+            refilled.append(True)
+            put_nowait((tuple(subject._observers), "event", 2))
+        put_nowait(item)
+
+    q.put_nowait = racing_put_nowait  # type: ignore
+    dispatcher.close(timeout=0.1)
+    assert dispatcher.metrics.dropped == 2
+    gate.set()
+    dispatcher._worker.join(5)
+    assert not dispatcher._worker.is_alive()
+    assert observer.events == [("event", 0)]
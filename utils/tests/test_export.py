@@ -0,0 +1,65 @@
+import csv
+import io
+import json
+
+import pytest
+
+from controllers.export_controller import ExportController
+from modules.export import export_rows, iter_csv, iter_ndjson
+from modules.models.purchase import Purchase
+from modules.models.supplier import Supplier
+from modules.repositories import Purchase_rep_jsonl, Supplier_rep_json
+
+
+def test_iter_csv_chunks_rows():
+    rows = [(i, f"name, {i}") for i in range(5)]
+    chunks = list(iter_csv(("id", "name"), rows, chunk_rows=2))
+    assert len(chunks) == 3
+    parsed = list(csv.reader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+    assert parsed[0] == ["id", "name"]
+    assert parsed[1:] == [[str(i), f"name, {i}"] for i in range(5)]
+
+
+def test_iter_ndjson_lines():
+    chunks = list(iter_ndjson(("id", "name"), [(1, "а"), (2, None)], chunk_rows=1))
+    assert chunks == ['{"id":1,"name":"а"}\n'.encode(), b'{"id":2,"name":null}\n']
+    assert list(iter_ndjson(("id",), [])) == []
+
+
+def test_export_unknown_format():
+    with pytest.raises(ValueError):
+        export_rows(("id",), [], "xml")
+
+
+def test_export_controller_streams_repositories(temp_path):
+    suppliers_path = temp_path(".json")
+    purchases_path = temp_path(".jsonl")
+    suppliers = Supplier_rep_json(suppliers_path)
+    suppliers.add(Supplier(name="Поставщик 1", phone="+71234567890", address="Москва"))
+    purchases = Purchase_rep_jsonl(purchases_path)
+    purchases.add_many([Purchase(1, "FLT-001", n, "2025-01-10") for n in range(1, 26)])
+    purchases.remove_by_id(3)
+    controller = ExportController(suppliers, purchases)
+
+    mimetype, filename, chunks = controller.export_suppliers("csv")
+    assert (mimetype, filename) == ("text/csv; charset=utf-8", "suppliers.csv")
+    assert b"".join(chunks).decode("utf-8").splitlines() == [
+        "supplier_id,name,phone,address",
+        "1,Поставщик 1,+71234567890,Москва",
+    ]
+
+    # Пачки по 10 строк: курсор по purchase_id не теряет строки между пачками
+    rows = list(purchases.iter_rows(batch_size=10))
+    assert [r[0] for r in rows] == [i for i in range(1, 26) if i != 3]
+
+    _, filename, chunks = controller.export_purchases("ndjson")
+    lines = b"".join(chunks).splitlines()
+    assert filename == "purchases.ndjson"
+    assert len(lines) == 24
+    assert json.loads(lines[0]) == {
+        "purchase_id": 1,
+        "supplier_id": 1,
+        "article": "FLT-001",
+        "quantity": 1,
+        "purchase_date": "2025-01-10",
+    }
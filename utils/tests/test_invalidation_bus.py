@@ -0,0 +1,102 @@
+import shutil
+import tempfile
+import threading
+
+from modules.invalidation_bus import (
+    Invalidation,
+    InvalidationPublisher,
+    MiniCacheInvalidator,
+    UnixSocketBus,
+)
+from modules.models.mini_cache import mini_cache
+from modules.models.supplier import Supplier
+from modules.observer import Observer
+
+
+class RecordingObserver(Observer):
+    def __init__(self, expected: int):
+        self.events = []
+        self.expected = expected
+        self.done = threading.Event()
+
+    def update(self, event_type, data=None):
+        self.events.append((event_type, data))
+        if len(self.events) >= self.expected:
+            self.done.set()
+
+
+def test_unix_socket_bus_delivers_to_other_processes_only():
+    directory = tempfile.mkdtemp()
+    bus_a, bus_b = UnixSocketBus(directory), UnixSocketBus(directory)
+    observer_a, observer_b = RecordingObserver(1), RecordingObserver(2)
+    bus_a.attach(observer_a)
+    bus_b.attach(observer_b)
+    bus_b.attach(MiniCacheInvalidator())
+    bus_a.start()
+    bus_b.start()
+
+    cached = mini_cache.supplier(901, "Поставщик")
+    supplier = Supplier(
+        name="Поставщик", phone="+71234567890", address="Москва", supplier_id=901
+    )
+    InvalidationPublisher(bus_a).update_batch(
+        [("item_updated", supplier), ("item_deleted", 902)]
+    )
+
+    assert observer_b.done.wait(5)
+    assert observer_b.events == [
+        ("item_updated", Invalidation("supplier", 901)),
+        ("item_deleted", Invalidation("supplier", 902)),
+    ]
+    assert mini_cache.supplier(901, "Поставщик") is not cached
+    assert observer_a.events == []
+    assert (bus_a.published, bus_b.received) == (1, 1)
+
+    bus_a.close()
+    bus_b.close()
+    shutil.rmtree(directory)
+
+
+def test_unix_socket_bus_removes_stale_peers():
+    directory = tempfile.mkdtemp()
+    gone = UnixSocketBus(directory)
+    gone._sock.close()  # процесс «упал», файл сокета остался
+    bus = UnixSocketBus(directory)
+
+    bus.publish("supplier", [("item_deleted", 1)])
+    assert bus._peers() == []
+
+    bus.close()
+    shutil.rmtree(directory)
+
+
+def test_pg_notify_bus_reconnects_and_resyncs(monkeypatch):
+    import psycopg2
+
+    from modules import invalidation_bus
+
+    monkeypatch.setattr(invalidation_bus, "RECONNECT_MIN_DELAY", 0.01)
+    bus = invalidation_bus.PgNotifyBus({})
+    observer = RecordingObserver(1)
+    bus.attach(observer)
+    calls = []
+
+    def listen_once(resync):
+        calls.append(resync)
+        if len(calls) < 3:
+            raise psycopg2.OperationalError("соединение разорвано")
+        if resync:
+            bus.notify(invalidation_bus.RESYNC_EVENT)
+        bus._stop.set()
+
+    bus._listen_once = listen_once  # type: ignore
+    cached = mini_cache.supplier(902, "Поставщик")
+    bus.attach(MiniCacheInvalidator())
+    bus.start()
+    assert observer.done.wait(5)
+    bus.close()
+
+    assert calls == [False, True, True]
+    assert bus.connection_errors == 2
+    assert observer.events == [(invalidation_bus.RESYNC_EVENT, None)]
+    assert mini_cache.supplier(902, "Поставщик") is not cached
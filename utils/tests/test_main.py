@@ -108,3 +108,41 @@ def test_supplier_mini_invalid_id_in_csv():
 def test_supplier_missing_field_in_dict():
     # Этот тест УПАДЁТ, потому что мы НЕ ловим исключение
     Supplier({"name": "Тест", "phone": "+7999"})  # ← нет supplier_id → ValueError!
+
+
+# ============ Тесты для кэша кратких объектов ============
+
+
+def test_mini_cache_reuses_objects():
+    from modules.models.mini_cache import MiniCache
+
+    cache = MiniCache(maxsize=2)
+    m1 = cache.supplier(20, "Кэш")
+    assert cache.supplier(20, "Кэш") is m1
+    assert m1 == SupplierMini(20, "Кэш")
+
+    # Другое имя при том же id — новый объект
+    assert cache.supplier(20, "Новое имя") is not m1
+
+
+def test_mini_cache_lru_and_invalidation():
+    from modules.models.mini_cache import MiniCache
+
+    cache = MiniCache(maxsize=2)
+    a = cache.supplier(1, "А")
+    cache.supplier(2, "Б")
+    cache.supplier(3, "В")  # вытесняет id=1
+    assert len(cache) == 2
+    assert cache.supplier(1, "А") is not a
+
+    b = cache.supplier(3, "В")
+    cache.invalidate_supplier(3)
+    assert cache.supplier(3, "В") is not b
+
+
+def test_mini_cache_objects_are_frozen():
+    from modules.models.mini_cache import MiniCache
+
+    m = MiniCache().supplier(21, "Неизменяемый")
+    with pytest.raises(AttributeError):
+        m.name = "Другое"
@@ -0,0 +1,74 @@
+import logging
+
+from modules.logging_observer import LoggingObserver, summarize
+from modules.observer import Observer, Subject
+
+
+class RecordingObserver(Observer):
+    def __init__(self):
+        self.events = []
+
+    def update(self, event_type, data=None):
+        self.events.append((event_type, data))
+
+
+class DemoSubject(Subject):
+    pass
+
+
+def test_per_event_subscriptions():
+    subject = DemoSubject()
+    writes, everything = RecordingObserver(), RecordingObserver()
+    subject.attach(writes, events=["item_added"])
+    subject.attach(everything)
+
+    subject.notify("item_added", 1)
+    subject.notify("data_loaded", [1, 2])
+    assert writes.events == [("item_added", 1)]
+    assert everything.events == [("item_added", 1), ("data_loaded", [1, 2])]
+
+    subject.detach(everything)
+    assert not subject.has_subscribers("data_loaded")
+    assert subject.has_subscribers("item_added")
+
+
+def test_notify_lazy_builds_payload_only_for_subscribers():
+    subject = DemoSubject()
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return {"items": []}
+
+    subject.notify_lazy("short_list_loaded", factory)
+    assert calls == []
+
+    observer = RecordingObserver()
+    subject.attach(observer, events=("short_list_loaded",))
+    subject.notify_lazy("short_list_loaded", factory)
+    assert calls == [1]
+    assert observer.events == [("short_list_loaded", {"items": []})]
+
+
+def test_logging_observer_levels_and_sampling(caplog):
+    logger = logging.getLogger("tests.events")
+    samples = iter([0.05, 0.5])
+    observer = LoggingObserver(logger, sample_rate=0.1, random_fn=lambda: next(samples))
+
+    with caplog.at_level(logging.INFO, logger="tests.events"):
+        assert observer.enabled_events(["item_added", "data_loaded"]) == ["item_added"]
+        observer.update("data_loaded", list(range(1000)))
+        observer.update("item_added", "Поставщик")
+    assert [r.getMessage() for r in caplog.records] == [
+        "Событие: item_added | Поставщик"
+    ]
+
+    caplog.clear()
+    with caplog.at_level(logging.DEBUG, logger="tests.events"):
+        observer.update("data_loaded", list(range(1000)))  # 0.05 < 0.1
+        observer.update("data_loaded", list(range(1000)))  # отброшено выборкой
+    assert [r.getMessage() for r in caplog.records] == [
+        "Событие: data_loaded | <1000 объектов>"
+    ]
+    assert observer.skipped == 1
+    assert summarize({"items": [1, 2], "page": 1}) == "<2 объектов; page=1>"
@@ -0,0 +1,117 @@
+import os
+import tempfile
+import threading
+
+from controllers.supplier_controller import SupplierController
+from modules.dispatch import QueueDispatcher
+from modules.models.supplier import Supplier
+from modules.observer import Observer
+from modules.page_cache import DataVersion, PageCache
+from modules.repositories import Supplier_rep_json, SupplierRepObservable
+
+
+class CountingRepo(Supplier_rep_json):
+    def __init__(self, file_path):
+        super().__init__(file_path)
+        self.reads = 0
+
+    def get_all(self):
+        self.reads += 1
+        return super().get_all()
+
+
+class SlowObserver(Observer):
+    def __init__(self, release):
+        self.release = release
+
+    def update(self, event_type, data=None):
+        self.release.wait(2)
+
+
+def _repo():
+    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
+        file_path = f.name
+    repo = CountingRepo(file_path)
+    repo.add(Supplier(name="Поставщик 1", phone="+71234567890", address="Москва"))
+    repo.add(Supplier(name="Поставщик 2", phone="+70987654321", address="СПб"))
+    return repo, file_path
+
+
+def test_page_cache_hits_until_version_changes():
+    version = DataVersion()
+    cache = PageCache(version, maxsize=2)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_compute("a", compute) == 1
+    assert cache.get_or_compute("a", compute) == 1
+    cache.get_or_compute("b", compute)
+    cache.get_or_compute("c", compute)  # "a" вытеснен
+    assert cache.get_or_compute("a", compute) == 4
+
+    version.update("item_selected")  # чтение не меняет версию
+    assert cache.get_or_compute("a", compute) == 4
+    version.update("item_updated")
+    assert cache.get_or_compute("a", compute) == 5
+    assert cache.stats()["version"] == 1
+
+
+def test_page_cache_expires_entries_after_max_age():
+    now = [0.0]
+    cache = PageCache(DataVersion(), clock=lambda: now[0], max_age=10)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_compute("a", compute) == 1
+    now[0] = 9.9
+    assert cache.get_or_compute("a", compute) == 1
+    now[0] = 10.0  # версия та же, но запись слишком старая
+    assert cache.get_or_compute("a", compute) == 2
+    assert cache.stats()["expirations"] == 1
+
+
+def test_page_cache_skips_failed_and_stale_results():
+    version = DataVersion()
+    cache = PageCache(version)
+
+    cache.get_or_compute("x", lambda: {"success": False}, lambda r: r["success"])
+    assert cache.stats()["size"] == 0
+
+    def compute_during_change():
+        version.bump()  # данные изменились во время запроса
+        return {"success": True}
+
+    cache.get_or_compute("x", compute_during_change)
+    assert cache.stats()["size"] == 0
+
+
+def test_controller_page_cache_sees_own_writes_with_async_dispatch():
+    repo, file_path = _repo()
+    dispatcher = QueueDispatcher()
+    observable = SupplierRepObservable(repo, dispatcher)
+    version = DataVersion()
+    observable.attach(version, events=DataVersion.CHANGE_EVENTS, immediate=True)
+    # медленный наблюдатель в очереди не задерживает смену версии
+    release = threading.Event()
+    observable.attach(SlowObserver(release))
+    controller = SupplierController(observable, PageCache(version))
+
+    try:
+        first = controller.get_suppliers_page(1, 10)
+        assert controller.get_suppliers_page(1, 10) is first
+        reads = repo.reads
+
+        controller.add_supplier("Новый поставщик", "+79990000000", "Казань")
+        page = controller.get_suppliers_page(1, 10)
+        assert page["total_count"] == 3
+        assert repo.reads > reads
+    finally:
+        release.set()
+        dispatcher.close()
+        os.unlink(file_path)
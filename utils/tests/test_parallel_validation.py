@@ -0,0 +1,41 @@
+import pytest
+
+from modules import parallel_validation
+from modules.parallel_validation import validate_rows
+
+
+def test_validate_rows_inline():
+    rows = [
+        {"article": "FLT-001", "name": "Фильтр", "price": "500.00"},
+        {"article": "FLT@001", "name": "Фильтр", "price": "500.00"},
+        "BRK-045, Колодки, 1500.50",
+    ]
+    result = validate_rows("detail", rows)
+    assert [(i, r["article"]) for i, r in result.valid] == [
+        (0, "FLT-001"),
+        (2, "BRK-045"),
+    ]
+    assert len(result.errors) == 1
+    assert result.errors[0][0] == 1
+    assert result.total == 3
+
+
+def test_validate_rows_pool_preserves_order(monkeypatch):
+    monkeypatch.setattr(parallel_validation, "MIN_PARALLEL_ROWS", 0)
+    rows = []
+    for i in range(1, 101):
+        phone = "+7123790909" if i % 10 else "123"  # каждая 10-я — ошибка
+        rows.append({"supplier_id": i, "name": f"Поставщик {i}", "phone": phone})
+
+    result = validate_rows("supplier", rows, workers=2, chunk_size=7)
+    assert [r["supplier_id"] for r in result.records] == [
+        i for i in range(1, 101) if i % 10
+    ]
+    # индекс валидной строки указывает на её строку во входных данных
+    assert all(rows[idx]["supplier_id"] == r["supplier_id"] for idx, r in result.valid)
+    assert [idx for idx, _ in result.errors] == list(range(9, 100, 10))
+
+
+def test_validate_rows_unknown_model():
+    with pytest.raises(ValueError, match="Неизвестная модель"):
+        validate_rows("unknown", [])
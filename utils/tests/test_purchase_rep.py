@@ -0,0 +1,122 @@
+from datetime import date
+
+import pytest
+
+from modules.models.purchase import Purchase
+from modules.repositories import Purchase_rep_json, Purchase_rep_jsonl
+
+
+def _fill(repo):
+    repo.add_many(
+        [
+            Purchase(1, "FLT-001", 10, "2025-01-10"),
+            Purchase(2, "FLT-001", 5, "2025-01-12"),
+            Purchase(1, "BRK-045", 3, "2025-02-01"),
+            Purchase(1, "FLT-001", 7, "2025-01-10"),
+            Purchase(1, "AIR-089", 1, "2025-03-05"),
+        ]
+    )
+
+
+def test_jsonl_purchase_repo_append_and_reload(temp_path):
+    file_path = temp_path(".jsonl")
+
+    repo = Purchase_rep_jsonl(file_path)
+    _fill(repo)
+    repo.add(Purchase(2, "AIR-089", 2, "2025-03-06"))
+    assert repo.get_count() == 6
+
+    reloaded = Purchase_rep_jsonl(file_path)
+    assert reloaded.get_count() == 6
+    assert reloaded.get_by_id(6).article == "AIR-089"  # type: ignore
+
+
+def test_purchase_repo_supplier_date_range(temp_path):
+    file_path = temp_path(".json")
+
+    repo = Purchase_rep_json(file_path)
+    _fill(repo)
+
+    result = repo.find(supplier_id=1, date_from="2025-01-10", date_to="2025-02-28")
+    assert [p.purchase_id for p in result] == [1, 4, 3]
+
+    by_article = repo.find(article="FLT-001", date_to=date(2025, 1, 11))
+    assert [p.purchase_id for p in by_article] == [1, 4]
+
+
+def test_purchase_repo_keyset_paging(temp_path):
+    file_path = temp_path(".json")
+
+    repo = Purchase_rep_json(file_path)
+    _fill(repo)
+
+    pages = []
+    after = None
+    while True:
+        page = repo.find(supplier_id=1, after=after, limit=2)
+        if not page:
+            break
+        pages.append([p.purchase_id for p in page])
+        after = (page[-1].purchase_date, page[-1].purchase_id)
+
+    assert pages == [[1, 4], [3, 5]]
+
+
+def test_purchase_repo_remove_by_id(temp_path):
+    file_path = temp_path(".json")
+
+    repo = Purchase_rep_json(file_path)
+    _fill(repo)
+
+    repo.remove_by_id(4)
+    assert repo.get_by_id(4) is None
+    assert [p.purchase_id for p in repo.find(article="FLT-001")] == [1, 2]
+
+    with pytest.raises(ValueError):
+        repo.remove_by_id(4)
+
+
+def test_jsonl_purchase_repo_remove_appends_tombstone(temp_path):
+    file_path = temp_path(".jsonl")
+
+    repo = Purchase_rep_jsonl(file_path)
+    _fill(repo)
+    repo.remove_by_id(2)
+    with open(file_path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    # история не перезаписана: дописана только отметка удаления
+    assert len(lines) == 6 and lines[-1] == '{"deleted": 2}'
+
+    reloaded = Purchase_rep_jsonl(file_path)
+    assert [p.purchase_id for p in reloaded.find(article="FLT-001")] == [1, 4]
+
+    # отметок стало бы больше, чем записей, — файл сжимается
+    for purchase_id in (1, 3):
+        reloaded.remove_by_id(purchase_id)
+    with open(file_path, encoding="utf-8") as f:
+        assert len(f.read().splitlines()) == 2
+    reloaded.remove_by_id(4)
+    assert [p.purchase_id for p in Purchase_rep_jsonl(file_path).get_all()] == [5]
+
+
+def test_find_after_id_filtered_cursor_pages(temp_path):
+    repo = Purchase_rep_json(temp_path(".json"))
+    _fill(repo)
+    repo.remove_by_id(4)
+    repo.add(Purchase(1, "FLT-001", 2, "2025-01-11"))
+
+    def pages(limit, **filters):
+        ids, after = [], 0
+        while True:
+            page = repo.find_after_id(after, limit, **filters)
+            ids.extend(p.purchase_id for p in page)
+            if len(page) < limit:
+                return ids
+            after = page[-1].purchase_id
+
+    assert pages(1, supplier_id=1) == [1, 3, 5, 6]
+    assert pages(2, supplier_id=1, date_to="2025-02-01") == [1, 3, 6]
+    assert pages(1, date_from=date(2025, 1, 11), date_to="2025-01-31") == [2, 6]
+    assert pages(10, supplier_id=3) == []
+    page = repo.find_after_id(3, 10, supplier_id=1, date_from="2025-01-01")
+    assert [p.purchase_id for p in page] == [5, 6]
@@ -0,0 +1,83 @@
+import pytest
+
+from controllers.report_controller import ReportController
+from modules.aggregates import SpendAggregates
+from modules.models.detail import Detail
+from modules.models.purchase import Purchase
+from modules.models.supplier import Supplier
+from modules.prices import PriceCache
+from modules.ranking import SupplierTotal, TopN, top_suppliers
+from modules.repositories import Detail_rep_json, Purchase_rep_jsonl, Supplier_rep_json
+from modules.rollups import PurchaseRollups
+
+
+def test_top_n_keeps_best_with_stable_ties():
+    top = TopN(2)
+    for supplier_id, spend in [(1, 100), (2, 300), (3, 300), (4, 50)]:
+        top.push(SupplierTotal(supplier_id, spend, 1, 1))
+    assert [t.supplier_id for t in top.items()] == [2, 3]
+    with pytest.raises(ValueError):
+        TopN(0)
+
+
+def test_top_suppliers_rollups_and_raw_agree(temp_path):
+    details_path = temp_path(".json")
+    purchases_path = temp_path(".jsonl")
+    details = Detail_rep_json(details_path)
+    details.add_many([Detail("FLT-001", "Фильтр", 10), Detail("BRK-045", "Колодки", 1)])
+    purchases = Purchase_rep_jsonl(purchases_path)
+    purchases.add_many(
+        [
+            Purchase(1, "FLT-001", 2, "2025-01-06"),
+            Purchase(2, "BRK-045", 50, "2025-01-08"),
+            Purchase(3, "FLT-001", 3, "2025-01-31"),
+            Purchase(3, "FLT-001", 9, "2025-02-03"),
+            Purchase(1, "BRK-045", 1, "2025-02-10"),
+        ]
+    )
+    prices = PriceCache(details)
+    rollups = PurchaseRollups(details)
+    rollups.refresh(purchases)
+
+    # закупка после отметки: корзины ещё не обновлены, итоги те же
+    purchases.add(Purchase(1, "FLT-001", 30, "2025-01-20"))
+    for period in [(None, None), ("2025-01-01", "2025-01-31"), ("2025-01-07", None)]:
+        raw = top_suppliers(2, purchases, prices, None, *period)
+        assert top_suppliers(2, purchases, prices, rollups, *period) == raw
+    assert top_suppliers(1, purchases, prices, rollups)[0].supplier_id == 1
+    purchases.remove_by_id(6)
+
+    assert top_suppliers(3, purchases, prices, None, "2025-01-01", "2025-01-31") == [
+        SupplierTotal(2, 5000, 1, 50),
+        SupplierTotal(3, 3000, 1, 3),
+        SupplierTotal(1, 2000, 1, 2),
+    ]
+
+
+def test_report_controller_top_suppliers(temp_path):
+    paths = [temp_path(s) for s in (".json", ".jsonl", ".json")]
+    details = Detail_rep_json(paths[0])
+    details.add(Detail("FLT-001", "Фильтр", "2.50"))
+    purchases = Purchase_rep_jsonl(paths[1])
+    suppliers = Supplier_rep_json(paths[2])
+    suppliers.add(Supplier(name="Поставщик 1", phone="+71234567890", address="Москва"))
+    suppliers.add(Supplier(name="Поставщик 2", phone="+70987654321", address="СПб"))
+    purchases.add_many(
+        [
+            Purchase(1, "FLT-001", 2, "2025-01-06"),
+            Purchase(2, "FLT-001", 4, "2025-01-07"),
+            Purchase(3, "FLT-001", 9, "2025-01-08"),  # поставщика нет
+        ]
+    )
+    controller = ReportController(
+        SpendAggregates(details), PurchaseRollups(details), purchases, suppliers
+    )
+
+    result = controller.get_top_suppliers(n=1)
+    assert result["success"] and result["items"] == []
+
+    result = controller.get_top_suppliers(n=3)
+    assert [item["rank"] for item in result["items"]] == [1, 2]
+    item = result["items"][0]
+    assert item["supplier"].name == "Поставщик 2"
+    assert item["total"] == "10.00"
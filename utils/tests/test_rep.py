@@ -313,3 +313,18 @@ def test_yaml_repo_invalid_id_error():
         pass
 
     os.unlink(file_path)
+
+
+def test_json_repo_iter_rows_in_batches():
+    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
+        file_path = f.name
+
+    repo = Supplier_rep_json(file_path)
+    for i in range(5):
+        repo.add(Supplier(name=f"Поставщик {i}", phone=f"+7{i:010d}"))
+
+    rows = list(repo.iter_rows(batch_size=2))
+    assert [row[0] for row in rows] == [1, 2, 3, 4, 5]
+    assert rows[0][1:3] == ("Поставщик 0", "+70000000000")
+
+    os.unlink(file_path)
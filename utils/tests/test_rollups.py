@@ -0,0 +1,126 @@
+from datetime import date
+
+from modules.models.detail import Detail
+from modules.models.purchase import Purchase
+from modules.repositories import (
+    Detail_rep_json,
+    Purchase_rep_jsonl,
+    PurchaseRepObservable,
+)
+from modules.rollups import PurchaseRollups, bucket_end, bucket_start
+
+
+def _repos(temp_path):
+    details_path = temp_path(".json")
+    purchases_path = temp_path(".jsonl")
+    details = Detail_rep_json(details_path)
+    details.add_many([Detail("FLT-001", "Фильтр", 10), Detail("BRK-045", "Колодки", 1)])
+    purchases = PurchaseRepObservable(Purchase_rep_jsonl(purchases_path))
+    return details, purchases
+
+
+def test_bucket_bounds():
+    d = date(2025, 2, 13)  # четверг
+    assert bucket_start(d, "day") == d
+    assert bucket_start(d, "week") == date(2025, 2, 10)
+    assert bucket_end(date(2025, 2, 10), "week") == date(2025, 2, 16)
+    assert bucket_start(d, "month") == date(2025, 2, 1)
+    assert bucket_end(date(2025, 2, 1), "month") == date(2025, 2, 28)
+
+
+def test_rollups_refresh_incrementally_by_high_water_mark(temp_path):
+    details, purchases = _repos(temp_path)
+    rollups = PurchaseRollups(details)
+    purchases.attach(rollups)
+
+    purchases.add_many(
+        [
+            Purchase(1, "FLT-001", 2, "2025-01-06"),
+            Purchase(1, "BRK-045", 5, "2025-01-08"),
+            Purchase(1, "FLT-001", 1, "2025-02-03"),
+            Purchase(2, "FLT-001", 3, "2025-01-06"),
+        ]
+    )
+    assert rollups.refresh(purchases.repository) == {"recomputed": 0, "added": 4}
+    assert rollups.hwm_id == 4
+    assert rollups.hwm_date == date(2025, 2, 3)
+
+    assert rollups.series(1, "month") == [
+        {"bucket": "2025-01-01", "count": 2, "units": 7, "total": "25.00"},
+        {"bucket": "2025-02-01", "count": 1, "units": 1, "total": "10.00"},
+    ]
+    assert [r["bucket"] for r in rollups.series(1, "week", "2025-01-07")] == [
+        "2025-01-06",
+        "2025-02-03",
+    ]
+
+    # Новая закупка видна только после refresh или при подмешивании сырых данных
+    purchases.add(Purchase(1, "FLT-001", 4, "2025-02-04"))
+    assert rollups.series(1, "month")[-1]["units"] == 1
+    recent = rollups.series(1, "month", recent_repository=purchases.repository)
+    assert recent[-1]["units"] == 5
+
+    # Удаление учтённой закупки пересчитывает только её корзины
+    purchases.remove_by_id(2)
+    assert rollups.refresh(purchases.repository) == {"recomputed": 3, "added": 1}
+    assert rollups.series(1, "month") == [
+        {"bucket": "2025-01-01", "count": 1, "units": 2, "total": "20.00"},
+        {"bucket": "2025-02-01", "count": 2, "units": 5, "total": "50.00"},
+    ]
+    assert rollups.series(1, "day", "2025-01-08", "2025-01-08") == []
+
+
+def test_rollups_state_roundtrip(temp_path):
+    details, purchases = _repos(temp_path)
+    purchases.add_many(
+        [
+            Purchase(1, "FLT-001", 2, "2025-01-06"),
+            Purchase(2, "BRK-045", 5, "2025-03-08"),
+        ]
+    )
+    rollups = PurchaseRollups(details)
+    assert rollups.rebuild(purchases.repository) == 2
+
+    state_path = temp_path(".json")
+    rollups.save(state_path)
+    restored = PurchaseRollups(details)
+    restored.load(state_path)
+
+    assert restored.hwm_id == 2
+    for granularity in ("day", "week", "month"):
+        assert restored.series(2, granularity) == rollups.series(2, granularity)
+    assert restored.refresh(purchases.repository)["added"] == 0
+
+
+def test_rollups_late_commit_and_paged_recent(temp_path):
+    details, purchases = _repos(temp_path)
+    rollups = PurchaseRollups(details)
+    purchases.add_many(
+        [
+            Purchase(1, "FLT-001", 1, "2025-01-06"),
+            Purchase(2, "FLT-001", 1, "2025-01-07"),
+            Purchase(1, "FLT-001", 1, "2025-01-08"),
+        ]
+    )
+    # закупка 2 «ещё не зафиксирована»: refresh видит только 1 и 3
+    late = purchases.repository.get_by_id(2)
+    purchases.remove_by_id(2)
+    assert rollups.refresh(purchases.repository)["added"] == 2
+    assert rollups.hwm_id == 3
+
+    # id 2 становится видимым после отметки (поздняя фиксация транзакции)
+    purchases.repository._index_record(late.to_dict())  # type: ignore
+    purchases.add(Purchase(2, "FLT-001", 1, "2025-01-09"))
+    recent = rollups.series(
+        2, "day", "2025-01-07", "2025-01-07", recent_repository=purchases.repository
+    )
+    assert [r["bucket"] for r in recent] == ["2025-01-07"]
+    assert rollups.refresh(purchases.repository)["added"] == 2
+    assert [r["count"] for r in rollups.series(2, "month")] == [2]
+    assert rollups.refresh(purchases.repository)["added"] == 0
+
+    state = temp_path(".json")
+    rollups.save(state)
+    restored = PurchaseRollups(details)
+    restored.load(state)
+    assert restored.series(2, "month") == rollups.series(2, "month")
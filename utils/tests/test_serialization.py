@@ -0,0 +1,54 @@
+import json
+from datetime import date
+from decimal import Decimal
+
+from modules.models.detail import Detail
+from modules.models.mini_cache import MiniCache
+from modules.models.purchase import Purchase
+from modules.models.supplier import Supplier
+from modules.models.supplier_mini import SupplierMini
+from modules.serialization import dumps, dumps_rows
+
+
+def test_dumps_models_match_to_dict():
+    s = Supplier(1, "Поставщик", "+71234567890", None)
+    p = Purchase(5, "FLT-001", 10, "2025-01-15")
+    data = json.loads(dumps({"items": [s], "purchase": p}))
+    assert data["items"] == [s.to_dict(1)]
+    assert data["purchase"] == p.to_dict()
+
+
+def test_dumps_mini_list_fast_path():
+    cache = MiniCache()
+    items = [cache.supplier(i, f"Имя {i}") for i in range(1, 4)]
+    items.append(SupplierMini(4, "Обычный"))
+    data = json.loads(dumps(items))
+    assert [d["supplier_id"] for d in data] == [1, 2, 3, 4]
+    assert data[0]["name"] == "Имя 1"
+
+
+def test_dumps_decimal_is_exact():
+    raw = dumps([Detail("FLT-001", "Фильтр", "0.10"), Decimal("12345678.91")])
+    # цена — строка, как в Detail.to_json_dict
+    assert b'"price":"0.10"' in raw
+    assert json.loads(raw)[0] == Detail("FLT-001", "Фильтр", "0.10").to_json_dict()
+    assert raw.endswith(b"12345678.91]")
+
+
+def test_dumps_keys_and_non_finite_like_json():
+    data = {True: 1, None: 2, 3: "x", 1.5: [], "ключ": 0.1}
+    assert (
+        dumps(data)
+        == json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+    )
+    for value in (float("nan"), float("inf"), Decimal("NaN")):
+        try:
+            dumps([value])
+        except ValueError:
+            continue
+        raise AssertionError(f"{value} сериализован")
+
+
+def test_dumps_rows():
+    raw = dumps_rows(["id", "day", "note"], [(1, date(2025, 1, 2), 'a"b')])
+    assert json.loads(raw) == [{"id": 1, "day": "2025-01-02", "note": 'a"b'}]
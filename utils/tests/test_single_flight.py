@@ -0,0 +1,69 @@
+import threading
+import time
+
+import pytest
+
+from modules.single_flight import SingleFlight
+
+
+def _run_concurrently(flight, key, fn, count):
+    """Запустить count вызовов; вернуть результаты и исключения"""
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(flight.do(key, fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def test_single_flight_shares_one_computation():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        release.wait(2)
+        return "страница"
+
+    threads, results, errors = _run_concurrently(flight, "k", compute, 8)
+    while flight.stats()["shared"] + flight.stats()["executed"] < 8:
+        pass
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["страница"] * 8 and not errors
+    assert len(calls) == 1
+    assert flight.stats() == {"in_flight": 0, "executed": 1, "shared": 7}
+    # после завершения вычисление выполняется заново
+    assert flight.do("k", lambda: "новая") == "новая"
+
+
+def test_single_flight_propagates_errors_and_times_out():
+    flight = SingleFlight(timeout=0.05)
+    release = threading.Event()
+
+    def failing():
+        release.wait(2)
+        raise ValueError("БД недоступна")
+
+    threads, _, errors = _run_concurrently(flight, "k", failing, 3)
+    while flight.stats()["shared"] < 2:
+        pass
+    time.sleep(0.2)  # ожидающие не дождались ведущего
+    release.set()
+    for thread in threads:
+        thread.join()
+    names = sorted(type(e).__name__ for e in errors)
+    assert names == ["TimeoutError", "TimeoutError", "ValueError"]
+
+    with pytest.raises(KeyError):
+        flight.do("k", lambda: {}["нет"])
+    assert flight.stats()["in_flight"] == 0
@@ -0,0 +1,54 @@
+from modules.invalidation_bus import Invalidation
+from modules.models.supplier import Supplier
+from modules.sse import RESYNC, SSEBroker
+
+
+def _supplier(supplier_id: int) -> Supplier:
+    return Supplier(
+        name="Поставщик",
+        phone="+71234567890",
+        address="Москва",
+        supplier_id=supplier_id,
+    )
+
+
+def test_broker_sends_small_row_patches():
+    broker = SSEBroker()
+    stream = broker.stream(heartbeat=0.01)
+    assert broker.client_count == 0  # подписка — только при чтении потока
+    assert next(stream) == b"retry: 3000\n\n"
+    assert broker.client_count == 1
+
+    broker.update_batch(
+        [
+            ("item_updated", _supplier(7)),
+            ("item_deleted", 8),
+            ("item_updated", Invalidation("supplier", 9)),
+        ]
+    )
+    assert (
+        next(stream)
+        == (
+            'event: item_updated\nid: 1\ndata: {"supplier_id":7,"name":"Поставщик"}\n\n'
+        ).encode()
+    )
+    assert next(stream) == b'event: item_deleted\nid: 2\ndata: {"supplier_id":8}\n\n'
+    assert next(stream) == (
+        b"event: item_changed\nid: 3\n"
+        b'data: {"supplier_id":9,"event":"item_updated"}\n\n'
+    )
+    assert next(stream) == b": ping\n\n"
+
+    stream.close()
+    assert broker.client_count == 0
+
+
+def test_slow_client_gets_resync():
+    broker = SSEBroker(client_queue_size=2)
+    client = broker.subscribe()
+    for supplier_id in range(3):
+        broker.update("item_deleted", supplier_id)
+
+    assert client.queue.get_nowait() == RESYNC
+    assert client.queue.empty()
+    assert client.resyncs == 1
@@ -0,0 +1,156 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import app as web
+from modules.invalidation_bus import Invalidation
+from modules.page_cache import DataVersion, PageCache
+from modules.repositories import SupplierRepCached
+from modules.stale import StaleWhileRevalidate, degraded_reason, reset_degraded
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class SlowRepo:
+    """Репозиторий, чтение которого ждёт сигнала release"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.release.set()
+        self.value = "v1"
+
+    def get_by_id(self, supplier_id):
+        self.release.wait(2)
+        return self.value
+
+
+def _settle(flight):
+    """Дождаться завершения фоновых обновлений"""
+    while flight.stats()["in_flight"]:
+        time.sleep(0.01)
+    time.sleep(0.05)  # колбэк сохранения выполняется после _forget
+
+
+def _stale(executor, max_stale=60.0):
+    return StaleWhileRevalidate(executor, soft_timeout=0.05, max_stale=max_stale)
+
+
+def test_page_cache_serves_stale_while_db_is_slow():
+    version = DataVersion()
+    clock = FakeClock()
+    release = threading.Event()
+    with ThreadPoolExecutor(2) as executor:
+        stale = _stale(executor)
+        cache = PageCache(version, stale=stale, clock=clock)
+        assert cache.get_or_compute("p1", lambda: {"success": True, "v": 1})["v"] == 1
+
+        def slow():
+            release.wait(2)
+            return {"success": True, "v": 2}
+
+        reset_degraded()
+        version.bump()
+        assert cache.get_or_compute("p1", slow)["v"] == 1  # устаревшая
+        assert degraded_reason() == "stale"
+
+        release.set()  # фоновое обновление завершается и попадает в кэш
+        _settle(cache.flight)
+        reset_degraded()
+        assert cache.get_or_compute("p1", slow)["v"] == 2
+        assert degraded_reason() is None
+
+        # ошибка БД — тоже устаревшая страница; слишком старая — ошибка
+        version.bump()
+        failed = {"success": False}
+
+        def ok(result):
+            return result["success"]
+
+        assert cache.get_or_compute("p1", lambda: failed, ok)["v"] == 2
+        clock.now = 61
+        assert cache.get_or_compute("p1", lambda: failed, ok) is failed
+    assert stale.stats()["served_stale"] == 2
+
+
+def test_page_cache_read_your_writes_inline_miss_and_bounded_refresh():
+    version = DataVersion()
+    with ThreadPoolExecutor(1) as executor:
+        stale = StaleWhileRevalidate(
+            executor, soft_timeout=0.05, max_stale=60.0, max_pending=1
+        )
+        cache = PageCache(version, stale=stale)
+        # промах без устаревшей записи выполняется в потоке запроса
+        threads = []
+        for key in ("p1", "p2"):
+            cache.get_or_compute(
+                key, lambda: threads.append(threading.current_thread())
+            )
+        assert threads == [threading.main_thread()] * 2
+
+        # своё изменение: старая страница не отдаётся даже при медленной БД
+        version.update("item_updated", object())
+        release = threading.Timer(0.2, lambda: None)
+        release.start()
+
+        def slow():
+            release.join()
+            return "fresh"
+
+        reset_degraded()
+        assert cache.get_or_compute("p1", slow) == "fresh"
+        assert degraded_reason() is None
+        assert cache.get_or_compute("p2", lambda: "p2-old") == "p2-old"
+
+        # изменение другого процесса: устаревшая страница допустима;
+        # второе фоновое обновление сверх max_pending не запускается
+        gate = threading.Event()
+        version.update("item_updated", Invalidation("supplier", 1))
+        assert cache.get_or_compute("p1", lambda: gate.wait(2)) == "fresh"
+        assert cache.get_or_compute("p2", lambda: "p2-new") == "p2-old"
+        assert stale.stats()["skipped_refreshes"] == 1
+        gate.set()
+
+
+def test_cached_repo_serves_expired_entry_while_db_is_slow():
+    repo = SlowRepo()
+    clock = FakeClock()
+    with ThreadPoolExecutor(1) as executor:
+        cached = SupplierRepCached(repo, ttl=10, clock=clock, stale=_stale(executor))
+        assert cached.get_by_id(1) == "v1"
+
+        repo.value = "v2"
+        repo.release.clear()
+        clock.now = 11
+        reset_degraded()
+        assert cached.get_by_id(1) == "v1"
+        assert degraded_reason() == "stale"
+        repo.release.set()
+        _settle(cached.flight)
+        assert cached.get_by_id(1) == "v2"
+
+        # после инвалидации (своё изменение) устаревшая запись не отдаётся
+        cached.invalidate(1)
+        repo.value = "v3"
+        assert cached.get_by_id(1) == "v3"
+
+
+def test_degraded_response_header_drops_validators():
+    application = web.create_app({"TESTING": True, "INIT_RESOURCES": False})
+    with application.test_request_context():
+        web.reset_degraded_mark()
+        response = web.json_response({"success": True})
+        response.headers["ETag"] = '"x"'
+        assert "X-Degraded" not in web.mark_degraded_response(response).headers
+
+        stale = StaleWhileRevalidate(None, 0, 0)  # type: ignore
+        stale._serve_stale(None)
+        response = web.mark_degraded_response(response)
+        assert response.headers["X-Degraded"] == "stale"
+        assert response.headers["Cache-Control"] == "no-store"
+        assert "ETag" not in response.headers
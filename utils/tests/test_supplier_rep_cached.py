@@ -0,0 +1,102 @@
+import os
+import tempfile
+
+from controllers.supplier_controller import SupplierController
+from modules.invalidation_bus import Invalidation
+from modules.models.supplier import Supplier
+from modules.repositories import (
+    Supplier_rep_json,
+    SupplierRepCached,
+    SupplierRepObservable,
+)
+
+
+class CountingRepo(Supplier_rep_json):
+    def __init__(self, file_path):
+        super().__init__(file_path)
+        self.reads = 0
+
+    def get_by_id(self, supplier_id):
+        self.reads += 1
+        return super().get_by_id(supplier_id)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _repo():
+    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
+        file_path = f.name
+    repo = CountingRepo(file_path)
+    repo.add(Supplier(name="Поставщик 1", phone="+71234567890", address="Москва"))
+    repo.add(Supplier(name="Поставщик 2", phone="+70987654321", address="СПб"))
+    return repo, file_path
+
+
+def test_cached_get_by_id_lru_and_ttl():
+    repo, file_path = _repo()
+    clock = FakeClock()
+    cached = SupplierRepCached(repo, maxsize=1, ttl=10, clock=clock)
+
+    assert cached.get_by_id(1).name == "Поставщик 1"  # type: ignore
+    cached.get_by_id(1).name = "Изменено"  # type: ignore # копия, кэш не портится
+    assert cached.get_by_id(1).name == "Поставщик 1"  # type: ignore
+    assert repo.reads == 1
+
+    assert cached.get_by_id(99) is None
+    assert cached.get_by_id(1) is not None  # вытеснен поставщиком 99
+    assert repo.reads == 3
+
+    clock.now = 11
+    cached.get_by_id(1)
+    stats = cached.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 4)
+    assert (stats["evictions"], stats["expirations"]) == (2, 1)
+
+    os.unlink(file_path)
+
+
+def test_cached_invalidation_on_writes_and_events():
+    repo, file_path = _repo()
+    cached = SupplierRepCached(repo)
+    observable = SupplierRepObservable(cached)
+
+    observable.get_by_id(2)
+    observable.replace_by_id(
+        2, Supplier(name="Новое имя", phone="+70987654321", address="СПб")
+    )
+    assert observable.get_by_id(2).name == "Новое имя"  # type: ignore
+
+    cached.update("item_updated", Invalidation("supplier", 2))
+    cached.update("item_selected", 1)
+    observable.get_by_id(2)
+    assert repo.reads == 3
+    assert cached.stats()["invalidations"] == 2
+
+    # Контроллер списка находит исходный репозиторий под обёртками
+    page = SupplierController(observable).get_suppliers_page(1, 10)
+    assert page["success"] and page["total_count"] == 2
+
+    os.unlink(file_path)
+
+
+def test_cached_get_many_batches_misses():
+    repo, file_path = _repo()
+    batches = []
+    get_many = repo.get_many
+    repo.get_many = lambda ids: batches.append(list(ids)) or get_many(ids)  # type: ignore
+    cached = SupplierRepCached(repo)
+
+    cached.get_by_id(2)
+    suppliers = cached.get_many([2, 1, 99, 1])
+    assert [s.supplier_id for s in suppliers] == [2, 1, 1]
+    assert batches == [[1, 99]]  # 2 — из кэша, промахи одним запросом
+
+    assert [s.supplier_id for s in cached.get_many([99, 1])] == [1]
+    assert batches == [[1, 99]] and repo.reads == 1
+    os.unlink(file_path)
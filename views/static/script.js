@@ -11,10 +11,15 @@ let filterField = '';
 let filterValue = '';
 let sortField = 'supplier_id';
 
+// Живые обновления (Server-Sent Events)
+let liveUpdates = null;
+let totalCount = 0;
+
 // Инициализация при загрузке страницы
 document.addEventListener('DOMContentLoaded', function() {
     loadSuppliers(currentPage);
     setupEventListeners();
+    connectLiveUpdates();
 });
 
 /**
@@ -95,6 +100,7 @@ async function loadSuppliers(page) {
         const data = await response.json();
 
         if (data.success) {
+            totalCount = data.total_count;
             displaySuppliers(data.items);
             displayPagination(data.page, data.total_pages);
             
@@ -123,8 +129,15 @@ function displaySuppliers(suppliers) {
         return;
     }
 
-    tableBody.innerHTML = suppliers.map(supplier => `
-        <tr onclick="showDetails(${supplier.supplier_id})">
+    tableBody.innerHTML = suppliers.map(renderSupplierRow).join('');
+}
+
+/**
+ * HTML одной строки таблицы поставщиков
+ */
+function renderSupplierRow(supplier) {
+    return `
+        <tr data-supplier-id="${supplier.supplier_id}" onclick="showDetails(${supplier.supplier_id})">
             <td>${supplier.supplier_id}</td>
             <td>${escapeHtml(supplier.name)}</td>
             <td class="action-buttons">
@@ -139,7 +152,141 @@ function displaySuppliers(suppliers) {
                 </button>
             </td>
         </tr>
-    `).join('');
+    `;
+}
+
+/**
+ * Подписка на живые обновления списка (Server-Sent Events)
+ * Паттерн Observer - сервер пересылает события Subject в браузер,
+ * и таблица правится точечно, без повторной загрузки страницы списка
+ */
+function connectLiveUpdates() {
+    if (!window.EventSource) {
+        return;
+    }
+    liveUpdates = new EventSource('/api/suppliers/stream');
+
+    liveUpdates.addEventListener('item_added', function(event) {
+        onSupplierAdded(JSON.parse(event.data));
+    });
+    liveUpdates.addEventListener('item_updated', function(event) {
+        onSupplierUpdated(JSON.parse(event.data));
+    });
+    liveUpdates.addEventListener('item_deleted', function(event) {
+        onSupplierDeleted(JSON.parse(event.data).supplier_id);
+    });
+    // Изменение из другого процесса сервера: запрашиваем одну строку
+    liveUpdates.addEventListener('item_changed', function(event) {
+        refreshSupplierRow(JSON.parse(event.data).supplier_id);
+    });
+    // Сервер не успел доставить все события - перезагружаем страницу
+    liveUpdates.addEventListener('resync', function() {
+        loadSuppliers(currentPage);
+    });
+}
+
+/**
+ * Подключены ли живые обновления
+ */
+function isLive() {
+    return liveUpdates !== null && liveUpdates.readyState === EventSource.OPEN;
+}
+
+/**
+ * Можно ли править таблицу точечно: при фильтре или сортировке не по ID
+ * изменение может переместить строку, и страницу нужно загрузить заново
+ */
+function canPatchRows() {
+    return !(filterField && filterValue) && sortField === 'supplier_id';
+}
+
+function findSupplierRow(supplierId) {
+    return document.querySelector(`#suppliersTableBody tr[data-supplier-id="${supplierId}"]`);
+}
+
+function updateInfoText() {
+    const shown = document.querySelectorAll('#suppliersTableBody tr[data-supplier-id]').length;
+    document.getElementById('infoText').textContent =
+        `Показано ${shown} из ${totalCount} поставщиков`;
+}
+
+function onSupplierAdded(supplier) {
+    if (!canPatchRows()) {
+        loadSuppliers(currentPage);
+        return;
+    }
+    totalCount += 1;
+    const tableBody = document.getElementById('suppliersTableBody');
+    const rows = tableBody.querySelectorAll('tr[data-supplier-id]');
+    const lastPage = Math.max(1, Math.ceil(totalCount / pageSize));
+    // Новый ID - самый большой, строка попадает в конец последней страницы
+    if (currentPage === lastPage && rows.length < pageSize && !findSupplierRow(supplier.supplier_id)) {
+        if (rows.length === 0) {
+            tableBody.innerHTML = '';
+        }
+        tableBody.insertAdjacentHTML('beforeend', renderSupplierRow(supplier));
+    }
+    displayPagination(currentPage, lastPage);
+    updateInfoText();
+}
+
+function onSupplierUpdated(supplier) {
+    const row = findSupplierRow(supplier.supplier_id);
+    if (!row) {
+        return;
+    }
+    if (!canPatchRows()) {
+        loadSuppliers(currentPage);
+        return;
+    }
+    row.outerHTML = renderSupplierRow(supplier);
+}
+
+function onSupplierDeleted(supplierId) {
+    if (!canPatchRows()) {
+        loadSuppliers(currentPage);
+        return;
+    }
+    totalCount = Math.max(0, totalCount - 1);
+    const row = findSupplierRow(supplierId);
+    const lastPage = Math.max(1, Math.ceil(totalCount / pageSize));
+    const firstRow = document.querySelector('#suppliersTableBody tr[data-supplier-id]');
+    const beforePage = !row && firstRow && supplierId < Number(firstRow.dataset.supplierId);
+    if ((row && currentPage < lastPage) || beforePage) {
+        // Строки сдвигаются: на место удалённой приходит строка другой страницы
+        loadSuppliers(currentPage);
+        return;
+    }
+    if (row) {
+        row.remove();
+    }
+    if (currentPage > lastPage) {
+        changePage(lastPage);
+        return;
+    }
+    displayPagination(currentPage, lastPage);
+    updateInfoText();
+}
+
+/**
+ * Перечитать одну строку (изменение пришло из другого процесса сервера)
+ */
+async function refreshSupplierRow(supplierId) {
+    const row = findSupplierRow(supplierId);
+    if (!row) {
+        return;
+    }
+    try {
+        const response = await fetch(`/api/suppliers/${supplierId}`);
+        const data = await response.json();
+        if (data.success) {
+            onSupplierUpdated(data.supplier);
+        } else {
+            onSupplierDeleted(supplierId);
+        }
+    } catch (error) {
+        console.error('Ошибка обновления строки:', error);
+    }
 }
 
 /**
@@ -315,8 +462,10 @@ async function deleteSupplier(supplierId, supplierName) {
         if (result.success) {
             console.log('[Observer] Поставщик успешно удален:', supplierId);
             
-            // Обновляем список
-            loadSuppliers(currentPage);
+            // Обновляем список (при живых обновлениях строку уберёт SSE)
+            if (!isLive()) {
+                loadSuppliers(currentPage);
+            }
             
             // Показываем уведомление
             showNotification(result.message || 'Поставщик успешно удален!', 'success');
@@ -338,16 +487,20 @@ window.addEventListener('message', function(event) {
     if (event.data && event.data.type === 'supplier_added') {
         console.log('[Observer] Получено уведомление о добавлении поставщика:', event.data.supplier_id);
         
-        // Обновляем текущую страницу после добавления
-        loadSuppliers(currentPage);
+        // Обновляем текущую страницу после добавления (если нет SSE)
+        if (!isLive()) {
+            loadSuppliers(currentPage);
+        }
         
         // Показываем уведомление
         showNotification('Поставщик успешно добавлен!', 'success');
     } else if (event.data && event.data.type === 'supplier_updated') {
         console.log('[Observer] Получено уведомление об обновлении поставщика:', event.data.supplier_id);
         
-        // Обновляем текущую страницу после редактирования
-        loadSuppliers(currentPage);
+        // Обновляем текущую страницу после редактирования (если нет SSE)
+        if (!isLive()) {
+            loadSuppliers(currentPage);
+        }
         
         // Показываем уведомление
         showNotification('Поставщик успешно обновлен!', 'success');
@@ -0,0 +1,12 @@
+"""
+WSGI-точка входа для production-сервера
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Ресурсы (соединение с БД, фоновые потоки, шина инвалидации) создаются
+в каждом воркере после fork — см. init_resources и gunicorn.conf.py.
+"""
+
+from app import create_app
+
+app = create_app()